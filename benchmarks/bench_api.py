@@ -0,0 +1,139 @@
+"""
+Latency percentiles and query counts of the main store endpoints against
+data from `manage.py generate_data`, compared to benchmarks/baseline.json.
+The file is not collected by the regular test run, name it to run it:
+
+    python -m pytest benchmarks/bench_api.py -s
+
+A request making more queries than the baseline fails, whatever the scale.
+Latency is only compared when BENCH_SCALE matches the baseline's scale; a
+median more than BENCH_TOLERANCE (default 1, i.e. twice the baseline) and
+2 ms over the baseline fails. The median is compared rather than the
+tails, which are too noisy on shared machines to gate on. Record a new baseline with BENCH_UPDATE_BASELINE=1, and
+write every run's numbers to a file with BENCH_RESULTS=<path>.
+"""
+import json
+import os
+import statistics
+from pathlib import Path
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework.test import APIClient
+import pytest
+from benchmarks.utils import measure
+
+
+BASELINE = Path(__file__).with_name("baseline.json")
+SCALE = float(os.environ.get("BENCH_SCALE", "0.2"))
+TOLERANCE = float(os.environ.get("BENCH_TOLERANCE", "1"))
+UPDATE_BASELINE = os.environ.get("BENCH_UPDATE_BASELINE") == "1"
+REPEAT = int(os.environ.get("BENCH_REPEAT", "50"))
+
+# name: (path template, who is asking)
+ENDPOINTS = {
+    "products-list": ("/store/products/", None),
+    "products-filtered": ("/store/products/?collection={collection}&ordering=-price", None),
+    "products-search": ("/store/products/?search=coffee", None),
+    "product-detail": ("/store/products/{product}/", None),
+    "product-reviews": ("/store/products/{product}/reviews/", None),
+    "product-images": ("/store/products/{product}/images/", None),
+    "collections-list": ("/store/collections/", None),
+    "collection-detail": ("/store/collections/{collection}/", None),
+    "cart-detail": ("/store/carts/{cart}/", None),
+    "cart-items": ("/store/carts/{cart}/items/", None),
+    "customers-me": ("/store/customers/me/", "customer"),
+    "orders-list": ("/store/orders/", "customer"),
+    "orders-list-admin": ("/store/orders/", "admin"),
+    "customers-list-admin": ("/store/customers/", "admin"),
+    "sales-analytics": ("/store/analytics/sales/?group_by=collection", "admin"),
+}
+
+results = {}
+
+
+def percentile(timings, n):
+    return statistics.quantiles(timings, n=100, method="inclusive")[n - 1] * 1000
+
+
+@pytest.fixture(scope="module")
+def local_cache():
+    # Benchmark the application, not a redis server that may not be running.
+    # Module-scoped, so generate_data already writes to it.
+    with override_settings(CACHES={
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }):
+        yield
+
+
+@pytest.fixture(scope="module")
+def benchmark_data(local_cache, django_db_setup, django_db_blocker):
+    from store.models import Cart, Collection, Customer, Product
+
+    with django_db_blocker.unblock():
+        call_command("generate_data", scale=SCALE, stdout=open(os.devnull, "w"))
+        customer = Customer.objects.filter(order__isnull=False).select_related("user").first()
+        yield {
+            "product": Product.objects.filter(reviews__isnull=False, images__isnull=False).first().pk,
+            "collection": Collection.objects.order_by("-products_count").first().pk,
+            "cart": Cart.objects.filter(items__isnull=False).first().pk,
+            "customer": customer.user,
+        }
+
+    if UPDATE_BASELINE:
+        baseline = {"scale": SCALE, "endpoints": dict(sorted(results.items()))}
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n")
+    if os.environ.get("BENCH_RESULTS"):
+        Path(os.environ["BENCH_RESULTS"]).write_text(json.dumps(results, indent=2) + "\n")
+    for name, row in results.items():
+        print(f"{name:<25} p50 {row['p50_ms']:8.3f} ms  p95 {row['p95_ms']:8.3f} ms"
+              f"  p99 {row['p99_ms']:8.3f} ms  {row['queries']:3} queries")
+
+
+@pytest.fixture(autouse=True)
+def cold_cache(local_cache):
+    cache.clear()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ENDPOINTS)
+def test_endpoint(name, benchmark_data):
+    from core.models import User
+
+    template, who = ENDPOINTS[name]
+    path = template.format(**benchmark_data)
+    client = APIClient()
+    if who == "admin":
+        client.force_authenticate(user=User(is_staff=True))
+    elif who == "customer":
+        client.force_authenticate(user=benchmark_data["customer"])
+
+    # Count the queries of a cold request, before the cache helps out
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(path)
+    assert response.status_code == 200, response.content
+    # Read now, every request resets connection.queries
+    query_count = len(queries)
+    timings = measure(lambda: client.get(path), repeat=REPEAT)
+    results[name] = row = {
+        "p50_ms": round(percentile(timings, 50), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "p99_ms": round(percentile(timings, 99), 3),
+        "queries": query_count,
+    }
+
+    if UPDATE_BASELINE or not BASELINE.exists():
+        return
+    baseline = json.loads(BASELINE.read_text())
+    expected = baseline["endpoints"].get(name)
+    if expected is None:
+        pytest.skip(f"{name} has no baseline yet, run with BENCH_UPDATE_BASELINE=1")
+    assert row["queries"] <= expected["queries"], \
+        f"{name} made {row['queries']} queries, the baseline is {expected['queries']}"
+    if baseline["scale"] == SCALE:
+        limit = max(expected["p50_ms"] * (1 + TOLERANCE), expected["p50_ms"] + 2)
+        assert row["p50_ms"] <= limit, \
+            f"{name} median is {row['p50_ms']} ms, the baseline is {expected['p50_ms']} ms"
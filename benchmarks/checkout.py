@@ -0,0 +1,69 @@
+"""
+Time the whole checkout, CreateOrderSerializer validating and saving an
+order, for carts of 1, 10 and 100 lines, and the queries it runs. Below
+each, reserving the inventory alone: one locked row at a time against the
+single conditional UPDATE in Product.objects.reserve_inventory.
+Everything runs in a transaction that is rolled back at the end.
+
+    python -m benchmarks.checkout
+"""
+from time import perf_counter
+from benchmarks.utils import measure, report, setup_django
+
+setup_django()
+
+from django.db import connection, transaction  # noqa: E402
+from django.db.models import F  # noqa: E402
+from django.test.utils import CaptureQueriesContext  # noqa: E402
+from store.models import Cart, CartItem, Customer, Product  # noqa: E402
+from store.serializers import CreateOrderSerializer  # noqa: E402
+
+
+def reserve_per_line(quantities):
+    for product_id, inventory in Product.objects.select_for_update() \
+            .filter(pk__in=quantities).order_by("pk").values_list("id", "inventory"):
+        if inventory < quantities[product_id]:
+            raise ValueError(product_id)
+        Product.objects.filter(pk=product_id).update(inventory=F("inventory") - quantities[product_id])
+
+
+def check_out(user_id, product_ids):
+    """Fill a new cart with product_ids and check it out; returns the seconds the checkout took."""
+    cart = Cart.objects.create()
+    CartItem.objects.bulk_create(CartItem(cart=cart, product_id=product_id, quantity=1)
+                                 for product_id in product_ids)
+    serializer = CreateOrderSerializer(data={"cart_id": cart.id}, context={"user_id": user_id})
+    start = perf_counter()
+    serializer.is_valid(raise_exception=True)
+    serializer.save()
+    return perf_counter() - start
+
+
+def bench_checkout(user_id, lines, repeat=20, warmup=2):
+    product_ids = list(Product.objects.order_by("id").values_list("id", flat=True)[:lines])
+    if len(product_ids) < lines:
+        raise SystemExit("Not enough products, run `python manage.py seed_db` first.")
+    quantities = {product_id: 1 for product_id in product_ids}
+
+    with transaction.atomic():
+        Product.objects.filter(pk__in=product_ids).update(inventory=F("inventory") + 1_000_000)
+        for _ in range(warmup):
+            check_out(user_id, product_ids)
+        with CaptureQueriesContext(connection) as queries:
+            check_out(user_id, product_ids)
+        # Less the two that fill the cart
+        report(f"checkout of {lines}: {len(queries) - 2} queries",
+               [check_out(user_id, product_ids) for _ in range(repeat)], lines, "lines")
+        report("  reserve only: per line", measure(
+            lambda: reserve_per_line(quantities), repeat=repeat, warmup=warmup), lines, "lines")
+        report("  reserve only: conditional update", measure(
+            lambda: Product.objects.reserve_inventory(quantities), repeat=repeat, warmup=warmup), lines, "lines")
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    user_id = Customer.objects.values_list("user_id", flat=True).first()
+    if user_id is None:
+        raise SystemExit("No customers found, run `python manage.py seed_db` first.")
+    for lines in (1, 10, 100):
+        bench_checkout(user_id, lines)
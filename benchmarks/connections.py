@@ -0,0 +1,45 @@
+"""
+Per-request cost of getting a database connection: a new one for every
+request (CONN_MAX_AGE = 0), a persistent one per thread (CONN_MAX_AGE > 0)
+and one from the core.db.pool pool. Each request runs a single SELECT 1
+and ends the way request_finished ends it.
+
+    python -m benchmarks.connections
+
+Runs against the default database. On MySQL and PostgreSQL a new
+connection includes the TCP and authentication handshake that the other
+two skip.
+"""
+from benchmarks.utils import measure, report, setup_django
+
+setup_django()
+
+from django.db import connections  # noqa: E402
+from core.db.pool import PooledDatabaseWrapperMixin  # noqa: E402
+
+
+def make_wrapper(name, conn_max_age, pooled=False):
+    default = connections["default"]
+    wrapper_class = default.__class__
+    if pooled:
+        wrapper_class = type("DatabaseWrapper", (PooledDatabaseWrapperMixin, wrapper_class), {})
+    return wrapper_class({**default.settings_dict, "CONN_MAX_AGE": conn_max_age}, alias=f"bench-{name}")
+
+
+def request(wrapper):
+    with wrapper.cursor() as cursor:
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+    wrapper.close_if_unusable_or_obsolete()
+
+
+if __name__ == "__main__":
+    for name, wrapper in [
+        ("connect per request", make_wrapper("connect", 0)),
+        ("persistent connection", make_wrapper("persistent", None)),
+        ("pooled connection", make_wrapper("pooled", 0, pooled=True)),
+    ]:
+        report(name, measure(lambda: request(wrapper), repeat=500, warmup=20), unit="requests")
+        if hasattr(wrapper, "pool"):
+            print(f"{'':<50} {wrapper.pool.stats}, p99 wait <= {wrapper.pool.wait_percentile(99)} ms")
+        wrapper.close()
@@ -0,0 +1,68 @@
+"""
+Render and parse representative product and order payloads with the
+stdlib-based JSONRenderer / JSONParser and their orjson counterparts.
+
+    python -m benchmarks.renderers
+"""
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+from benchmarks.utils import measure, report, setup_django
+
+setup_django()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from core.parsers import FastJSONParser  # noqa: E402
+from core.renderers import FastJSONRenderer  # noqa: E402
+
+
+def product(pk):
+    price = Decimal(pk % 9000 + 100) / 100
+    return {
+        "id": pk,
+        "title": f"Product {pk}",
+        "description": "mus vivamus vestibulum sagittis sapien cum sociis natoque penatibus",
+        "price": price,
+        "price_with_tax": price * Decimal("1.1"),
+        "collection": pk % 10 + 1,
+        "inventory": pk % 50,
+        "images": [{"id": pk, "image": f"http://localhost/media/store/images/{pk}.jpg"}],
+    }
+
+
+def order(pk):
+    return {
+        "id": pk,
+        "customer": pk % 100,
+        "placed_at": datetime(2023, 12, 20, 15, 17, pk % 60, 123456, tzinfo=timezone.utc),
+        "payment_status": "P",
+        "items": [
+            {"id": pk * 10 + line, "quantity": line + 1,
+             "unit_price": Decimal("10.05"),
+             "product": {"id": line, "title": f"Product {line}", "price": Decimal("10.05")}}
+            for line in range(5)
+        ],
+    }
+
+
+PAYLOADS = {
+    "product page (10)": {"count": 1000, "next": None, "previous": None,
+                          "results": [product(pk) for pk in range(10)]},
+    "product export (1000)": [product(pk) for pk in range(1000)],
+    "order page (10)": [order(pk) for pk in range(10)],
+    "cart": {"id": uuid4(), "items": [], "total_price": 0},
+}
+
+
+if __name__ == "__main__":
+    for name, data in PAYLOADS.items():
+        for renderer in (JSONRenderer(), FastJSONRenderer()):
+            report(f"render {name}: {type(renderer).__name__}",
+                   measure(lambda: renderer.render(data), repeat=200), unit="calls")
+
+    body = JSONRenderer().render(PAYLOADS["product export (1000)"])
+    for parser in (JSONParser(), FastJSONParser()):
+        report(f"parse product export: {type(parser).__name__}",
+               measure(lambda: parser.parse(io.BytesIO(body)), repeat=200), unit="calls")
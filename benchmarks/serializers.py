@@ -0,0 +1,85 @@
+"""
+Compare the old per-row price_with_tax / total_price computation with the
+SQL annotations and the .values() fast path, on data loaded by
+`python manage.py seed_db`.
+
+    python -m benchmarks.serializers
+"""
+from decimal import Decimal
+from benchmarks.utils import measure, report, setup_django
+
+setup_django()
+
+from django.db import transaction  # noqa: E402
+from django.db.models import Prefetch  # noqa: E402
+from rest_framework import serializers  # noqa: E402
+from store.models import Cart, CartItem, Product  # noqa: E402
+from store.serializers import CartSerializer, ProductSerializer  # noqa: E402
+from store.values_serializers import ProductValuesSerializer  # noqa: E402
+
+
+class LegacyProductSerializer(ProductSerializer):
+    price_with_tax = serializers.SerializerMethodField(read_only=True)
+
+    def get_price_with_tax(self, obj):
+        return obj.price * Decimal(1.1)
+
+
+class LegacyCartSerializer(CartSerializer):
+    total_price = serializers.SerializerMethodField()
+
+    def get_total_price(self, cart):
+        return sum([item.quantity * item.product.price for item in cart.items.all()])
+
+
+def bench_products(page_size=10):
+    pages = Product.objects.count() // page_size
+    if not pages:
+        raise SystemExit("No products found, run `python manage.py seed_db` first.")
+
+    def run(serializer_class, queryset):
+        for page in range(pages):
+            offset = page * page_size
+            serializer_class(queryset.order_by("id")[offset:offset + page_size], many=True).data
+
+    def run_values():
+        serializer = ProductValuesSerializer()
+        rows = serializer.get_rows(Product.objects.with_price_with_tax().order_by("id"))
+        for page in range(pages):
+            offset = page * page_size
+            serializer.serialize(rows[offset:offset + page_size])
+
+    rows = pages * page_size
+    report("products: legacy", measure(
+        lambda: run(LegacyProductSerializer, Product.objects.prefetch_related("images")),
+        repeat=5, warmup=1), rows)
+    report("products: annotated", measure(
+        lambda: run(ProductSerializer,
+                    Product.objects.prefetch_related("images").with_price_with_tax()),
+        repeat=5, warmup=1), rows)
+    report("products: values", measure(run_values, repeat=5, warmup=1), rows)
+
+
+def bench_cart(lines=50):
+    with transaction.atomic():
+        cart = Cart.objects.create()
+        CartItem.objects.bulk_create(
+            CartItem(cart=cart, product_id=product_id, quantity=2)
+            for product_id in Product.objects.values_list("id", flat=True)[:lines])
+
+        legacy = Cart.objects.prefetch_related("items__product")
+        annotated = Cart.objects \
+            .prefetch_related(Prefetch(
+                "items",
+                queryset=CartItem.objects.select_related("product").with_total_price())) \
+            .with_total_price()
+        report(f"cart of {lines}: legacy", measure(
+            lambda: LegacyCartSerializer(legacy.get(pk=cart.pk)).data), lines)
+        report(f"cart of {lines}: annotated", measure(
+            lambda: CartSerializer(annotated.get(pk=cart.pk)).data), lines)
+        transaction.set_rollback(True)
+
+
+if __name__ == "__main__":
+    bench_products()
+    bench_cart()
@@ -0,0 +1,27 @@
+import os
+import statistics
+from time import perf_counter
+
+
+def setup_django():
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "storefront.settings.dev")
+    import django
+    django.setup()
+
+
+def measure(func, repeat=50, warmup=5):
+    for _ in range(warmup):
+        func()
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        timings.append(perf_counter() - start)
+    return timings
+
+
+def report(name, timings, rows=1, unit="rows"):
+    median = statistics.median(timings)
+    print(f"{name:<50} median {median * 1000:8.3f} ms"
+          f"  p95 {sorted(timings)[int(len(timings) * 0.95) - 1] * 1000:8.3f} ms"
+          f"  {rows / median:12.0f} {unit}/s")
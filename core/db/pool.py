@@ -0,0 +1,205 @@
+"""
+An in-process pool of database connections, shared by the threads of the
+process, for backends in core.db.backends. Django closes a connection at
+the end of every request when CONN_MAX_AGE is 0; here closing hands the
+connection back to the pool and the next request skips the connect.
+
+The pool is configured with a POOL entry in the database's settings:
+
+    "POOL": {
+        "SIZE": 10,                     # open connections, idle or in use
+        "TIMEOUT": 5,                   # seconds to wait for one of them
+        "HEALTH_CHECK_INTERVAL": 30,    # check connections idle this long
+        "MAX_LIFETIME": 30 * 60,        # and close those older than this
+    }
+"""
+import threading
+from bisect import bisect_left
+from collections import deque
+from functools import partial
+from time import monotonic, perf_counter
+from django.db.utils import OperationalError
+
+
+DEFAULTS = {
+    "SIZE": 10,
+    "TIMEOUT": 5,
+    "HEALTH_CHECK_INTERVAL": 30,
+    "MAX_LIFETIME": 30 * 60,
+}
+
+# Upper bounds (ms) of the wait time histogram, plus one for everything above
+WAIT_BUCKETS = (0.1, 1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+_local = threading.local()
+
+
+class PoolTimeout(OperationalError):
+    """No connection was free within the pool's TIMEOUT."""
+
+
+def thread_wait():
+    """Seconds this thread spent waiting for pooled connections so far."""
+    return getattr(_local, "wait", 0.0)
+
+
+class ConnectionPool:
+    def __init__(self, size=DEFAULTS["SIZE"], timeout=DEFAULTS["TIMEOUT"],
+                 health_check_interval=DEFAULTS["HEALTH_CHECK_INTERVAL"],
+                 max_lifetime=DEFAULTS["MAX_LIFETIME"]):
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.max_lifetime = max_lifetime
+        # A slot is taken for as long as a connection is checked out, so
+        # new connections are only opened while fewer than size are open
+        self.slots = threading.BoundedSemaphore(size)
+        self.lock = threading.Lock()
+        # (connection, opened at, last used at), most recently used last
+        self.idle = deque()
+        # id(connection): (connection, opened at) of checked out connections;
+        # holding the connection keeps its id from being reused meanwhile
+        self.in_use = {}
+        self.reset_stats()
+
+    def reset_stats(self):
+        with self.lock:
+            self.stats = {"connects": 0, "reuses": 0, "closes": 0, "timeouts": 0}
+            self.waits = [0] * (len(WAIT_BUCKETS) + 1)
+            self.wait_total = 0.0
+
+    def _record_wait(self, seconds):
+        _local.wait = thread_wait() + seconds
+        with self.lock:
+            self.waits[bisect_left(WAIT_BUCKETS, seconds * 1000)] += 1
+            self.wait_total += seconds
+
+    def acquire(self, connect):
+        """A connection from the pool, or a new one from connect()."""
+        started = perf_counter()
+        got_slot = self.slots.acquire(timeout=self.timeout)
+        self._record_wait(perf_counter() - started)
+        if not got_slot:
+            with self.lock:
+                self.stats["timeouts"] += 1
+            raise PoolTimeout(f"No database connection free after {self.timeout}s, "
+                              f"all {self.size} are in use")
+        try:
+            while True:
+                with self.lock:
+                    entry = self.idle.pop() if self.idle else None
+                if entry is None:
+                    return self._open(connect)
+                connection, opened_at, used_at = entry
+                now = monotonic()
+                if now - opened_at >= self.max_lifetime:
+                    self._discard(connection)
+                elif now - used_at >= self.health_check_interval and not self.is_usable(connection):
+                    self._discard(connection)
+                else:
+                    with self.lock:
+                        self.in_use[id(connection)] = (connection, opened_at)
+                        self.stats["reuses"] += 1
+                    return connection
+        except BaseException:
+            self.slots.release()
+            raise
+
+    def release(self, connection, reusable=True):
+        """Hand back a connection from acquire(), closing it unless reusable."""
+        try:
+            with self.lock:
+                checked_out, opened_at = self.in_use.pop(id(connection), (None, None))
+            if reusable and checked_out is connection and monotonic() - opened_at < self.max_lifetime:
+                with self.lock:
+                    self.idle.append((connection, opened_at, monotonic()))
+            else:
+                self._discard(connection)
+        finally:
+            self.slots.release()
+
+    def close_idle(self):
+        with self.lock:
+            idle, self.idle = self.idle, deque()
+        for connection, _, _ in idle:
+            self._discard(connection)
+
+    def wait_percentile(self, p):
+        """Upper bound (ms) of the wait bucket the p-th percentile falls in."""
+        with self.lock:
+            counts = list(self.waits)
+        rank = p / 100 * sum(counts)
+        seen = 0
+        for bound, count in zip(WAIT_BUCKETS + (float("inf"),), counts):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return None
+
+    def is_usable(self, connection):
+        try:
+            cursor = connection.cursor()
+            try:
+                cursor.execute("SELECT 1")
+            finally:
+                cursor.close()
+        except Exception:
+            return False
+        return True
+
+    def _open(self, connect):
+        connection = connect()
+        with self.lock:
+            self.in_use[id(connection)] = (connection, monotonic())
+            self.stats["connects"] += 1
+        return connection
+
+    def _discard(self, connection):
+        with self.lock:
+            self.stats["closes"] += 1
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+def get_pool(alias, settings_dict):
+    with _pools_lock:
+        if alias not in _pools:
+            options = {**DEFAULTS, **settings_dict.get("POOL", {})}
+            _pools[alias] = ConnectionPool(
+                size=options["SIZE"],
+                timeout=options["TIMEOUT"],
+                health_check_interval=options["HEALTH_CHECK_INTERVAL"],
+                max_lifetime=options["MAX_LIFETIME"])
+        return _pools[alias]
+
+
+class PooledDatabaseWrapperMixin:
+    """
+    Mixed into a backend's DatabaseWrapper to take its connections from
+    and give them back to the alias' ConnectionPool. Set CONN_MAX_AGE to 0
+    so connections go back at the end of every request.
+    """
+
+    @property
+    def pool(self):
+        return get_pool(self.alias, self.settings_dict)
+
+    def get_new_connection(self, conn_params):
+        return self.pool.acquire(partial(super().get_new_connection, conn_params))
+
+    def _close(self):
+        if self.connection is None:
+            return
+        # Only a connection in the state a new one starts in is reused:
+        # no transaction open, the default autocommit and no errors since
+        # it was checked out
+        reusable = (not self.in_atomic_block
+                    and self.autocommit == self.settings_dict["AUTOCOMMIT"]
+                    and not self.errors_occurred)
+        with self.wrap_database_errors:
+            self.pool.release(self.connection, reusable)
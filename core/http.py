@@ -0,0 +1,128 @@
+"""
+Outbound HTTP for views: one pooled requests session per process, a
+timeout on every call, concurrent fetches of one URL coalesced into one,
+and a stale-while-revalidate cache in front of JSON GETs.
+"""
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from django.conf import settings
+from django.core.cache import cache
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+logger = logging.getLogger(__name__)
+
+# A refresh that failed is tried again after this many seconds
+REFRESH_LOCK_TIMEOUT = 30
+
+_session = None
+_session_lock = threading.Lock()
+
+_in_flight = {}
+_in_flight_lock = threading.Lock()
+
+# Background refreshes of stale entries, off the request's thread
+refresher = ThreadPoolExecutor(max_workers=2, thread_name_prefix="http-refresh")
+
+
+class UpstreamError(Exception):
+    """An outbound request failed, timed out or did not return JSON."""
+
+
+def get_session():
+    """The process' session, so connections to a host are kept and reused."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _make_session()
+    return _session
+
+
+def _make_session():
+    session = requests.Session()
+    # Retry failing connects, not reads: a read that timed out already took
+    # the whole timeout and the request may have reached the server
+    retries = Retry(total=settings.HTTP_CLIENT_RETRIES, read=0, backoff_factor=0.1)
+    adapter = HTTPAdapter(pool_maxsize=settings.HTTP_CLIENT_POOL_SIZE, max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_json(url, timeout=None):
+    try:
+        response = get_session().get(url, timeout=timeout or settings.HTTP_CLIENT_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+    except (requests.RequestException, ValueError) as exc:
+        raise UpstreamError(f"GET {url} failed: {exc}") from exc
+
+
+def single_flight(key, fetch):
+    """
+    Return fetch(), calling it once for all the threads of the process
+    asking for key at the same time; they get its result or its exception.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+    if not leader:
+        return future.result()
+
+    try:
+        result = fetch()
+    except Exception as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+def _cache_key(url):
+    return f"core:http:{hashlib.md5(url.encode()).hexdigest()}"
+
+
+def _fetch(key, url, fresh_for, stale_for, timeout):
+    data = get_json(url, timeout)
+    cache.set(key, {"data": data, "fetched_at": time.time()}, timeout=fresh_for + stale_for)
+    return data
+
+
+def _refresh(key, url, fresh_for, stale_for, timeout):
+    try:
+        single_flight(key, lambda: _fetch(key, url, fresh_for, stale_for, timeout))
+    except UpstreamError:
+        # The stale copy keeps being served until it expires
+        logger.warning("Could not refresh %s", url, exc_info=True)
+    else:
+        cache.delete(f"{key}:refreshing")
+
+
+def cached_json(url, fresh_for, stale_for, timeout=None):
+    """
+    GET url's JSON through the cache. An entry is fresh for fresh_for
+    seconds, then served stale for up to stale_for more seconds while one
+    worker fetches it again in the background. Only a miss waits on the
+    upstream, raising UpstreamError if that fails.
+    """
+    key = _cache_key(url)
+    entry = cache.get(key)
+    if entry is not None:
+        stale = time.time() - entry["fetched_at"] >= fresh_for
+        # The lock lets one refresh through across all the workers
+        if stale and cache.add(f"{key}:refreshing", 1, timeout=REFRESH_LOCK_TIMEOUT):
+            refresher.submit(_refresh, key, url, fresh_for, stale_for, timeout)
+        return entry["data"]
+    return single_flight(key, lambda: _fetch(key, url, fresh_for, stale_for, timeout))
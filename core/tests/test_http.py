@@ -0,0 +1,179 @@
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from django.core.cache import cache
+from core import http
+from core.http import UpstreamError, cached_json, get_json, get_session, single_flight
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Stands in for httpbin: /json, /slow (0.2s), /hang (1s) and /error (500)."""
+    hits = Counter()
+    fail = False
+
+    def do_GET(self):
+        self.hits[self.path] += 1
+        if self.path == "/slow":
+            time.sleep(0.2)
+        elif self.path == "/hang":
+            time.sleep(1)
+        if self.path == "/error" or self.fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path, "hits": self.hits[self.path]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        try:
+            self.wfile.write(body)
+        except BrokenPipeError:
+            pass  # The client timed out
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def upstream():
+    StubHandler.hits.clear()
+    StubHandler.fail = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    cache.clear()
+
+
+def wait_for(condition, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.01)
+
+
+class TestGetJson:
+    def test_if_upstream_answers_return_json(self, upstream):
+        assert get_json(f"{upstream}/json") == {"path": "/json", "hits": 1}
+
+    def test_session_is_shared(self):
+        assert get_session() is get_session()
+
+    def test_if_upstream_fails_raise_upstream_error(self, upstream):
+        with pytest.raises(UpstreamError):
+            get_json(f"{upstream}/error")
+
+    def test_if_upstream_is_slow_raise_upstream_error_after_timeout(self, upstream):
+        started = time.monotonic()
+
+        with pytest.raises(UpstreamError):
+            get_json(f"{upstream}/hang", timeout=(1, 0.1))
+
+        assert time.monotonic() - started < 0.8
+
+    def test_if_nobody_listens_raise_upstream_error(self):
+        with pytest.raises(UpstreamError):
+            get_json("http://127.0.0.1:9/")
+
+
+class TestSingleFlight:
+    def test_if_calls_overlap_fetch_once(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return "result"
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: single_flight("key", fetch), range(8)))
+
+        assert results == ["result"] * 8
+        assert len(calls) == 1
+
+    def test_if_fetch_fails_raise_and_forget_key(self):
+        def fetch():
+            raise UpstreamError
+
+        with pytest.raises(UpstreamError):
+            single_flight("key", fetch)
+
+        assert single_flight("key", lambda: "result") == "result"
+
+
+class TestCachedJson:
+    def test_if_entry_is_fresh_do_not_call_upstream(self, upstream):
+        url = f"{upstream}/json"
+        cached_json(url, fresh_for=60, stale_for=60)
+
+        data = cached_json(url, fresh_for=60, stale_for=60)
+
+        assert data == {"path": "/json", "hits": 1}
+        assert StubHandler.hits["/json"] == 1
+
+    def test_if_misses_overlap_call_upstream_once(self, upstream):
+        url = f"{upstream}/slow"
+
+        with ThreadPoolExecutor(8) as pool:
+            results = list(pool.map(lambda _: cached_json(url, 60, 60), range(8)))
+
+        assert all(data == results[0] for data in results)
+        assert StubHandler.hits["/slow"] == 1
+
+    def test_if_entry_is_stale_return_it_and_refresh_once(self, upstream):
+        url = f"{upstream}/json"
+        cached_json(url, fresh_for=0, stale_for=60)
+
+        stale = [cached_json(url, fresh_for=0, stale_for=60) for _ in range(3)]
+
+        assert stale == [{"path": "/json", "hits": 1}] * 3
+        wait_for(lambda: cache.get(http._cache_key(url))["data"]["hits"] == 2)
+        assert StubHandler.hits["/json"] == 2
+
+    def test_if_refresh_fails_keep_serving_stale_entry(self, upstream):
+        url = f"{upstream}/json"
+        cached_json(url, fresh_for=0, stale_for=60)
+        StubHandler.fail = True
+
+        data = cached_json(url, fresh_for=0, stale_for=60)
+        wait_for(lambda: StubHandler.hits["/json"] == 2)
+
+        assert data == {"path": "/json", "hits": 1}
+        assert cached_json(url, fresh_for=0, stale_for=60) == data
+
+    def test_if_miss_fails_raise_upstream_error(self, upstream):
+        with pytest.raises(UpstreamError):
+            cached_json(f"{upstream}/error", fresh_for=60, stale_for=60)
+
+
+class TestIndex:
+    def test_if_upstream_answers_return_200(self, client, settings, upstream):
+        settings.PLAYGROUND_UPSTREAM_URL = f"{upstream}/json"
+
+        response = client.get("/playground/index/")
+
+        assert response.status_code == 200
+        assert b"Hello" in response.content
+
+    def test_if_upstream_fails_return_502(self, client, settings, upstream):
+        settings.PLAYGROUND_UPSTREAM_URL = f"{upstream}/error"
+
+        response = client.get("/playground/index/")
+
+        assert response.status_code == 502
@@ -0,0 +1,152 @@
+import threading
+import pytest
+from django.db import connection
+from django.db.backends.sqlite3 import base
+from core.db import pool
+from core.db.pool import ConnectionPool, PooledDatabaseWrapperMixin, PoolTimeout, thread_wait
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.broken = False
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def close(self):
+        self.closed = True
+
+
+class FakeCursor:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def execute(self, sql):
+        if self.connection.broken:
+            raise OSError("server has gone away")
+
+    def close(self):
+        pass
+
+
+class TestConnectionPool:
+    def test_if_connection_was_released_reuse_it(self):
+        connections = ConnectionPool(size=2)
+        first = connections.acquire(FakeConnection)
+        connections.release(first)
+
+        second = connections.acquire(FakeConnection)
+
+        assert second is first
+        assert connections.stats["connects"] == 1
+        assert connections.stats["reuses"] == 1
+
+    def test_if_pool_is_exhausted_raise_pool_timeout(self):
+        connections = ConnectionPool(size=1, timeout=0.05)
+        connections.acquire(FakeConnection)
+
+        with pytest.raises(PoolTimeout):
+            connections.acquire(FakeConnection)
+
+        assert connections.stats["timeouts"] == 1
+        assert connections.wait_percentile(100) >= 50
+
+    def test_if_connection_is_released_while_waiting_hand_it_over(self):
+        connections = ConnectionPool(size=1, timeout=1)
+        first = connections.acquire(FakeConnection)
+        threading.Timer(0.05, connections.release, [first]).start()
+        waited = thread_wait()
+
+        second = connections.acquire(FakeConnection)
+
+        assert second is first
+        assert thread_wait() - waited >= 0.04
+
+    def test_if_connection_is_too_old_close_it(self):
+        connections = ConnectionPool(max_lifetime=0)
+        first = connections.acquire(FakeConnection)
+        connections.release(first)
+
+        second = connections.acquire(FakeConnection)
+
+        assert first.closed
+        assert second is not first
+
+    def test_if_idle_connection_is_broken_open_a_new_one(self):
+        connections = ConnectionPool(health_check_interval=0)
+        first = connections.acquire(FakeConnection)
+        connections.release(first)
+        first.broken = True
+
+        second = connections.acquire(FakeConnection)
+
+        assert first.closed
+        assert second is not first
+
+    def test_if_connection_is_released_stop_tracking_it(self):
+        connections = ConnectionPool(size=2)
+        first = connections.acquire(FakeConnection)
+        second = connections.acquire(FakeConnection)
+
+        connections.release(first)
+        connections.release(second, reusable=False)
+
+        assert connections.in_use == {}
+
+    def test_if_connection_is_not_from_pool_close_it(self):
+        connections = ConnectionPool(size=1)
+        connections.acquire(FakeConnection)
+        stranger = FakeConnection()
+
+        connections.release(stranger)
+
+        assert stranger.closed
+        assert len(connections.idle) == 0
+
+    def test_if_connection_is_not_reusable_close_it(self):
+        connections = ConnectionPool(size=1)
+        first = connections.acquire(FakeConnection)
+
+        connections.release(first, reusable=False)
+
+        assert first.closed
+        assert connections.acquire(FakeConnection) is not first
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    pass
+
+
+@pytest.fixture
+def pooled(tmp_path, django_db_blocker):
+    settings_dict = {**connection.settings_dict, "NAME": str(tmp_path / "pool.sqlite3"),
+                     "CONN_MAX_AGE": 0, "POOL": {"SIZE": 2}}
+    wrapper = DatabaseWrapper(settings_dict, alias="pool-test")
+    with django_db_blocker.unblock():
+        yield wrapper
+        wrapper.close()
+    pool._pools.pop("pool-test").close_idle()
+
+
+class TestPooledDatabaseWrapper:
+    def test_if_closed_reconnect_with_same_connection(self, pooled):
+        pooled.ensure_connection()
+        raw = pooled.connection
+        pooled.close()
+
+        with pooled.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+        assert pooled.connection is raw
+
+    def test_if_autocommit_was_changed_do_not_reuse_connection(self, pooled):
+        pooled.ensure_connection()
+        raw = pooled.connection
+        pooled.set_autocommit(False)
+        pooled.close()
+
+        pooled.ensure_connection()
+
+        assert pooled.connection is not raw
+        assert pooled.pool.stats["closes"] == 1
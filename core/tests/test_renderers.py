@@ -0,0 +1,67 @@
+import io
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+import pytest
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from core import parsers, renderers
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+
+
+PAYLOADS = [
+    {"id": 1, "title": "Bread é \u2028\u2029", "price": Decimal("10.05"),
+     "price_with_tax": Decimal("11.055"), "images": []},
+    [{"id": uuid4(), "items": [], "total_price": 0}],
+    {"placed_at": datetime(2023, 12, 20, 15, 17, 1, 123456, tzinfo=timezone.utc),
+     "payment_status": "P", "customer": None},
+    {"title": [ErrorDetail("This field may not be blank.", code="blank")]},
+    {1: "non string key", "big": 2 ** 70},
+]
+
+
+class TestFastJSONRenderer:
+    @pytest.mark.parametrize("data", PAYLOADS)
+    def test_output_matches_json_renderer(self, data):
+        assert FastJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_if_indent_is_requested_match_json_renderer(self):
+        media_type = "application/json; indent=4"
+
+        actual = FastJSONRenderer().render(PAYLOADS[0], media_type)
+
+        assert actual == JSONRenderer().render(PAYLOADS[0], media_type)
+
+    def test_if_orjson_is_missing_fall_back(self, monkeypatch):
+        monkeypatch.setattr(renderers, "orjson", None)
+
+        assert FastJSONRenderer().render(PAYLOADS[0]) == JSONRenderer().render(PAYLOADS[0])
+
+
+class TestFastJSONParser:
+    def test_output_matches_json_parser(self):
+        body = '{"product_id": 1, "quantity": 2, "title": "é", "price": 10.05}'.encode()
+
+        actual = FastJSONParser().parse(io.BytesIO(body))
+
+        assert actual == JSONParser().parse(io.BytesIO(body))
+
+    def test_if_body_is_invalid_raise_parse_error(self):
+        with pytest.raises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"product_id": '))
+
+    def test_if_encoding_is_not_utf8_fall_back(self):
+        # Not valid UTF-8, orjson would reject it
+        body = '{"title": "é"}'.encode("latin-1")
+
+        actual = FastJSONParser().parse(io.BytesIO(body), parser_context={"encoding": "latin-1"})
+
+        assert actual == {"title": "é"}
+
+    def test_if_orjson_is_missing_fall_back(self, monkeypatch):
+        monkeypatch.setattr(parsers, "orjson", None)
+        body = b'{"product_id": 1}'
+
+        assert FastJSONParser().parse(io.BytesIO(body)) == {"product_id": 1}
@@ -0,0 +1,61 @@
+"""
+Anonymous catalog reads only, to compare the WSGI and ASGI deployments
+on the same data (`manage.py generate_data`):
+
+    gunicorn storefront.wsgi -w 4
+    STORE_ASYNC_READS=1 gunicorn storefront.asgi:application -w 4 \
+        -k uvicorn.workers.UvicornWorker
+
+    locust -f locustfiles/browse_catalog.py --host http://localhost:8000 \
+        --headless -u 200 -r 20 -t 2m --csv wsgi
+
+and again with --csv asgi, then compare wsgi_stats.csv with asgi_stats.csv.
+
+Measured with 2 workers each, on one CPU shared with locust, SQLite, the
+local-memory cache and generate_data's default scale:
+
+    -u 50 -r 10 -t 60s    WSGI  40 req/s  p50   11 ms  p95   64 ms  no failures
+                          ASGI  40 req/s  p50   16 ms  p95   85 ms  1 reset
+    -u 300 -r 30 -t 60s   WSGI 162 req/s  p50  500 ms  p95  880 ms  no failures
+                          ASGI  80 req/s  p50 1200 ms  p95 4500 ms  2.4% failed
+
+The async reads lost on this setup. The async ORM runs every query in a
+thread, and each sync middleware adds a thread hop, so this costs more than
+it saves. The ASGI failures were SQLite "database is locked" errors on cart
+writes, because all of a worker's requests run at once. Measure again on
+the production database and cache before serving ASGI.
+"""
+from random import randint
+from locust import HttpUser, between, task
+
+
+class CatalogUser(HttpUser):
+    wait_time = between(0.5, 2)
+
+    @task(2)
+    def view_products(self):
+        self.client.get(
+            f"/store/products/?collection={randint(1, 20)}&page={randint(1, 5)}",
+            name="/store/products")
+
+    @task(4)
+    def view_product(self):
+        self.client.get(
+            f"/store/products/{randint(1, 1000)}/",
+            name="/store/products/:id")
+
+    @task(1)
+    def view_collections(self):
+        self.client.get("/store/collections/", name="/store/collections")
+
+    @task(1)
+    def view_cart(self):
+        self.client.get(f"/store/carts/{self.cart_id}/", name="/store/carts/:id")
+
+    def on_start(self):
+        response = self.client.post("/store/carts/")
+        self.cart_id = response.json()["id"]
+        self.client.post(
+            f"/store/carts/{self.cart_id}/items/",
+            name="/store/carts/items",
+            json={"product_id": randint(1, 10), "quantity": 1})
@@ -12,9 +12,8 @@ from django.db import transaction, connection
 
 from store.models import Collection, Customer, Order, OrderItem, Product
 from tag.models import TagItem
+from core.http import UpstreamError, cached_json
 from .tasks import long_running_task
-import requests
-from django.core.cache import cache
 from django.views.decorators.cache import cache_page
 from django.utils.decorators import method_decorator
 from rest_framework.views import APIView
@@ -31,8 +30,14 @@ class Index(APIView):
         logger.info(settings.BASE_DIR)
         logger.info(settings.DEBUG)
         logger.info(settings.STATIC_ROOT)
-        response = requests.get("https://httpbin.org/delay/2")
-        data = response.json()
+        try:
+            data = cached_json(settings.PLAYGROUND_UPSTREAM_URL,
+                               fresh_for=settings.PLAYGROUND_UPSTREAM_FRESH,
+                               stale_for=settings.PLAYGROUND_UPSTREAM_STALE)
+        except UpstreamError:
+            logger.warning("Upstream unavailable", exc_info=True)
+            return render(request, "index.html", status=502,
+                          context={"result": "The upstream service is unavailable"})
         return render(request, "index.html", context={"result": f"Hello {data}"})
 
 
@@ -1,8 +1,6 @@
 from typing import Any
 from django.contrib import admin, messages
 from django.db.models.query import QuerySet
-from django.http.request import HttpRequest
-from django.db.models import Count
 from django.utils.html import format_html, urlencode
 from django.urls import reverse
 from . import models
@@ -14,6 +12,7 @@ from . import models
 class CollectionAdmin(admin.ModelAdmin):
     list_display = ["title", "products_count"]
 
+    @admin.display(ordering="products_count")
     def products_count(self, collection):
         url = (reverse("admin:store_product_changelist")
                + "?" +
@@ -22,9 +21,6 @@ class CollectionAdmin(admin.ModelAdmin):
         ))
         return format_html("<a href={}>{}</a>", url, collection.products_count)
 
-    def get_queryset(self, request: HttpRequest) -> QuerySet[Any]:
-        return super().get_queryset(request).annotate(products_count=Count("products"))
-
 
 class OrderItemInline(admin.TabularInline):
     model = models.OrderItem
@@ -114,18 +110,32 @@ class CustomerAdmin(admin.ModelAdmin):
     # prepopulated_fields = {
     #     "last_name": ["first_name"]
     # }
-    list_display = ["first_name", "last_name", "membership", "total_orders"]
+    list_display = ["first_name", "last_name", "membership", "total_orders",
+                    "lifetime_spend", "last_order_at"]
     list_editable = ["membership"]
     list_per_page = 10
+    list_select_related = ["user", "stats"]
     search_fields = ["first_name__istartswith", "last_name__istartswith"]
 
+    def get_stats(self, customer):
+        try:
+            return customer.stats
+        except models.CustomerStats.DoesNotExist:
+            return models.CustomerStats(customer=customer)
+
+    @admin.display(ordering="stats__orders_count")
     def total_orders(self, customer):
         url = (reverse("admin:store_order_changelist")
                + "?" +
                urlencode({
                    "customer__id": customer.id
                }))
-        return format_html("<a href='{}'>{}</a>", url, customer.total_orders)
+        return format_html("<a href='{}'>{}</a>", url, self.get_stats(customer).orders_count)
+
+    @admin.display(ordering="stats__lifetime_spend")
+    def lifetime_spend(self, customer):
+        return self.get_stats(customer).lifetime_spend
 
-    def get_queryset(self, request: HttpRequest) -> QuerySet[Any]:
-        return super().get_queryset(request).annotate(total_orders=Count("order"))
+    @admin.display(ordering="stats__last_order_at")
+    def last_order_at(self, customer):
+        return self.get_stats(customer).last_order_at
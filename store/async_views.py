@@ -0,0 +1,242 @@
+"""
+Async versions of the product, collection and cart reads, served in place
+of the viewsets' GET routes when STORE_ASYNC_READS is on (it is off by
+default, see the setting). Rows are read with the async ORM; filtering,
+pagination, serializers and ETags are the viewsets' own, so responses are
+the same bytes the sync views send. Whatever the async views do not implement
+(writes, authenticated requests, search, cursors, the browsable API, the
+redis cart backend) is handed to the sync viewset. The viewsets' throttles
+are checked as for an anonymous request, which every request answered here
+is.
+"""
+from uuid import UUID
+from asgiref.sync import sync_to_async
+from django.core.exceptions import ValidationError
+from django.http import Http404, HttpResponse
+from django.urls import re_path
+from django.utils.cache import patch_vary_headers
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.views import exception_handler
+from .cache import acached_data, get_version, product_detail_key, product_list_key
+from .carts import get_cart_backend
+from .conditional import aconditional_response, make_etag
+from .models import Collection, Product
+from .views import CartViewSet, CollectionViewSet, ProductViewSet
+
+
+RENDERER = ProductViewSet.renderer_classes[0]()
+
+# Query parameters only the sync views implement
+SYNC_PARAMS = ("format", "search", "cursor", "count")
+
+
+class UseSyncView(Exception):
+    """Raised by an async view to hand the request to the sync viewset."""
+
+
+def can_answer(request):
+    if request.method not in ("GET", "HEAD"):
+        return False
+    if "HTTP_AUTHORIZATION" in request.META:
+        # DRF authenticates every request, a bad token is a 401 even on a read
+        return False
+    if any(name in request.GET for name in SYNC_PARAMS):
+        return False
+    # Anything else is negotiated to the browsable API, indented JSON or a 406
+    accept = request.headers.get("Accept", "")
+    return not accept or (
+        "text/html" not in accept and "indent" not in accept
+        and ("application/json" in accept or "*/*" in accept))
+
+
+def get_view(viewset_class, request, action, **kwargs):
+    """A viewset instance set up as its dispatch would, minus authentication."""
+    request = Request(request)
+    request.accepted_renderer = RENDERER
+    request.accepted_media_type = RENDERER.media_type
+    return viewset_class(request=request, action=action, format_kwarg=None, args=(), kwargs=kwargs)
+
+
+def render(data, status=200, cache_status=None):
+    response = HttpResponse(RENDERER.render(data, RENDERER.media_type, {}),
+                            status=status, content_type=RENDERER.media_type)
+    if cache_status is not None:
+        response["X-Cache"] = cache_status
+    return response
+
+
+def not_found(model):
+    # The message get_object_or_404() gives the sync views, which only say
+    # "Not found." for a malformed pk
+    return Http404(f"No {model._meta.object_name} matches the given query.")
+
+
+async def product_list(request):
+    view = get_view(ProductViewSet, request, "list")
+    key = await sync_to_async(product_list_key)(view.request)
+    etag = make_etag(key, RENDERER.format) if key else None
+
+    async def get_page():
+        # Validating ?collection= queries the database, so filter in a thread
+        queryset = await sync_to_async(view.filter_queryset)(view.get_queryset())
+        paginator = view.paginator
+        # Paginate the row numbers, so the rows can be read asynchronously
+        numbers = paginator.paginate_queryset(range(await queryset.acount()), view.request, view)
+        serializer = view.get_values_serializer()
+        rows = serializer.get_rows(queryset)
+        rows = rows[numbers[0]:numbers[-1] + 1] if numbers else rows.none()
+        return paginator.get_paginated_response(await serializer.aserialize(rows)).data
+
+    async def get_response():
+        data, cache_status = await acached_data("product-list", key, get_page)
+        return render(data, cache_status=cache_status)
+
+    return await aconditional_response(request, etag, None, get_response)
+
+
+async def product_detail(request, pk):
+    view = get_view(ProductViewSet, request, "retrieve", pk=pk)
+    try:
+        last_modified = await Product.objects \
+            .filter(pk=pk) \
+            .values_list("last_update", flat=True) \
+            .afirst()
+    except (TypeError, ValueError):
+        last_modified = None
+    etag = None
+    if last_modified is not None:
+        etag = make_etag(pk, RENDERER.format, last_modified)
+
+    async def get_product():
+        queryset = await sync_to_async(view.filter_queryset)(view.get_queryset())
+        serializer = view.get_values_serializer()
+        try:
+            rows = await serializer.aserialize(serializer.get_rows(queryset.filter(pk=pk))[:1])
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        if not rows:
+            raise not_found(Product)
+        return rows[0]
+
+    async def get_response():
+        key = await sync_to_async(product_detail_key)(view.request, pk)
+        data, cache_status = await acached_data("product-detail", key, get_product)
+        return render(data, cache_status=cache_status)
+
+    return await aconditional_response(request, etag, last_modified, get_response)
+
+
+async def collection_list(request):
+    view = get_view(CollectionViewSet, request, "list")
+    etag = await sync_to_async(view.get_etag)(view.request)
+
+    async def get_response():
+        collections = [collection async for collection in view.filter_queryset(view.get_queryset())]
+        return render(view.get_serializer(collections, many=True).data)
+
+    return await aconditional_response(request, etag, None, get_response)
+
+
+async def collection_detail(request, pk):
+    view = get_view(CollectionViewSet, request, "retrieve", pk=pk)
+    etag = await sync_to_async(view.get_etag)(view.request)
+
+    async def get_response():
+        try:
+            collection = await view.filter_queryset(view.get_queryset()).aget(pk=pk)
+        except Collection.DoesNotExist:
+            raise not_found(Collection)
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        return render(view.get_serializer(collection).data)
+
+    return await aconditional_response(request, etag, None, get_response)
+
+
+async def cart_detail(request, pk):
+    if not get_cart_backend().uses_database:
+        raise UseSyncView
+    view = get_view(CartViewSet, request, "retrieve", pk=pk)
+    try:
+        cart_id = UUID(pk)
+    except ValueError:
+        cart_id = None
+    etag = None
+    if cart_id is not None:
+        versions = await sync_to_async(
+            lambda: (get_version("cart", cart_id), get_version("product")))()
+        etag = make_etag(cart_id, RENDERER.format, *versions)
+
+    async def get_response():
+        serializer = view.get_values_serializer()
+        queryset = view.filter_queryset(view.get_queryset())
+        try:
+            rows = await serializer.aserialize(serializer.get_rows(queryset.filter(pk=pk))[:1])
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        if not rows:
+            raise Http404
+        return render(rows[0])
+
+    return await aconditional_response(request, etag, None, get_response)
+
+
+ASYNC_READS = {
+    "products-list": product_list,
+    "products-detail": product_detail,
+    "collections-list": collection_list,
+    "collections-detail": collection_detail,
+    "carts-detail": cart_detail,
+}
+
+
+def read_view(async_view, sync_view):
+    """
+    A view answering the requests it can with async_view and handing the
+    rest to sync_view, the viewset's view for the same route, in a thread.
+    """
+    actions = sync_view.actions
+    methods = set(actions) | {"options"} | ({"head"} if "get" in actions else set())
+    allow = ", ".join(method.upper() for method in sync_view.cls.http_method_names if method in methods)
+    run_sync_view = sync_to_async(sync_view)
+
+    async def view(request, *args, **kwargs):
+        if not can_answer(request):
+            return await run_sync_view(request, *args, **kwargs)
+        try:
+            throttled = get_view(sync_view.cls, request, actions["get"], **kwargs)
+            if throttled.get_throttles():
+                await sync_to_async(throttled.check_throttles)(throttled.request)
+            response = await async_view(request, *args, **kwargs)
+        except UseSyncView:
+            return await run_sync_view(request, *args, **kwargs)
+        except (APIException, Http404) as exc:
+            error = exception_handler(exc, {})
+            response = render(error.data, error.status_code)
+            # Retry-After of a throttled request
+            for name, value in error.items():
+                if name != "Content-Type":
+                    response[name] = value
+        # What APIView.finalize_response adds
+        response["Allow"] = allow
+        patch_vary_headers(response, ["Accept"])
+        return response
+
+    # Like the DRF view it stands in for (and for store.middleware's route names)
+    view.csrf_exempt = True
+    view.cls = sync_view.cls
+    view.actions = actions
+    return view
+
+
+def with_async_reads(urlpatterns):
+    """urlpatterns with the routes named in ASYNC_READS served by read_view()."""
+    return [
+        re_path(pattern.pattern.regex.pattern,
+                read_view(ASYNC_READS[pattern.name], pattern.callback),
+                name=pattern.name)
+        if pattern.name in ASYNC_READS and "format" not in pattern.pattern.regex.groupindex
+        else pattern
+        for pattern in urlpatterns
+    ]
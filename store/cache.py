@@ -0,0 +1,162 @@
+import hashlib
+import time
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework.response import Response
+
+
+PRODUCT_LIST_PARAMS = ("collection", "price__gt", "price__lt",
+                       "search", "ordering", "page", "cursor", "count")
+CACHE_NAMES = ("product-list", "product-detail")
+
+
+def _version_key(scope, pk):
+    return f"store:version:{scope}:{pk}"
+
+
+def get_version(scope, pk="all"):
+    key = _version_key(scope, pk)
+    version = cache.get(key)
+    if version is None:
+        # Seed with a timestamp instead of 1, so a counter evicted from
+        # redis never comes back with a value an old entry was keyed on.
+        version = time.time_ns()
+        if not cache.add(key, version, timeout=settings.STORE_VERSION_TIMEOUT):
+            version = cache.get(key) or version
+    return version
+
+
+def bump_version(scope, pk="all"):
+    key = _version_key(scope, pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), timeout=settings.STORE_VERSION_TIMEOUT)
+
+
+def forget_versions(scope, pks):
+    # A version that is gone gets reseeded from the clock, which works as a
+    # bump for any number of keys in one round trip.
+    cache.delete_many([_version_key(scope, pk) for pk in pks])
+
+
+def invalidate_version(scope, pk="all"):
+    transaction.on_commit(lambda: bump_version(scope, pk))
+
+
+def _bump_product_versions(product_ids, collection_ids):
+    for product_id in product_ids:
+        bump_version("product", product_id)
+    for collection_id in collection_ids:
+        bump_version("collection", collection_id)
+    bump_version("product")
+
+
+def invalidate_products(product_ids=(), collection_ids=()):
+    product_ids = set(product_ids)
+    collection_ids = {pk for pk in collection_ids if pk is not None}
+    # Bumping before commit would let a concurrent read cache the old rows
+    # under the new version.
+    transaction.on_commit(
+        lambda: _bump_product_versions(product_ids, collection_ids))
+
+
+def _count(name, outcome):
+    key = f"store:cache:{name}:{outcome}"
+    cache.add(key, 0, timeout=None)
+    try:
+        cache.incr(key)
+    except ValueError:
+        pass
+
+
+def cache_stats():
+    keys = {f"store:cache:{name}:{outcome}": (name, outcome)
+            for name in CACHE_NAMES
+            for outcome in ("hits", "misses")}
+    values = cache.get_many(list(keys))
+    stats = {name: {"hits": 0, "misses": 0} for name in CACHE_NAMES}
+    for key, (name, outcome) in keys.items():
+        stats[name][outcome] = values.get(key) or 0
+    return stats
+
+
+def _as_pk(value):
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def product_list_key(request):
+    params = request.query_params
+    normalized = sorted(
+        (name, params.get(name).strip())
+        for name in PRODUCT_LIST_PARAMS
+        if params.get(name, "").strip())
+    collection_id = params.get("collection", "").strip()
+    if collection_id:
+        # Only cache lookups whose version counter we know how to bump,
+        # anything else goes straight to the filter (and its 400).
+        collection_id = _as_pk(collection_id)
+        if collection_id is None:
+            return None
+        version = get_version("collection", collection_id)
+    else:
+        version = get_version("product")
+    # An empty ?cursor= is the first keyset page, which has to be keyed
+    # apart from the first page-number page
+    keyset = "cursor" in params
+    digest = hashlib.md5(
+        repr((request.build_absolute_uri("/"), keyset, normalized)).encode()).hexdigest()
+    return f"store:products:list:{version}:{digest}"
+
+
+def product_detail_key(request, pk):
+    pk = _as_pk(pk)
+    if pk is None:
+        return None
+    version = get_version("product", pk)
+    digest = hashlib.md5(
+        request.build_absolute_uri("/").encode()).hexdigest()
+    return f"store:products:detail:{pk}:{version}:{digest}"
+
+
+def cached_response(name, key, get_response):
+    if key is None or not settings.STORE_CACHE_ENABLED:
+        return get_response()
+
+    data = cache.get(key)
+    if data is not None:
+        _count(name, "hits")
+        response = Response(data)
+        response["X-Cache"] = "HIT"
+        return response
+
+    _count(name, "misses")
+    response = get_response()
+    if response.status_code == 200:
+        cache.set(key, response.data, timeout=settings.STORE_CACHE_TIMEOUT)
+    response["X-Cache"] = "MISS"
+    return response
+
+
+async def acached_data(name, key, get_data):
+    """
+    cached_response for async views, which render the response themselves:
+    returns the data and the X-Cache value, awaiting get_data() on a miss.
+    """
+    if key is None or not settings.STORE_CACHE_ENABLED:
+        return await get_data(), None
+
+    data = await cache.aget(key)
+    if data is not None:
+        await sync_to_async(_count)(name, "hits")
+        return data, "HIT"
+
+    await sync_to_async(_count)(name, "misses")
+    data = await get_data()
+    await cache.aset(key, data, timeout=settings.STORE_CACHE_TIMEOUT)
+    return data, "MISS"
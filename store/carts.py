@@ -0,0 +1,228 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+from django.conf import settings
+from django.db.models import Prefetch
+from django.utils import timezone
+from django_redis import get_redis_connection
+from .cache import bump_version
+from .models import MAX_CART_QUANTITY, Cart, CartItem, Product
+
+
+def parse_cart_id(value):
+    try:
+        return value if isinstance(value, UUID) else UUID(str(value))
+    except ValueError:
+        return None
+
+
+class DatabaseCartBackend:
+    """
+    Carts are Cart/CartItem rows from the first request on and the
+    viewsets work on them through the ORM; checkout only asks this
+    backend how many items a cart holds.
+    """
+    uses_database = True
+
+    def get(self, cart_id):
+        return Cart.objects \
+            .prefetch_related(Prefetch(
+                "items",
+                queryset=CartItem.objects.select_related("product").with_total_price())) \
+            .with_total_price() \
+            .filter(pk=cart_id) \
+            .first()
+
+    def count_items(self, cart_id):
+        if not Cart.objects.filter(pk=cart_id).exists():
+            return None
+        return CartItem.objects.filter(cart_id=cart_id).count()
+
+    def materialize(self, cart_id):
+        pass
+
+    def discard(self, cart_id):
+        pass
+
+
+# A cart is one hash: "created_at", plus per product "q:<product id>" for
+# the quantity and "i:<product id>" for the line id, and "n:<line id>"
+# pointing back at the product.
+ADD_SCRIPT = """
+if redis.call('EXISTS', KEYS[1]) == 0 then return false end
+local lines = {}
+for i = 3, #ARGV, 2 do
+    local product = ARGV[i]
+    local id = redis.call('HGET', KEYS[1], 'i:' .. product)
+    if not id then
+        id = redis.call('INCR', KEYS[2])
+        redis.call('HSET', KEYS[1], 'i:' .. product, id, 'n:' .. id, product)
+    end
+    lines[#lines + 1] = tonumber(id)
+    local quantity = redis.call('HINCRBY', KEYS[1], 'q:' .. product, ARGV[i + 1])
+    if quantity > tonumber(ARGV[2]) then
+        quantity = tonumber(ARGV[2])
+        redis.call('HSET', KEYS[1], 'q:' .. product, quantity)
+    end
+    lines[#lines + 1] = quantity
+end
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return lines
+"""
+
+UPDATE_SCRIPT = """
+local product = redis.call('HGET', KEYS[1], 'n:' .. ARGV[2])
+if not product then return false end
+redis.call('HSET', KEYS[1], 'q:' .. product, ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return tonumber(product)
+"""
+
+REMOVE_SCRIPT = """
+local product = redis.call('HGET', KEYS[1], 'n:' .. ARGV[2])
+if not product then return false end
+redis.call('HDEL', KEYS[1], 'n:' .. ARGV[2], 'i:' .. product, 'q:' .. product)
+redis.call('EXPIRE', KEYS[1], ARGV[1])
+return tonumber(product)
+"""
+
+
+class RedisCartBackend:
+    """
+    Keep carts as redis hashes that expire after STORE_CART_TTL without
+    activity (STORE_EMPTY_CART_TTL until the first item), and only write
+    them to Cart/CartItem rows at checkout.
+
+    Carts and lines come back as unsaved Cart/CartItem instances carrying
+    the same attributes the ORM queries annotate, so the existing
+    serializers render them unchanged.
+    """
+    uses_database = False
+    line_id_key = "store:cart:line_id"
+
+    def __init__(self, alias="default"):
+        self.alias = alias
+        self.redis = get_redis_connection(alias)
+        self.add_script = self.redis.register_script(ADD_SCRIPT)
+        self.update_script = self.redis.register_script(UPDATE_SCRIPT)
+        self.remove_script = self.redis.register_script(REMOVE_SCRIPT)
+
+    def key(self, cart_id):
+        return f"store:cart:{cart_id}"
+
+    def ttl(self, empty=False):
+        ttl = settings.STORE_EMPTY_CART_TTL if empty else settings.STORE_CART_TTL
+        return int(ttl.total_seconds())
+
+    def create(self):
+        cart = Cart(id=uuid4(), created_at=timezone.now())
+        with self.redis.pipeline() as pipe:
+            pipe.hset(self.key(cart.id), "created_at", cart.created_at.isoformat())
+            pipe.expire(self.key(cart.id), self.ttl(empty=True))
+            pipe.execute()
+        return self.build_cart(cart, [])
+
+    def get(self, cart_id):
+        cart_id = parse_cart_id(cart_id)
+        if cart_id is None:
+            return None
+        fields = {key.decode(): value.decode()
+                  for key, value in self.redis.hgetall(self.key(cart_id)).items()}
+        if not fields:
+            return None
+
+        lines = {int(field[2:]): int(value)
+                 for field, value in fields.items() if field.startswith("i:")}
+        products = Product.objects.only("id", "title", "price").in_bulk(lines)
+        items = [
+            self.build_item(cart_id, line_id, products[product_id],
+                            int(fields[f"q:{product_id}"]))
+            for product_id, line_id in sorted(lines.items(), key=lambda line: line[1])
+            # Lines of deleted products go away, as they would by cascade
+            if product_id in products
+        ]
+        cart = Cart(id=cart_id, created_at=datetime.fromisoformat(fields["created_at"]))
+        return self.build_cart(cart, items)
+
+    def get_item(self, cart_id, item_id):
+        cart = self.get(cart_id)
+        if cart is None:
+            return None
+        return next((item for item in cart.items.all() if str(item.id) == str(item_id)), None)
+
+    def count_items(self, cart_id):
+        cart = self.get(cart_id)
+        return None if cart is None else len(cart.items.all())
+
+    def build_item(self, cart_id, line_id, product, quantity):
+        item = CartItem(id=line_id, cart_id=cart_id, product=product, quantity=quantity)
+        item.total_price = quantity * product.price
+        return item
+
+    def build_cart(self, cart, items):
+        cart._prefetched_objects_cache = {"items": items}
+        cart.total_price = sum(item.total_price for item in items) if items else None
+        return cart
+
+    def add(self, cart_id, quantities):
+        """
+        Add {product_id: quantity} to the cart, capping lines at
+        MAX_CART_QUANTITY like the database upsert; returns {product_id:
+        (line id, new quantity)}, or None when there is no such cart.
+        """
+        cart_id = parse_cart_id(cart_id)
+        if cart_id is None:
+            return None
+        args = [self.ttl(), MAX_CART_QUANTITY]
+        for product_id, quantity in quantities.items():
+            args += [product_id, quantity]
+        lines = self.add_script(keys=[self.key(cart_id), self.line_id_key], args=args)
+        if lines is None:
+            return None
+        bump_version("cart", cart_id)
+        return dict(zip(quantities, zip(lines[::2], lines[1::2])))
+
+    def update(self, cart_id, item_id, quantity):
+        return self._run_line_script(self.update_script, cart_id, item_id, quantity)
+
+    def remove(self, cart_id, item_id):
+        return self._run_line_script(self.remove_script, cart_id, item_id)
+
+    def _run_line_script(self, script, cart_id, item_id, *args):
+        cart_id = parse_cart_id(cart_id)
+        if cart_id is None:
+            return False
+        product_id = script(keys=[self.key(cart_id)], args=[self.ttl(), item_id, *args])
+        if product_id is None:
+            return False
+        bump_version("cart", cart_id)
+        return True
+
+    def delete(self, cart_id):
+        cart_id = parse_cart_id(cart_id)
+        if cart_id is None or not self.redis.delete(self.key(cart_id)):
+            return False
+        bump_version("cart", cart_id)
+        return True
+
+    def materialize(self, cart_id):
+        """Write the cart to Cart/CartItem rows for checkout."""
+        cart = self.get(cart_id)
+        if cart is None:
+            return
+        Cart.objects.create(id=cart.id)
+        CartItem.objects.bulk_create(
+            CartItem(cart_id=cart.id, product_id=item.product.id, quantity=item.quantity)
+            for item in cart.items.all())
+
+    def discard(self, cart_id):
+        self.delete(cart_id)
+
+
+CART_BACKENDS = {
+    "database": DatabaseCartBackend,
+    "redis": RedisCartBackend,
+}
+
+
+def get_cart_backend():
+    return CART_BACKENDS[settings.STORE_CART_BACKEND]()
@@ -0,0 +1,39 @@
+import hashlib
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+
+def make_etag(*parts):
+    return quote_etag(hashlib.md5(repr(parts).encode()).hexdigest())
+
+
+def _set_validators(response, etag, timestamp):
+    if response.status_code == 200:
+        if etag:
+            response["ETag"] = etag
+        if timestamp is not None:
+            response["Last-Modified"] = http_date(timestamp)
+    return response
+
+
+def conditional_response(request, etag, last_modified, get_response):
+    """
+    Answer with 304 Not Modified when the client's If-None-Match or
+    If-Modified-Since still matches, without calling get_response at all.
+    """
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    not_modified = get_conditional_response(
+        request._request, etag=etag, last_modified=timestamp)
+    if not_modified is not None:
+        return not_modified
+    return _set_validators(get_response(), etag, timestamp)
+
+
+async def aconditional_response(request, etag, last_modified, get_response):
+    """conditional_response for async views, given the Django request."""
+    timestamp = int(last_modified.timestamp()) if last_modified else None
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=timestamp)
+    if not_modified is not None:
+        return not_modified
+    return _set_validators(await get_response(), etag, timestamp)
@@ -0,0 +1,67 @@
+from django.db import transaction
+from django.db.models import BooleanField, Exists, ExpressionWrapper, OuterRef, Q
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+
+class BulkDeleteSerializer(serializers.Serializer):
+    ids = serializers.ListField(
+        child=serializers.IntegerField(), allow_empty=False, max_length=500)
+
+
+class DeletionGuardMixin:
+    """
+    Refuse to delete objects that rows in delete_guards, (model, foreign
+    key) pairs, still point at. Checks are EXISTS queries on the foreign
+    key's index, and bulk-delete reports per id what was deleted.
+    """
+    delete_guards = ()
+    delete_blocked_message = "This object cannot be deleted, because other objects refer to it"
+
+    def get_blocked(self):
+        blocked = Q()
+        for model, field in self.delete_guards:
+            blocked |= Q(Exists(model.objects.filter(**{field: OuterRef("pk")})))
+        return ExpressionWrapper(blocked, output_field=BooleanField())
+
+    def is_delete_blocked(self, pk):
+        try:
+            return any(model.objects.filter(**{field: pk}).exists()
+                       for model, field in self.delete_guards)
+        except (TypeError, ValueError):
+            # Let the lookup in destroy() answer with its 404
+            return False
+
+    def destroy(self, request, *args, **kwargs):
+        if self.is_delete_blocked(kwargs["pk"]):
+            return Response(
+                {"error": self.delete_blocked_message},
+                status=status.HTTP_405_METHOD_NOT_ALLOWED)
+        return super().destroy(request, *args, **kwargs)
+
+    @action(detail=False, methods=["post"], url_path="bulk-delete")
+    def bulk_delete(self, request: Request):
+        serializer = BulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = list(dict.fromkeys(serializer.validated_data["ids"]))
+
+        model = self.get_queryset().model
+        with transaction.atomic():
+            # Locking the rows keeps new references from slipping in
+            # between the check and the delete.
+            rows = dict(model._default_manager
+                        .select_for_update()
+                        .filter(pk__in=ids)
+                        .annotate(blocked=self.get_blocked())
+                        .values_list("pk", "blocked"))
+            deletable = [pk for pk in ids if pk in rows and not rows[pk]]
+            if deletable:
+                model._default_manager.filter(pk__in=deletable).delete()
+
+        return Response({
+            "deleted": deletable,
+            "blocked": [pk for pk in ids if rows.get(pk)],
+            "not_found": [pk for pk in ids if pk not in rows],
+        })
@@ -0,0 +1,82 @@
+import csv
+import json
+from itertools import chain
+from datetime import date, datetime
+from decimal import Decimal
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.exceptions import ValidationError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+
+class Echo:
+    """File-like object for csv.writer that hands back each line."""
+
+    def write(self, value):
+        return value
+
+
+def _default(value):
+    if isinstance(value, Decimal):
+        # Keep the exact amount, floats would round prices
+        return str(value)
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    raise TypeError
+
+
+def _dumps(row):
+    if orjson is not None:
+        return orjson.dumps(row, default=_default) + b"\n"
+    return (json.dumps(row, default=_default, separators=(",", ":")) + "\n").encode()
+
+
+def iter_rows(queryset, fields, chunk_size=None):
+    """
+    Yield queryset.values_list(*fields) rows in keyset chunks on the primary
+    key. Unlike .iterator(), which MySQL client libraries buffer whole, no
+    more than chunk_size rows are held at a time on any backend.
+    """
+    chunk_size = chunk_size or settings.STORE_EXPORT_CHUNK_SIZE
+    pk_name = queryset.model._meta.pk.name
+    queryset = queryset.order_by(pk_name).values_list(pk_name, *fields)
+    last_pk = None
+    while True:
+        chunk = queryset if last_pk is None else queryset.filter(**{f"{pk_name}__gt": last_pk})
+        rows = list(chunk[:chunk_size])
+        for row in rows:
+            yield row[1:]
+        if len(rows) < chunk_size:
+            return
+        last_pk = rows[-1][0]
+
+
+def get_export_format(request):
+    export_format = request.query_params.get("as", "csv")
+    if export_format not in EXPORT_FORMATS:
+        raise ValidationError({"as": [f"Choose one of {', '.join(EXPORT_FORMATS)}."]})
+    return export_format
+
+
+def export_response(rows, header, export_format, filename):
+    if export_format == "csv":
+        writer = csv.writer(Echo())
+        lines = (writer.writerow(row) for row in rows)
+        content = chain([writer.writerow(header)], lines)
+    else:
+        content = (_dumps(dict(zip(header, row))) for row in rows)
+
+    response = StreamingHttpResponse(content, content_type=EXPORT_FORMATS[export_format])
+    response["Content-Disposition"] = f'attachment; filename="{filename}.{export_format}"'
+    return response
+
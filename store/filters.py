@@ -1,5 +1,11 @@
+import re
+from django.conf import settings
+from django.db import connections
+from django.db.models import FloatField
+from django.db.models.expressions import RawSQL
 from django_filters.rest_framework import FilterSet
-from store.models import Product
+from rest_framework.filters import SearchFilter
+from store.models import Order, Product
 
 class ProductFilter(FilterSet):
     class Meta:
@@ -8,4 +14,61 @@ class ProductFilter(FilterSet):
         fields = {
             "collection": ["exact"],
             "price": ["gt", "lt"]
-        }
\ No newline at end of file
+        }
+
+
+class OrderFilter(FilterSet):
+    class Meta:
+        model = Order
+        fields = {
+            "payment_status": ["exact"],
+            "placed_at": ["gte", "lt"],
+        }
+
+
+class FullTextSearchFilter(SearchFilter):
+    """
+    Ranked prefix search over the MySQL FULLTEXT index on the view's
+    fulltext_fields. Falls back to SearchFilter's LIKE scan on other
+    databases and for terms shorter than the index token size, unless
+    STORE_SEARCH_FALLBACK is off.
+    """
+    min_token_size = 3
+    operators = re.compile(r'[+\-<>()~*"@]+')
+
+    def get_boolean_query(self, search_terms):
+        words = []
+        for term in search_terms:
+            words += self.operators.sub(" ", term).split()
+        if not words or any(len(word) < self.min_token_size for word in words):
+            return None
+        return " ".join(f"+{word}*" for word in words)
+
+    def can_use_fulltext(self, queryset):
+        return (settings.STORE_SEARCH_BACKEND == "fulltext"
+                and connections[queryset.db].vendor == "mysql")
+
+    def filter_queryset(self, request, queryset, view):
+        search_terms = self.get_search_terms(request)
+        if not search_terms:
+            return queryset
+
+        query = self.get_boolean_query(search_terms)
+        if query is not None and self.can_use_fulltext(queryset):
+            return self.fulltext_search(queryset, query, view.fulltext_fields)
+        if settings.STORE_SEARCH_BACKEND == "like" or settings.STORE_SEARCH_FALLBACK:
+            return super().filter_queryset(request, queryset, view)
+        return queryset.none()
+
+    def fulltext_search(self, queryset, query, fields):
+        opts = queryset.model._meta
+        quote_name = connections[queryset.db].ops.quote_name
+        columns = ", ".join(
+            f"{quote_name(opts.db_table)}.{quote_name(opts.get_field(field).column)}"
+            for field in fields)
+        rank = RawSQL(f"MATCH ({columns}) AGAINST (%s IN BOOLEAN MODE)",
+                      (query,), output_field=FloatField())
+        return queryset \
+            .annotate(search_rank=rank) \
+            .filter(search_rank__gt=0) \
+            .order_by("-search_rank", "id")
@@ -0,0 +1,199 @@
+import math
+import random
+from datetime import timedelta
+from decimal import Decimal
+from time import perf_counter
+from typing import Any
+from uuid import UUID
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from store.cache import bump_version
+from store.models import (Cart, CartItem, Collection, Customer, Order, OrderItem,
+                          Product, ProductImage, Review)
+
+
+# Rows per entity at --scale 1
+COUNTS = {
+    "collections": 20,
+    "products": 5000,
+    "customers": 2000,
+    "orders": 10000,
+    "carts": 1000,
+}
+
+WORDS = ("red blue green small large classic organic fresh smoked roasted "
+         "spicy sweet wild golden dark light crispy soft aged frozen").split()
+NOUNS = ("coffee tea bread cheese pasta rice salmon chicken beans olives "
+         "honey jam soup sauce cookies crackers juice wine beer water").split()
+
+
+class Command(BaseCommand):
+    help = "Generate deterministic synthetic store data for load tests and benchmarks"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--scale", type=float, default=1,
+                            help="Multiplier applied to every default count")
+        for name, count in COUNTS.items():
+            parser.add_argument(f"--{name}", type=int,
+                                help=f"Defaults to {count} x scale")
+        parser.add_argument("--images-per-product", type=int, default=2,
+                            help="Upper bound, the actual number is random")
+        parser.add_argument("--reviews-per-product", type=int, default=5,
+                            help="Upper bound, the actual number is random")
+        parser.add_argument("--items-per-order", type=int, default=5,
+                            help="Upper bound, the actual number is random")
+        parser.add_argument("--days", type=int, default=365,
+                            help="Orders are spread over this many past days")
+        parser.add_argument("--seed", type=int, default=1,
+                            help="Same seed, same data")
+        parser.add_argument("--batch-size", type=int, default=2000,
+                            help="Rows per INSERT")
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        counts = {name: options[name] if options[name] is not None else math.ceil(count * options["scale"])
+                  for name, count in COUNTS.items()}
+        if counts["products"] and not counts["collections"]:
+            raise CommandError("Products need at least one collection")
+        if counts["orders"] and not (counts["customers"] and counts["products"]):
+            raise CommandError("Orders need customers and products")
+        if counts["carts"] and not counts["products"]:
+            raise CommandError("Carts need products")
+
+        self.rng = random.Random(options["seed"])
+        self.seed = options["seed"]
+        self.batch_size = options["batch_size"]
+        self.options = options
+        if get_user_model().objects.filter(username__startswith=f"synthetic-{self.seed}-").exists():
+            raise CommandError(f"Data for seed {self.seed} was already generated, pick another --seed")
+
+        started = perf_counter()
+        collection_ids = self.generate_collections(counts["collections"])
+        products = self.generate_products(counts["products"], collection_ids)
+        self.generate_images_and_reviews(products)
+        customer_ids = self.generate_customers(counts["customers"])
+        self.generate_orders(counts["orders"], customer_ids, products)
+        self.generate_carts(counts["carts"], products)
+
+        # Bulk inserts skip the signal handlers keeping the denormalized
+        # tables and the cache versions in step.
+        call_command("reconcile_collections", stdout=self.stdout)
+        call_command("rebuild_customer_stats", stdout=self.stdout)
+        call_command("rebuild_sales_rollups", stdout=self.stdout)
+        bump_version("product")
+        bump_version("collections")
+        self.stdout.write(self.style.SUCCESS(f"Done in {perf_counter() - started:.1f}s"))
+
+    def insert(self, model, rows):
+        """bulk_create rows and return the new primary keys in order."""
+        # Not every backend returns ids from bulk_create (MySQL), so read
+        # them back; rows are inserted in order above the current maximum.
+        last_pk = model.objects.aggregate(last=Max("pk"))["last"] or 0
+        self.bulk_insert(model, rows)
+        return list(model.objects.filter(pk__gt=last_pk).order_by("pk").values_list("pk", flat=True))
+
+    def bulk_insert(self, model, rows):
+        rows = iter(rows)
+        inserted = 0
+        with transaction.atomic():
+            while True:
+                batch = [row for _, row in zip(range(self.batch_size), rows)]
+                if not batch:
+                    break
+                model.objects.bulk_create(batch)
+                inserted += len(batch)
+                self.stdout.write(f"{model._meta.verbose_name_plural}: {inserted}", ending="\r")
+        self.stdout.write(f"{model._meta.verbose_name_plural}: {inserted}")
+
+    def title(self):
+        return f"{self.rng.choice(WORDS).title()} {self.rng.choice(WORDS)} {self.rng.choice(NOUNS)}"
+
+    def generate_collections(self, count):
+        return self.insert(Collection, (
+            Collection(title=f"{self.rng.choice(WORDS).title()} {self.rng.choice(NOUNS)} {n}")
+            for n in range(count)))
+
+    def generate_products(self, count, collection_ids):
+        rng = self.rng
+        rows = []
+        for n in range(count):
+            title = self.title()
+            rows.append(Product(
+                title=title,
+                slug=f"{title.lower().replace(' ', '-')}-{n}"[:50],
+                description=" ".join(rng.choices(WORDS + NOUNS, k=rng.randint(5, 40))),
+                inventory=rng.randint(0, 500),
+                price=Decimal(rng.randint(100, 99999)) / 100,
+                collection_id=rng.choice(collection_ids)))
+        ids = self.insert(Product, rows)
+        return [(product_id, row.price) for product_id, row in zip(ids, rows)]
+
+    def generate_images_and_reviews(self, products):
+        rng = self.rng
+        images_per_product = self.options["images_per_product"]
+        reviews_per_product = self.options["reviews_per_product"]
+        images = []
+        reviews = []
+        for product_id, _ in products:
+            images.extend(
+                ProductImage(product_id=product_id, image=f"store/images/synthetic-{product_id}-{n}.jpg")
+                for n in range(rng.randint(0, images_per_product)))
+            reviews.extend(
+                Review(product_id=product_id, name=rng.choice(NOUNS).title(),
+                       description=" ".join(rng.choices(WORDS, k=rng.randint(3, 30))))
+                for _ in range(rng.randint(0, reviews_per_product)))
+        self.bulk_insert(ProductImage, images)
+        self.bulk_insert(Review, reviews)
+
+    def generate_customers(self, count):
+        rng = self.rng
+        User = get_user_model()
+        user_ids = self.insert(User, (
+            User(username=f"synthetic-{self.seed}-{n}",
+                 email=f"synthetic-{self.seed}-{n}@example.com",
+                 first_name=rng.choice(NOUNS).title(),
+                 last_name=rng.choice(WORDS).title(),
+                 password="!")  # unusable
+            for n in range(count)))
+        memberships = [choice for choice, _ in Customer.MEMBERSHIP_CHOICES]
+        # The post_save handler creating customers does not run for bulk_create
+        return self.insert(Customer, (
+            Customer(user_id=user_id,
+                     phone=f"{rng.randint(0, 10 ** 10 - 1):010}",
+                     membership=rng.choices(memberships, weights=(8, 3, 1))[0])
+            for user_id in user_ids))
+
+    def generate_orders(self, count, customer_ids, products):
+        rng = self.rng
+        statuses = [choice for choice, _ in Order.PAYMENT_STATUS_CHOICES]
+        order_ids = self.insert(Order, (
+            Order(customer_id=rng.choice(customer_ids),
+                  payment_status=rng.choices(statuses, weights=(2, 7, 1))[0])
+            for _ in range(count)))
+
+        # placed_at is auto_now_add, which bulk_create overwrites with now
+        now = timezone.now()
+        days = self.options["days"]
+        orders = [Order(id=order_id, placed_at=now - timedelta(seconds=rng.randint(0, days * 86400)))
+                  for order_id in order_ids]
+        with transaction.atomic():
+            Order.objects.bulk_update(orders, ["placed_at"], batch_size=self.batch_size)
+
+        items_per_order = self.options["items_per_order"]
+        self.bulk_insert(OrderItem, (
+            OrderItem(order_id=order_id, product_id=product_id, unit_price=price,
+                      quantity=rng.randint(1, 5))
+            for order_id in order_ids
+            for product_id, price in rng.sample(products, min(len(products), rng.randint(1, items_per_order)))))
+
+    def generate_carts(self, count, products):
+        rng = self.rng
+        carts = [Cart(id=UUID(int=rng.getrandbits(128), version=4)) for _ in range(count)]
+        self.bulk_insert(Cart, carts)
+        self.bulk_insert(CartItem, (
+            CartItem(cart_id=cart.id, product_id=product_id, quantity=rng.randint(1, 5))
+            for cart in carts
+            for product_id, _ in rng.sample(products, min(len(products), rng.randint(1, 5)))))
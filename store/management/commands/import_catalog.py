@@ -0,0 +1,160 @@
+import csv
+import json
+import os
+from time import perf_counter
+from typing import Any
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from store.cache import bump_version, forget_versions
+from store.models import Collection, Product
+
+
+FEEDS = {
+    "collection": {
+        "model": Collection,
+        "fields": ["title"],
+        "touched": [],
+    },
+    "product": {
+        "model": Product,
+        "fields": ["title", "slug", "description", "inventory", "price", "collection_id"],
+        # auto_now is only applied to the update half of the upsert if listed
+        "touched": ["last_update"],
+    },
+}
+
+
+def read_feed(path):
+    """Yield (line number, dict) from a CSV file or a JSON lines file."""
+    with open(path, newline="", encoding="utf-8") as feed:
+        if path.endswith(".csv"):
+            # Line 1 is the header
+            for number, row in enumerate(csv.DictReader(feed), start=2):
+                yield number, row
+        else:
+            for number, line in enumerate(feed, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except ValueError:
+                    raise CommandError(f"Line {number} is not valid JSON")
+
+
+class Command(BaseCommand):
+    help = "Upsert collections or products from a CSV or JSON lines (.ndjson/.jsonl/.json) feed"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--model", choices=list(FEEDS), default="product")
+        parser.add_argument("--batch-size", type=int, default=1000,
+                            help="Rows upserted per transaction")
+        parser.add_argument("--checkpoint",
+                            help="Progress file, defaults to <path>.checkpoint")
+        parser.add_argument("--restart", action="store_true",
+                            help="Ignore the checkpoint and start from the first row")
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        path = options["path"]
+        if not os.path.exists(path):
+            raise CommandError(f"{path} does not exist")
+        feed = FEEDS[options["model"]]
+        self.model = feed["model"]
+        self.fields = feed["fields"]
+        self.touched = feed["touched"]
+        self.batch_size = options["batch_size"]
+        self.checkpoint = options["checkpoint"] or f"{path}.checkpoint"
+
+        skip = 0 if options["restart"] else self.read_checkpoint(path)
+        if skip:
+            self.stdout.write(f"Resuming after row {skip}")
+
+        self.imported = self.invalid = 0
+        self.started = perf_counter()
+        batch = []
+        position = 0
+        for position, (number, row) in enumerate(read_feed(path), start=1):
+            if position <= skip:
+                continue
+            obj = self.build(number, row)
+            if obj is not None:
+                batch.append(obj)
+            if position % self.batch_size == 0:
+                self.flush(batch, path, position)
+                batch = []
+        self.flush(batch, path, position)
+
+        if self.model is Product:
+            # bulk_create skips the signals keeping the counters
+            Collection.objects.reconcile_products_count()
+        bump_version("product")
+        bump_version("collections")
+        if os.path.exists(self.checkpoint):
+            os.remove(self.checkpoint)
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {self.imported} rows, skipped {self.invalid} invalid rows, "
+            f"{self.rate()} rows/s"))
+
+    def build(self, number, row):
+        try:
+            values = {field: row[field] for field in self.fields if row.get(field) not in (None, "")}
+            if "collection_id" in self.fields:
+                values["collection_id"] = int(values.get("collection_id") or row.get("collection"))
+            obj = self.model(id=row.get("id"), **values)
+            # Foreign keys are checked per batch rather than per row
+            obj.clean_fields(exclude=["collection", "featured_product", "last_update"])
+            if not obj.id:
+                raise ValidationError({"id": ["This field is required."]})
+        except (ValidationError, AttributeError, TypeError, ValueError) as error:
+            self.report(number, error)
+            return None
+        obj._line = number
+        return obj
+
+    def flush(self, batch, path, position):
+        if "collection_id" in self.fields and batch:
+            known = set(Collection.objects
+                        .filter(pk__in={obj.collection_id for obj in batch})
+                        .values_list("pk", flat=True))
+            for obj in [obj for obj in batch if obj.collection_id not in known]:
+                self.report(obj._line, f"collection {obj.collection_id} does not exist")
+                batch.remove(obj)
+
+        with transaction.atomic():
+            if batch:
+                self.model.objects.bulk_create(
+                    batch, batch_size=self.batch_size, update_conflicts=True,
+                    unique_fields=["id"], update_fields=self.fields + self.touched)
+        self.write_checkpoint(path, position)
+
+        if self.model is Product:
+            forget_versions("product", [obj.id for obj in batch])
+            forget_versions("collection", {obj.collection_id for obj in batch})
+        self.imported += len(batch)
+        self.stdout.write(f"{position} rows read, {self.imported} imported, {self.rate()} rows/s")
+
+    def report(self, number, error):
+        self.invalid += 1
+        messages = error.message_dict if hasattr(error, "message_dict") else str(error)
+        self.stderr.write(f"Line {number}: {messages}")
+
+    def rate(self):
+        return int(self.imported / max(perf_counter() - self.started, 1e-6))
+
+    def read_checkpoint(self, path):
+        if not os.path.exists(self.checkpoint):
+            return 0
+        with open(self.checkpoint) as checkpoint:
+            state = json.load(checkpoint)
+        if state["path"] != os.path.abspath(path) or state["size"] != os.path.getsize(path):
+            raise CommandError(f"{self.checkpoint} belongs to another feed, use --restart")
+        return state["rows"]
+
+    def write_checkpoint(self, path, rows):
+        # Written once the batch is committed, so a crash leaves it at most
+        # one batch behind the database, and replaying a batch is an upsert.
+        state = {"path": os.path.abspath(path), "size": os.path.getsize(path), "rows": rows}
+        with open(f"{self.checkpoint}.tmp", "w") as checkpoint:
+            json.dump(state, checkpoint)
+        os.replace(f"{self.checkpoint}.tmp", self.checkpoint)
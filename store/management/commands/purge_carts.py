@@ -0,0 +1,21 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from store.tasks import purge_expired_carts
+
+
+class Command(BaseCommand):
+    help = "Delete carts that expired under STORE_CART_TTL / STORE_EMPTY_CART_TTL"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int,
+                            help="Carts deleted per transaction")
+        parser.add_argument("--pause", type=float,
+                            help="Seconds to sleep between chunks")
+        parser.add_argument("--max-chunks", type=int, default=0,
+                            help="Stop after this many chunks (0 for no limit)")
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        purged = purge_expired_carts(chunk_size=options["chunk_size"],
+                                     pause=options["pause"],
+                                     max_chunks=options["max_chunks"])
+        self.stdout.write(f"Purged {purged['carts']} carts and {purged['items']} cart items")
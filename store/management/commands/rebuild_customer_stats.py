@@ -0,0 +1,29 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from store.models import Customer, CustomerStats
+
+
+class Command(BaseCommand):
+    help = "Recompute CustomerStats from orders, a chunk of customers at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=1000,
+                            help="Customers recomputed per transaction")
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        chunk_size = options["chunk_size"]
+        last_id = 0
+        rebuilt = 0
+        while True:
+            customer_ids = list(Customer.objects
+                                .filter(pk__gt=last_id)
+                                .order_by("pk")
+                                .values_list("pk", flat=True)[:chunk_size])
+            if not customer_ids:
+                break
+            with transaction.atomic():
+                rebuilt += CustomerStats.objects.rebuild(customer_ids)
+            last_id = customer_ids[-1]
+            self.stdout.write(f"Rebuilt stats of {rebuilt} customers", ending="\r")
+        self.stdout.write(f"Rebuilt stats of {rebuilt} customers")
@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+from typing import Any
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Min
+from django.utils import timezone
+from store.models import DailyProductSales, Order
+
+
+class Command(BaseCommand):
+    help = "Recompute the daily sales rollups, a day at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--start", type=date.fromisoformat,
+                            help="First day (YYYY-MM-DD), defaults to the first order")
+        parser.add_argument("--end", type=date.fromisoformat,
+                            help="Last day (YYYY-MM-DD), defaults to today")
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        end = options["end"] or timezone.localdate()
+        start = options["start"]
+        if start is None:
+            first_order = Order.objects.aggregate(first=Min("placed_at"))["first"]
+            if first_order is None:
+                self.stdout.write("No orders to roll up")
+                return
+            start = timezone.localtime(first_order).date()
+        if start > end:
+            raise CommandError("--start is after --end")
+
+        rows = 0
+        day = start
+        while day <= end:
+            rows += DailyProductSales.objects.rebuild(day, day)
+            day += timedelta(days=1)
+        self.stdout.write(f"Rebuilt {rows} rollup rows for {start}..{end}")
@@ -0,0 +1,16 @@
+from typing import Any
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from store.cache import invalidate_version
+from store.models import Collection
+
+
+class Command(BaseCommand):
+    help = "Recompute Collection.products_count where it drifted from the products table"
+
+    def handle(self, *args: Any, **options: Any) -> str | None:
+        with transaction.atomic():
+            drifted = Collection.objects.reconcile_products_count()
+            if drifted:
+                invalidate_version("collections")
+        self.stdout.write(f"Fixed products_count of {len(drifted)} collections")
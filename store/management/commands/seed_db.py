@@ -1,8 +1,7 @@
 import os
-from pathlib import Path
 from typing import Any
+from django.core.management import call_command
 from django.core.management.base import BaseCommand
-from django.db import connection
 
 
 class Command(BaseCommand):
@@ -11,9 +10,10 @@ class Command(BaseCommand):
     def handle(self, *args: Any, **options: Any) -> str | None:
         print("Populating the database...")
         current_dir = os.path.dirname(__file__)
-        file_path = os.path.join(current_dir, "seed.sql")
-        sql = Path(file_path).read_text()
-
-        with connection.cursor() as cursor:
-            cursor.execute(sql)
-            print("Done")
+        for model, feed in (("collection", "seed_collections.csv"),
+                            ("product", "seed_products.csv")):
+            call_command("import_catalog", os.path.join(current_dir, feed),
+                         model=model, restart=True,
+                         checkpoint=os.path.join(current_dir, f".{feed}.checkpoint"),
+                         stdout=self.stdout, stderr=self.stderr)
+        print("Done")
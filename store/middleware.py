@@ -0,0 +1,293 @@
+import logging
+import math
+import random
+import threading
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from time import monotonic, perf_counter
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django_redis import get_redis_connection
+from redis.exceptions import RedisError
+from core.db.pool import thread_wait
+
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the histogram buckets, plus one for everything above
+MS_BUCKETS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+METRICS = {
+    "queries": QUERY_BUCKETS,
+    "db_ms": MS_BUCKETS,
+    "pool_wait_ms": MS_BUCKETS,
+    # The renderer's share only, serializers run inside the view
+    "render_ms": MS_BUCKETS,
+    "total_ms": MS_BUCKETS,
+}
+
+REDIS_KEY = "store:metrics"
+
+
+class Histogram:
+    __slots__ = ("bounds", "counts", "total")
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0
+
+    def add(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    @property
+    def count(self):
+        return sum(self.counts)
+
+    def labels(self):
+        return [f"le_{bound}" for bound in self.bounds] + ["le_inf"]
+
+    def percentile(self, p):
+        """Upper bound of the bucket the p-th percentile falls in."""
+        rank = math.ceil(p / 100 * self.count)
+        seen = 0
+        for bound, count in zip(self.bounds + (math.inf,), self.counts):
+            seen += count
+            if count and seen >= rank:
+                return bound
+        return None
+
+
+class MetricsRegistry:
+    """Histograms per route, shared by the threads of the process."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.routes = defaultdict(lambda: {name: Histogram(bounds) for name, bounds in METRICS.items()})
+        self.n_plus_one = Counter()
+        self.warned = set()
+        self.started = monotonic()
+
+    def record(self, route, values, repeated):
+        with self.lock:
+            histograms = self.routes[route]
+            for name, value in values.items():
+                histograms[name].add(value)
+            if repeated:
+                self.n_plus_one[route] += 1
+            # Warn once per route and statement between flushes
+            new = [(sql, count) for sql, count in repeated if (route, sql) not in self.warned]
+            self.warned.update((route, sql) for sql, _ in new)
+        for sql, count in new:
+            logger.warning("Possible N+1 in %s: the same query ran %s times: %.300s", route, count, sql)
+
+    def is_due(self, interval):
+        return monotonic() - self.started >= interval
+
+    def take(self, interval=0):
+        """
+        Return the aggregates collected so far and start over, or None if
+        they are less than interval seconds old.
+        """
+        with self.lock:
+            if monotonic() - self.started < interval:
+                return None
+            routes, n_plus_one = self.routes, self.n_plus_one
+            self.reset()
+        return routes, n_plus_one
+
+
+registry = MetricsRegistry()
+
+
+def flush(interval=0):
+    """Write out the aggregates if they are at least interval seconds old."""
+    taken = registry.take(interval)
+    if taken is None or not taken[0]:
+        return
+    if settings.STORE_METRICS_BACKEND == "redis":
+        try:
+            return flush_to_redis(*taken)
+        except (NotImplementedError, RedisError):
+            logger.exception("Could not flush request metrics to redis, logging them instead")
+    flush_to_log(*taken)
+
+
+def flush_to_redis(routes, n_plus_one):
+    # Counters only ever grow, readers diff two snapshots for a rate
+    with get_redis_connection("default").pipeline(transaction=False) as pipe:
+        for route, histograms in routes.items():
+            key = f"{REDIS_KEY}:{route}"
+            pipe.sadd(f"{REDIS_KEY}:routes", route)
+            for name, histogram in histograms.items():
+                for label, count in zip(histogram.labels(), histogram.counts):
+                    if count:
+                        pipe.hincrby(key, f"{name}:{label}", count)
+                pipe.hincrbyfloat(key, f"{name}:sum", histogram.total)
+            pipe.hincrby(key, "requests", histograms["total_ms"].count)
+            if n_plus_one[route]:
+                pipe.hincrby(key, "n_plus_one", n_plus_one[route])
+        pipe.execute()
+
+
+def flush_to_log(routes, n_plus_one):
+    for route, histograms in sorted(routes.items()):
+        total, queries, db = histograms["total_ms"], histograms["queries"], histograms["db_ms"]
+        logger.info(
+            "%s: %s requests, p50 <= %s ms, p95 <= %s ms, p99 <= %s ms, "
+            "%s queries and %s ms in the database on average, "
+            "p99 wait for a pooled connection <= %s ms, %s with repeated queries",
+            route, total.count, total.percentile(50), total.percentile(95), total.percentile(99),
+            _average(queries), _average(db), _percentile(histograms["pool_wait_ms"], 99),
+            n_plus_one[route])
+
+
+def _average(histogram):
+    if not histogram.count:
+        return "n/a"
+    return f"{histogram.total / histogram.count:.1f}"
+
+
+def _percentile(histogram, p):
+    return histogram.percentile(p) if histogram.count else "n/a"
+
+
+def get_route(request):
+    """viewset.action of DRF views (HTTP method for plain APIViews), None otherwise."""
+    match = getattr(request, "resolver_match", None)
+    view_class = getattr(getattr(match, "func", None), "cls", None)
+    if view_class is None:
+        return None
+    actions = getattr(match.func, "actions", None) or {}
+    method = request.method.lower()
+    return f"{view_class.__name__}.{actions.get(method, method)}"
+
+
+class QueryMetrics:
+    """Database execute_wrapper counting and timing a request's queries."""
+    __slots__ = ("count", "time", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.time = 0.0
+        # The SQL still has its placeholders, so repeats of one statement
+        # with different parameters land on the same key
+        self.shapes = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time += perf_counter() - start
+            self.count += 1
+            self.shapes[sql] += 1
+
+
+def _start_recording(queries):
+    # Run in the request's worker thread, whose connection the ORM uses
+    connection.execute_wrappers.append(queries)
+    return thread_wait()
+
+
+def _stop_recording(queries):
+    connection.execute_wrappers.remove(queries)
+    return thread_wait()
+
+
+class RequestMetricsMiddleware:
+    """
+    Record the query count, database time, time waited for a pooled
+    connection (see core.db.pool), render time and total time of API
+    requests in histograms per viewset action, flushed every
+    STORE_METRICS_FLUSH_INTERVAL seconds, and warn about requests that run
+    one statement STORE_METRICS_N_PLUS_ONE_THRESHOLD times or more.
+
+    Render time is the renderer turning response.data into bytes. Building
+    response.data, serializer.data included, happens in the view and only
+    counts towards the total.
+
+    Queries run while a streaming response is consumed, after the
+    middleware returned, are not counted. Under ASGI a request's sync code
+    and ORM calls run in one worker thread (Django gives each request its
+    own ThreadSensitiveContext), the execute_wrapper is installed there.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.STORE_METRICS_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if random.random() >= settings.STORE_METRICS_SAMPLE_RATE:
+            return self.get_response(request)
+
+        queries = QueryMetrics()
+        waited = thread_wait()
+        start = perf_counter()
+        with connection.execute_wrapper(queries):
+            response = self.get_response(request)
+        total = perf_counter() - start
+
+        route = get_route(request)
+        if route is not None:
+            threshold = settings.STORE_METRICS_N_PLUS_ONE_THRESHOLD
+            registry.record(route, {
+                "queries": queries.count,
+                "db_ms": queries.time * 1000,
+                "pool_wait_ms": (thread_wait() - waited) * 1000,
+                "render_ms": getattr(request, "_metrics_render_time", 0) * 1000,
+                "total_ms": total * 1000,
+            }, [(sql, count) for sql, count in queries.shapes.items() if count >= threshold])
+        flush(settings.STORE_METRICS_FLUSH_INTERVAL)
+        return response
+
+    async def __acall__(self, request):
+        if random.random() >= settings.STORE_METRICS_SAMPLE_RATE:
+            return await self.get_response(request)
+
+        queries = QueryMetrics()
+        waited = await sync_to_async(_start_recording)(queries)
+        start = perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            total = perf_counter() - start
+            waited = await sync_to_async(_stop_recording)(queries) - waited
+
+        route = get_route(request)
+        if route is not None:
+            threshold = settings.STORE_METRICS_N_PLUS_ONE_THRESHOLD
+            registry.record(route, {
+                "queries": queries.count,
+                "db_ms": queries.time * 1000,
+                "pool_wait_ms": waited * 1000,
+                "render_ms": getattr(request, "_metrics_render_time", 0) * 1000,
+                "total_ms": total * 1000,
+            }, [(sql, count) for sql, count in queries.shapes.items() if count >= threshold])
+        if registry.is_due(settings.STORE_METRICS_FLUSH_INTERVAL):
+            await sync_to_async(flush)(settings.STORE_METRICS_FLUSH_INTERVAL)
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered (response.data to JSON, etc.) after the
+        # view returned, time that happens in between here and the callback
+        started = perf_counter()
+
+        def rendered(response):
+            request._metrics_render_time = perf_counter() - started
+        response.add_post_render_callback(rendered)
+        return response
@@ -0,0 +1,27 @@
+from django.db import migrations
+
+
+def add_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE store_product "
+        "ADD FULLTEXT INDEX store_product_search (title, description)")
+
+
+def remove_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "mysql":
+        return
+    schema_editor.execute(
+        "ALTER TABLE store_product DROP INDEX store_product_search")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0002_alter_product_last_update'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_fulltext_index, remove_fulltext_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def backfill_updated_at(apps, schema_editor):
+    # Existing carts were last active when created as far as we know, not
+    # when this migration ran
+    Cart = apps.get_model("store", "Cart")
+    Cart.objects.update(updated_at=models.F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0003_product_fulltext_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cart',
+            name='created_at',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_index=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:05
+
+from django.db import migrations, models
+
+
+def backfill_products_count(apps, schema_editor):
+    Collection = apps.get_model("store", "Collection")
+    Product = apps.get_model("store", "Product")
+    products_count = models.functions.Coalesce(models.Subquery(
+        Product.objects
+        .filter(collection_id=models.OuterRef("pk"))
+        .order_by()
+        .values("collection_id")
+        .annotate(count=models.Count("id"))
+        .values("count")), 0)
+    Collection.objects.update(products_count=products_count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0004_cart_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='collection',
+            name='products_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_products_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 4.2.30 on 2026-10-18 20:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0005_collection_products_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerStats',
+            fields=[
+                ('customer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='store.customer')),
+                ('orders_count', models.PositiveIntegerField(default=0)),
+                ('paid_orders_count', models.PositiveIntegerField(default=0)),
+                ('lifetime_spend', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('last_order_at', models.DateTimeField(null=True)),
+            ],
+        ),
+    ]
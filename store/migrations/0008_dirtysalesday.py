@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-18 21:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('store', '0007_dailyproductsales'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirtySalesDay',
+            fields=[
+                ('day', models.DateField(primary_key=True, serialize=False)),
+            ],
+        ),
+    ]
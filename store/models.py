@@ -1,15 +1,51 @@
+from datetime import datetime, time, timedelta
+from decimal import Decimal
 from uuid import uuid4
 from django.conf import settings
-from django.db import models
+from django.db import IntegrityError, connections, models, transaction
+from django.db.models import Case, Count, Exists, ExpressionWrapper, F, Max, OuterRef, Q, Subquery, Sum, Value, When
+from django.db.models.functions import Coalesce, Greatest, TruncDate
+from django.utils import timezone
 from django.core.validators import MinValueValidator, FileExtensionValidator
 
 from store.validators import validate_file_size
 
 
+class CollectionQuerySet(models.QuerySet):
+    def actual_products_count(self):
+        return Coalesce(Subquery(
+            Product.objects
+            .filter(collection_id=OuterRef("pk"))
+            .order_by()
+            .values("collection_id")
+            .annotate(count=Count("id"))
+            .values("count")), 0)
+
+    def reconcile_products_count(self):
+        """
+        Rewrite products_count where it drifted from the products table
+        (bulk writes skip the signals keeping it up to date); returns the
+        ids of the collections that were off.
+        """
+        drifted = list(self
+                       .annotate(actual_products_count=self.actual_products_count())
+                       .exclude(products_count=F("actual_products_count"))
+                       .values_list("id", flat=True))
+        if drifted:
+            self.model.objects \
+                .filter(pk__in=drifted) \
+                .update(products_count=self.actual_products_count())
+        return drifted
+
+
 class Collection(models.Model):
+    objects = CollectionQuerySet.as_manager()
+
     title = models.CharField(max_length=255)
     featured_product = models.ForeignKey(
         'Product', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    # Kept up to date by the Product signal handlers
+    products_count = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self) -> str:
         return self.title
@@ -23,7 +59,45 @@ class Promotion(models.Model):
     discount = models.FloatField()
 
 
+class ProductQuerySet(models.QuerySet):
+    def with_price_with_tax(self):
+        return self.annotate(price_with_tax=ExpressionWrapper(
+            F("price") * Product.TAX_RATE,
+            output_field=models.DecimalField(max_digits=9, decimal_places=3)))
+
+    def reserve_inventory(self, quantities):
+        """
+        Take {product_id: quantity} out of stock with one conditional UPDATE
+        that only touches rows with enough inventory left. Either every line
+        is reserved and None is returned, or nothing is and the result maps
+        the short product ids to what is still available. It is empty when
+        stock kept being released under both attempts.
+        """
+        requested = Case(
+            *[When(pk=pk, then=Value(quantity)) for pk, quantity in quantities.items()],
+            output_field=models.IntegerField())
+        for _ in range(2):
+            with transaction.atomic():
+                reserved = self \
+                    .filter(pk__in=quantities, inventory__gte=requested) \
+                    .update(inventory=F("inventory") - requested, last_update=timezone.now())
+                if reserved == len(quantities):
+                    return None
+                transaction.set_rollback(True)
+
+            available = dict(self.filter(pk__in=quantities).values_list("id", "inventory"))
+            shortages = {pk: available.get(pk, 0) for pk, quantity in quantities.items()
+                         if available.get(pk, 0) < quantity}
+            if shortages:
+                return shortages
+            # A concurrent checkout released stock since our UPDATE; try again
+        return shortages
+
+
 class Product(models.Model):
+    TAX_RATE = Decimal("1.1")
+
+    objects = ProductQuerySet.as_manager()
     title = models.CharField(max_length=55)
     slug = models.SlugField(max_length=50, null=True)
     description = models.TextField(blank=True, default="")
@@ -31,7 +105,7 @@ class Product(models.Model):
         default=0, validators=[MinValueValidator(0)])
     price = models.DecimalField(
         default=0, max_digits=6, decimal_places=2, validators=[MinValueValidator(1)])
-    last_update = models.DateField(auto_now=True)
+    last_update = models.DateTimeField(auto_now=True, db_index=True)
     collection = models.ForeignKey(
         Collection, on_delete=models.PROTECT, related_name="products")
     promotions = models.ManyToManyField(Promotion, blank=True)
@@ -101,7 +175,7 @@ class Order(models.Model):
         (FAILED_STATUS, "Failed")
     ]
 
-    placed_at = models.DateTimeField(auto_now_add=True)
+    placed_at = models.DateTimeField(auto_now_add=True, db_index=True)
     payment_status = models.CharField(
         max_length=1, choices=PAYMENT_STATUS_CHOICES, default=PENDING_STATUS)
     customer = models.ForeignKey(Customer, on_delete=models.PROTECT)
@@ -126,6 +200,73 @@ class Address(models.Model):
     customer = models.ForeignKey(Customer, on_delete=models.CASCADE)
 
 
+class CustomerStatsQuerySet(models.QuerySet):
+    def add(self, customer_id, **deltas):
+        """
+        Add deltas to a customer's counters (last_order_at= only ever moves
+        forward), creating the row on first use.
+        """
+        updates = {name: F(name) + delta for name, delta in deltas.items() if name != "last_order_at"}
+        if deltas.get("last_order_at") is not None:
+            updates["last_order_at"] = Coalesce(
+                Greatest("last_order_at", Value(deltas["last_order_at"])), Value(deltas["last_order_at"]))
+        if self.filter(customer_id=customer_id).update(**updates):
+            return
+        try:
+            with transaction.atomic():
+                self.create(customer_id=customer_id, **deltas)
+        except IntegrityError:
+            # Created concurrently
+            self.filter(customer_id=customer_id).update(**updates)
+
+    def rebuild(self, customer_ids):
+        """Recompute the rows of customer_ids from orders in bulk."""
+        orders = dict(
+            (row["customer_id"], row) for row in Order.objects
+            .filter(customer_id__in=customer_ids)
+            .order_by()
+            .values("customer_id")
+            .annotate(
+                orders_count=Count("id"),
+                paid_orders_count=Count("id", filter=Q(payment_status=Order.COMPLETE_STATUS)),
+                last_order_at=Max("placed_at")))
+        spend = dict(OrderItem.objects
+                     .filter(order__customer_id__in=customer_ids,
+                             order__payment_status=Order.COMPLETE_STATUS)
+                     .order_by()
+                     .values("order__customer_id")
+                     .annotate(spend=Sum(F("unit_price") * F("quantity")))
+                     .values_list("order__customer_id", "spend"))
+        stats = [
+            self.model(
+                customer_id=customer_id,
+                orders_count=orders.get(customer_id, {}).get("orders_count", 0),
+                paid_orders_count=orders.get(customer_id, {}).get("paid_orders_count", 0),
+                lifetime_spend=spend.get(customer_id) or 0,
+                last_order_at=orders.get(customer_id, {}).get("last_order_at"))
+            for customer_id in customer_ids
+        ]
+        self.bulk_create(
+            stats, update_conflicts=True, unique_fields=["customer"],
+            update_fields=["orders_count", "paid_orders_count", "lifetime_spend", "last_order_at"])
+        return len(stats)
+
+
+class CustomerStats(models.Model):
+    """
+    Per customer order totals, kept up to date by the Order signal
+    handlers; lifetime_spend only counts paid (complete) orders.
+    """
+    objects = CustomerStatsQuerySet.as_manager()
+
+    customer = models.OneToOneField(
+        Customer, on_delete=models.CASCADE, primary_key=True, related_name="stats")
+    orders_count = models.PositiveIntegerField(default=0)
+    paid_orders_count = models.PositiveIntegerField(default=0)
+    lifetime_spend = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+    last_order_at = models.DateTimeField(null=True)
+
+
 class OrderItem(models.Model):
     order = models.ForeignKey(
         Order, on_delete=models.PROTECT, related_name="items")
@@ -135,12 +276,87 @@ class OrderItem(models.Model):
     unit_price = models.DecimalField(max_digits=6, decimal_places=2)
 
 
+class CartQuerySet(models.QuerySet):
+    def with_total_price(self):
+        return self.annotate(total_price=Sum(ExpressionWrapper(
+            F("items__quantity") * F("items__product__price"),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2))))
+
+    def expired(self, now=None):
+        """
+        Carts idle for longer than STORE_CART_TTL, and carts that never got
+        an item within STORE_EMPTY_CART_TTL of being created.
+        """
+        now = now or timezone.now()
+        has_items = Exists(CartItem.objects.filter(cart_id=OuterRef("pk")))
+        return self.filter(
+            Q(updated_at__lt=now - settings.STORE_CART_TTL)
+            | Q(~has_items, created_at__lt=now - settings.STORE_EMPTY_CART_TTL))
+
+
 class Cart(models.Model):
+    objects = CartQuerySet.as_manager()
+
     id = models.UUIDField(primary_key=True, default=uuid4)
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+    # Last time an item was added, changed or removed
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
+
+
+# The most of one product a cart line holds, the largest value its
+# PositiveSmallIntegerField quantity can store on every backend
+MAX_CART_QUANTITY = 32767
+
+
+class CartItemQuerySet(models.QuerySet):
+    def with_total_price(self):
+        return self.annotate(total_price=ExpressionWrapper(
+            F("quantity") * F("product__price"),
+            output_field=models.DecimalField(max_digits=12, decimal_places=2)))
+
+    def add_quantities(self, cart_id, quantities):
+        """
+        Add {product_id: quantity} to a cart in a single INSERT ... SELECT
+        upsert, so concurrent adds to the same line never lose updates.
+        Lines are capped at MAX_CART_QUANTITY rather than overflowing.
+        Products or carts that do not exist simply select no rows; returns
+        the number of rows inserted or updated (0 when nothing matched).
+        """
+        connection = connections[self.db]
+        cart_table = connection.ops.quote_name(Cart._meta.db_table)
+        product_table = connection.ops.quote_name(Product._meta.db_table)
+        item_table = connection.ops.quote_name(self.model._meta.db_table)
+        db_cart_id = Cart._meta.pk.get_db_prep_value(cart_id, connection)
+
+        # SQLite's two-argument MIN() is the LEAST() of the other backends
+        least = "MIN" if connection.vendor == "sqlite" else "LEAST"
+        cases = " ".join("WHEN %s THEN %s" for _ in quantities)
+        placeholders = ", ".join("%s" for _ in quantities)
+        params = [value for item in quantities.items() for value in item]
+        params += [MAX_CART_QUANTITY] + list(quantities) + [db_cart_id, MAX_CART_QUANTITY]
+
+        sql = (f"INSERT INTO {item_table} (cart_id, product_id, quantity) "
+               f"SELECT c.id, p.id, {least}(CASE p.id {cases} END, %s) "
+               f"FROM {cart_table} c JOIN {product_table} p ON p.id IN ({placeholders}) "
+               f"WHERE c.id = %s ")
+        if connection.vendor == "mysql":
+            sql += "ON DUPLICATE KEY UPDATE quantity = LEAST(quantity + VALUES(quantity), %s)"
+        else:
+            sql += (f"ON CONFLICT (cart_id, product_id) "
+                    f"DO UPDATE SET quantity = {least}({item_table}.quantity + excluded.quantity, %s)")
+
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            added = cursor.rowcount
+        if added:
+            # Signals do not fire for the raw upsert
+            Cart.objects.using(self.db).filter(pk=cart_id).update(updated_at=timezone.now())
+        return added
 
 
 class CartItem(models.Model):
+    objects = CartItemQuerySet.as_manager()
+
     class Meta:
         unique_together = [["cart", "product"]]
 
@@ -152,3 +368,70 @@ class CartItem(models.Model):
 
     def __str__(self) -> str:
         return f"{self.product}"
+
+
+class DailyProductSalesQuerySet(models.QuerySet):
+    def rebuild(self, start, end):
+        """
+        Recompute the rows of days start..end (inclusive) from order items
+        of orders placed on them, failed payments excluded. Returns the
+        number of rows written.
+        """
+        tz = timezone.get_current_timezone()
+        since = datetime.combine(start, time.min, tzinfo=tz)
+        until = datetime.combine(end + timedelta(days=1), time.min, tzinfo=tz)
+        sales = OrderItem.objects \
+            .filter(order__placed_at__gte=since, order__placed_at__lt=until) \
+            .exclude(order__payment_status=Order.FAILED_STATUS) \
+            .order_by() \
+            .values("product_id", "product__collection_id", day=TruncDate("order__placed_at")) \
+            .annotate(units=Sum("quantity"),
+                      revenue=Sum(F("unit_price") * F("quantity")))
+        rows = [
+            self.model(day=row["day"], product_id=row["product_id"],
+                       collection_id=row["product__collection_id"],
+                       units=row["units"], revenue=row["revenue"])
+            for row in sales
+        ]
+        with transaction.atomic():
+            self.filter(day__gte=start, day__lte=end).delete()
+            self.bulk_create(rows, batch_size=1000)
+        return len(rows)
+
+    def mark_dirty(self, placed_at):
+        """Have rebuild_dirty() recompute the day of orders placed at placed_at."""
+        DirtySalesDay.objects.bulk_create(
+            [DirtySalesDay(day=timezone.localtime(placed_at).date())], ignore_conflicts=True)
+
+    def rebuild_dirty(self):
+        """Rebuild the days marked dirty and unmark them; returns the days."""
+        days = list(DirtySalesDay.objects.order_by("day").values_list("day", flat=True))
+        for day in days:
+            with transaction.atomic():
+                # Unmark first, so a change committed meanwhile marks it again
+                DirtySalesDay.objects.filter(day=day).delete()
+                self.rebuild(day, day)
+        return days
+
+
+class DailyProductSales(models.Model):
+    """Units sold and revenue per product and day, see rebuild()."""
+    objects = DailyProductSalesQuerySet.as_manager()
+
+    day = models.DateField()
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name="+")
+    collection = models.ForeignKey(Collection, on_delete=models.CASCADE, related_name="+")
+    units = models.PositiveIntegerField()
+    revenue = models.DecimalField(max_digits=14, decimal_places=2)
+
+    class Meta:
+        unique_together = [["day", "product"]]
+        indexes = [
+            models.Index(fields=["product", "day"]),
+            models.Index(fields=["collection", "day"]),
+        ]
+
+
+class DirtySalesDay(models.Model):
+    """A day whose orders changed since its DailyProductSales were built."""
+    day = models.DateField(primary_key=True)
@@ -1,5 +1,193 @@
-from rest_framework.pagination import PageNumberPagination
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
 
 
 class DefaultPagination(PageNumberPagination):
     page_size = 10
+
+
+def _find_in_plan(plan, keys):
+    if isinstance(plan, dict):
+        for key in keys:
+            if key in plan:
+                return plan[key]
+        plan = list(plan.values())
+    if isinstance(plan, list):
+        for item in plan:
+            found = _find_in_plan(item, keys)
+            if found is not None:
+                return found
+    return None
+
+
+class KeysetPagination(BasePagination):
+    """
+    Seek pagination over (ordering field, id), so page N costs the same
+    as page 1. Cursors are opaque and only valid for the ordering they
+    were issued for.
+
+    count_mode is "exact", "estimate" (the planner's row estimate, falling
+    back to an exact count where the database gives none) or "none". Clients
+    can pick one with ?count=.
+    """
+    page_size = 10
+    cursor_query_param = "cursor"
+    ordering_param = "ordering"
+    count_query_param = "count"
+    default_ordering = "id"
+    count_mode = "exact"
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.field, self.descending = self.get_ordering(request, view)
+        self.count = self.get_count(queryset, request)
+
+        cursor = self.decode_cursor(request)
+        backwards = cursor is not None and cursor["d"] == "p"
+        descending = self.descending != backwards
+        prefix = "-" if descending else ""
+        ordering = [prefix + self.field]
+        if self.field != "id":
+            ordering.append(prefix + "id")
+        queryset = queryset.order_by(*ordering)
+
+        if cursor is not None:
+            model_field = queryset.model._meta.get_field(self.field)
+            try:
+                value = model_field.to_python(cursor["v"])
+            except Exception:
+                raise NotFound(self.invalid_cursor_message)
+            if value is None:
+                raise NotFound(self.invalid_cursor_message)
+            lookup = "lt" if descending else "gt"
+            if self.field == "id":
+                queryset = queryset.filter(**{f"id__{lookup}": value})
+            else:
+                queryset = queryset.filter(
+                    Q(**{f"{self.field}__{lookup}": value})
+                    | Q(**{self.field: value, f"id__{lookup}": cursor["id"]}))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[:self.page_size]
+        if backwards:
+            results.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, cursor is not None
+
+        self.page = results
+        return results
+
+    def get_ordering(self, request, view):
+        ordering = request.query_params.get(self.ordering_param, "")
+        ordering = ordering.split(",")[0].strip()
+        allowed = set(getattr(view, "ordering_fields", None) or []) | {"id"}
+        if ordering.lstrip("-") in allowed:
+            return ordering.lstrip("-"), ordering.startswith("-")
+        default = getattr(view, "keyset_ordering", self.default_ordering)
+        return default.lstrip("-"), default.startswith("-")
+
+    def get_count(self, queryset, request):
+        mode = request.query_params.get(self.count_query_param, self.count_mode)
+        if mode == "none":
+            return None
+        if mode == "estimate":
+            estimate = self.estimate_count(queryset)
+            if estimate is not None:
+                return estimate
+        return queryset.count()
+
+    def estimate_count(self, queryset):
+        vendor = connections[queryset.db].vendor
+        if vendor not in ("mysql", "postgresql"):
+            return None
+        plan = json.loads(queryset.order_by().explain(format="json"))
+        rows = _find_in_plan(plan, ("rows_produced_per_join", "Plan Rows"))
+        return int(rows) if rows is not None else None
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            cursor = json.loads(urlsafe_b64decode(encoded.encode()))
+            ordering = ("-" if self.descending else "") + self.field
+            if cursor["o"] != ordering or cursor["d"] not in ("n", "p"):
+                raise ValueError
+            # The values go straight into filter()
+            if type(cursor["id"]) is not int or not isinstance(cursor["v"], str):
+                raise ValueError
+            return cursor
+        except (TypeError, ValueError, KeyError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, obj, direction):
+        # Pages may hold model instances or .values() rows
+        if isinstance(obj, dict):
+            value, pk = obj[self.field], obj["id"]
+        else:
+            value, pk = getattr(obj, self.field), obj.pk
+        cursor = {
+            "o": ("-" if self.descending else "") + self.field,
+            "v": value.isoformat() if hasattr(value, "isoformat") else str(value),
+            "id": pk,
+            "d": direction,
+        }
+        encoded = urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], "n")
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return replace_query_param(self.base_url, self.cursor_query_param, "")
+        return self.encode_cursor(self.page[0], "p")
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count": self.count,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "count": {"type": "integer", "nullable": True},
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+
+class KeysetPaginationMixin:
+    """
+    Switch a viewset to KeysetPagination when the client sends ?cursor=
+    (empty for the first page), keeping its default pagination otherwise.
+    """
+    keyset_pagination_class = KeysetPagination
+
+    @property
+    def paginator(self):
+        cursor_param = self.keyset_pagination_class.cursor_query_param
+        if not hasattr(self, "_paginator") and cursor_param in self.request.query_params:
+            self._paginator = self.keyset_pagination_class()
+        return super().paginator
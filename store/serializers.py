@@ -1,8 +1,13 @@
-from decimal import Decimal
-from django.db import transaction
+from datetime import timedelta
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
 from rest_framework import serializers
-from store.models import Customer, Order, OrderItem, Product, Collection, ProductImage, Review, Cart, CartItem
-from .signals import order_created
+from rest_framework.exceptions import NotFound
+from store.models import MAX_CART_QUANTITY, Customer, CustomerStats, Order, OrderItem, Product, Collection, ProductImage, Review, Cart, CartItem
+from .cache import invalidate_products, invalidate_version
+from .carts import get_cart_backend, parse_cart_id
+from .tasks import enqueue_order_created
 
 
 class CollectionSerializer(serializers.ModelSerializer):
@@ -41,7 +46,11 @@ class ProductSerializer(serializers.ModelSerializer):
     images = ProductImageSerializer(many=True, read_only=True)
 
     def get_price_with_tax(self, obj: Product):
-        return obj.price * Decimal(1.1)
+        # Annotated in SQL by Product.objects.with_price_with_tax(); only
+        # instances that were just created or updated miss it.
+        if hasattr(obj, "price_with_tax"):
+            return obj.price_with_tax
+        return obj.price * Product.TAX_RATE
 
     # def get_image(self, )
 
@@ -69,6 +78,8 @@ class CartItemSerializer(serializers.ModelSerializer):
     total_price = serializers.SerializerMethodField()
 
     def get_total_price(self, cart_item: CartItem):
+        if hasattr(cart_item, "total_price"):
+            return cart_item.total_price
         return cart_item.quantity * cart_item.product.price
 
     class Meta:
@@ -79,32 +90,108 @@ class CartItemSerializer(serializers.ModelSerializer):
         return CartItem.objects.create(cart_id=self.context.get("cart_id"), **validated_data)
 
 
+class BulkAddCartItemSerializer(serializers.ListSerializer):
+    """
+    Add many {product_id, quantity} lines to a cart with one product lookup
+    and one upsert. Repeated products are summed.
+    """
+    max_lines = 500
+
+    def get_quantities(self, lines):
+        quantities = {}
+        for line in lines:
+            product_id = line["product_id"]
+            quantities[product_id] = quantities.get(product_id, 0) + line.get("quantity", 1)
+        return quantities
+
+    def validate(self, lines):
+        if not lines:
+            raise serializers.ValidationError("No items were given.")
+        if len(lines) > self.max_lines:
+            raise serializers.ValidationError(f"At most {self.max_lines} items can be added at once.")
+
+        product_ids = set(self.get_quantities(lines))
+        missing = product_ids - set(Product.objects
+                                    .filter(pk__in=product_ids)
+                                    .values_list("id", flat=True))
+        if missing:
+            raise serializers.ValidationError(
+                {"product_id": [f"Invalid product id found: {product_id}" for product_id in sorted(missing)]})
+        too_many = [product_id for product_id, quantity in self.get_quantities(lines).items()
+                    if quantity > MAX_CART_QUANTITY]
+        if too_many:
+            raise serializers.ValidationError(
+                {"quantity": [f"At most {MAX_CART_QUANTITY} of product {product_id} can be added."
+                              for product_id in sorted(too_many)]})
+        return lines
+
+    def save(self, **kwargs):
+        cart_id = self.context.get("cart_id")
+        quantities = self.get_quantities(self.validated_data)
+
+        carts = get_cart_backend()
+        if not carts.uses_database:
+            if carts.add(cart_id, quantities) is None:
+                raise NotFound("No cart was found for the given id.")
+            return parse_cart_id(cart_id)
+
+        with transaction.atomic():
+            try:
+                added = CartItem.objects.add_quantities(cart_id, quantities)
+            except (DjangoValidationError, ValueError):
+                added = 0
+            # Products were checked in validate(), so nothing added means no cart
+            if not added:
+                raise NotFound("No cart was found for the given id.")
+            cart_id = Cart._meta.pk.to_python(cart_id)
+            invalidate_version("cart", cart_id)
+        return cart_id
+
+
 class AddCartItemSerializer(serializers.ModelSerializer):
     product_id = serializers.IntegerField()
 
     class Meta:
         model = CartItem
         fields = ["id", "product_id", "quantity"]
-
-    def validate_product_id(self, value):
-        if not Product.objects.filter(pk=value).exists():
-            raise serializers.ValidationError("Invalid product id found")
-        return value
+        extra_kwargs = {"quantity": {"max_value": MAX_CART_QUANTITY}}
+        list_serializer_class = BulkAddCartItemSerializer
 
     def save(self, **kwargs):
         cart_id = self.context.get("cart_id")
         product_id = self.validated_data.get("product_id")
-        quantity = self.validated_data.get("quantity")
+        quantity = self.validated_data.get("quantity", 1)
 
+        carts = get_cart_backend()
+        if not carts.uses_database:
+            return self.save_to_backend(carts, cart_id, product_id, quantity)
+
+        # The upsert only selects existing carts and products, so it doubles
+        # as the product id validation; the lookups below only run on failure.
         try:
-            cart_item = CartItem.objects.get(cart=cart_id, product=product_id)
-            cart_item.quantity += quantity
-            cart_item.save()
-            self.instance = cart_item
-        except CartItem.DoesNotExist:
-            # Create new CartItem object
-            self.instance = CartItem.objects.create(
-                cart_id=cart_id, **self.validated_data)
+            added = CartItem.objects.add_quantities(cart_id, {product_id: quantity})
+        except (DjangoValidationError, ValueError):
+            raise NotFound("No cart was found for the given id.")
+        if not added:
+            if not Cart.objects.filter(pk=cart_id).exists():
+                raise NotFound("No cart was found for the given id.")
+            raise serializers.ValidationError({"product_id": ["Invalid product id found"]})
+
+        self.instance = CartItem.objects.get(cart_id=cart_id, product_id=product_id)
+        invalidate_version("cart", self.instance.cart_id)
+        return self.instance
+
+    def save_to_backend(self, carts, cart_id, product_id, quantity):
+        lines = None
+        if Product.objects.filter(pk=product_id).exists():
+            lines = carts.add(cart_id, {product_id: quantity})
+        if lines is None:
+            if carts.count_items(cart_id) is None:
+                raise NotFound("No cart was found for the given id.")
+            raise serializers.ValidationError({"product_id": ["Invalid product id found"]})
+
+        line_id, quantity = lines[product_id]
+        self.instance = CartItem(id=line_id, cart_id=cart_id, product_id=product_id, quantity=quantity)
         return self.instance
 
 
@@ -112,6 +199,7 @@ class UpdateCartItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = CartItem
         fields = ["quantity"]
+        extra_kwargs = {"quantity": {"max_value": MAX_CART_QUANTITY}}
 
 
 class CartSerializer(serializers.ModelSerializer):
@@ -120,6 +208,9 @@ class CartSerializer(serializers.ModelSerializer):
     total_price = serializers.SerializerMethodField()
 
     def get_total_price(self, cart: Cart):
+        if hasattr(cart, "total_price"):
+            # Sum() over no items is NULL, which used to render as 0
+            return cart.total_price or 0
         return sum([item.quantity * item.product.price for item in cart.items.all()])
 
     class Meta:
@@ -135,6 +226,13 @@ class CustomerSerializer(serializers.ModelSerializer):
         fields = ["id", "user_id", "phone", "birth_date", "membership"]
 
 
+class CustomerStatsSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CustomerStats
+        fields = ["customer_id", "orders_count", "paid_orders_count",
+                  "lifetime_spend", "last_order_at"]
+
+
 class OrderItemSerializer(serializers.ModelSerializer):
     product = SimpleProductSerializer(read_only=True)
 
@@ -161,10 +259,11 @@ class CreateOrderSerializer(serializers.Serializer):
     cart_id = serializers.UUIDField()
 
     def validate_cart_id(self, cart_id):
-        if not Cart.objects.filter(pk=cart_id).exists():
+        items = get_cart_backend().count_items(cart_id)
+        if items is None:
             raise serializers.ValidationError(
                 "No card was found for the given id.")
-        elif not CartItem.objects.filter(cart_id=cart_id).count():
+        elif not items:
             raise serializers.ValidationError("The cart is empty.")
         return cart_id
 
@@ -172,14 +271,32 @@ class CreateOrderSerializer(serializers.Serializer):
         user_id = self.context["user_id"]
         cart_id = self.validated_data["cart_id"]
 
+        carts = get_cart_backend()
         with transaction.atomic():
             customer = Customer.objects\
                 .get(user_id=user_id)
-            order = Order.objects.create(customer=customer)
 
-            cart_items = CartItem.objects \
-                                 .select_related("product") \
-                                 .filter(cart_id=cart_id)
+            try:
+                carts.materialize(cart_id)
+            except IntegrityError:
+                # A concurrent checkout of the same cart wrote its rows first
+                raise serializers.ValidationError({"cart_id": ["The cart is already being checked out."]})
+
+            cart_items = list(CartItem.objects
+                              .select_related("product")
+                              .filter(cart_id=cart_id))
+            quantities = {item.product_id: item.quantity for item in cart_items}
+            shortages = Product.objects.reserve_inventory(quantities)
+            if shortages == {}:
+                raise serializers.ValidationError({"items": ["Stock changed while placing the order, please retry."]})
+            if shortages is not None:
+                raise serializers.ValidationError({"items": {
+                    str(product_id): [f"Only {available} left in stock, {quantities[product_id]} requested."]
+                    for product_id, available in shortages.items()
+                }})
+            invalidate_products(quantities, {item.product.collection_id for item in cart_items})
+
+            order = Order.objects.create(customer=customer)
             order_items = [
                 OrderItem(
                     order=order,
@@ -192,8 +309,10 @@ class CreateOrderSerializer(serializers.Serializer):
             OrderItem.objects.bulk_create(order_items)
 
             Cart.objects.filter(id=cart_id).delete()
+            transaction.on_commit(lambda: carts.discard(cart_id))
 
-            order_created.send_robust(self.__class__, order=order)
+            # Receivers run in celery, off the checkout path
+            transaction.on_commit(lambda: enqueue_order_created(order.id))
         return order
 
 
@@ -224,3 +343,26 @@ class CreateOrderSerializer(serializers.Serializer):
 
 #     # def getting_price_with_tax(self, obj: Product):
 #     #     return obj.price * Decimal(1.1)
+
+
+class SalesAnalyticsQuerySerializer(serializers.Serializer):
+    GROUPINGS = {
+        "day": ("day",),
+        "product": ("product_id", "product__title"),
+        "collection": ("collection_id", "collection__title"),
+    }
+
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+    group_by = serializers.ChoiceField(choices=list(GROUPINGS), default="day")
+    product = serializers.IntegerField(required=False)
+    collection = serializers.IntegerField(required=False)
+
+    def validate(self, attrs):
+        attrs.setdefault("end", timezone.localdate())
+        attrs.setdefault("start", attrs["end"] - timedelta(days=29))
+        if attrs["start"] > attrs["end"]:
+            raise serializers.ValidationError({"start": ["start must not be after end."]})
+        if (attrs["end"] - attrs["start"]).days >= 366:
+            raise serializers.ValidationError({"start": ["The range cannot be longer than a year."]})
+        return attrs
@@ -1,3 +1,8 @@
 from django.dispatch import Signal
 
+# Sent from a celery task once the order is committed, with order=
 order_created = Signal()
+
+# Same, for receivers that prefer orders= in batches of
+# STORE_ORDER_EVENTS_BATCH_SIZE or every STORE_ORDER_EVENTS_BATCH_INTERVAL seconds
+order_created_batch = Signal()
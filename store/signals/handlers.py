@@ -1,10 +1,223 @@
+from decimal import Decimal
 from django.dispatch import receiver
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
 from django.conf import settings
-from store.models import Customer
+from django.db.models import F, Sum
+from django.utils import timezone
+from store.cache import invalidate_products, invalidate_version
+from store.models import Cart, CartItem, Collection, Customer, CustomerStats, DailyProductSales, Order, OrderItem, Product, ProductImage, Promotion
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_customer_for_new_user(sender, **kwargs):
     if kwargs["created"]:
         Customer.objects.create(user=kwargs["instance"])
+
+
+@receiver(pre_save, sender=Product)
+def remember_previous_collection(sender, instance, **kwargs):
+    instance._previous_collection_id = None
+    if instance.pk is not None:
+        instance._previous_collection_id = Product.objects \
+            .filter(pk=instance.pk) \
+            .values_list("collection_id", flat=True) \
+            .first()
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+def invalidate_product(sender, instance, **kwargs):
+    collection_ids = [instance.collection_id]
+    previous_collection_id = getattr(instance, "_previous_collection_id", None)
+    if previous_collection_id is not None:
+        collection_ids.append(previous_collection_id)
+    invalidate_products([instance.pk], collection_ids)
+
+    # Collections expose products_count, which only moves when a product
+    # is created, deleted or changes collection.
+    if kwargs.get("created", True) or previous_collection_id != instance.collection_id:
+        invalidate_version("collections")
+
+
+def _add_to_products_count(collection_id, delta):
+    collections = Collection.objects.filter(pk=collection_id)
+    if delta < 0:
+        collections = collections.filter(products_count__gte=-delta)
+    collections.update(products_count=F("products_count") + delta)
+
+
+@receiver(post_save, sender=Product)
+def count_saved_product(sender, instance, created, **kwargs):
+    previous_collection_id = getattr(instance, "_previous_collection_id", None)
+    if created:
+        _add_to_products_count(instance.collection_id, 1)
+    elif previous_collection_id is not None and previous_collection_id != instance.collection_id:
+        _add_to_products_count(previous_collection_id, -1)
+        _add_to_products_count(instance.collection_id, 1)
+
+
+@receiver(post_delete, sender=Product)
+def count_deleted_product(sender, instance, **kwargs):
+    _add_to_products_count(instance.collection_id, -1)
+
+
+@receiver(pre_save, sender=Order)
+def remember_previous_payment_status(sender, instance, **kwargs):
+    instance._previous_payment_status = None
+    if instance.pk is not None:
+        instance._previous_payment_status = Order.objects \
+            .filter(pk=instance.pk) \
+            .values_list("payment_status", flat=True) \
+            .first()
+
+
+def _order_total(order):
+    return OrderItem.objects \
+        .filter(order=order) \
+        .aggregate(total=Sum(F("unit_price") * F("quantity")))["total"] or 0
+
+
+@receiver(post_save, sender=Order)
+def count_saved_order(sender, instance, created, **kwargs):
+    deltas = {}
+    if created:
+        deltas = {"orders_count": 1, "last_order_at": instance.placed_at}
+
+    was_paid = getattr(instance, "_previous_payment_status", None) == Order.COMPLETE_STATUS
+    is_paid = instance.payment_status == Order.COMPLETE_STATUS
+    if is_paid != was_paid:
+        sign = 1 if is_paid else -1
+        deltas["paid_orders_count"] = sign
+        deltas["lifetime_spend"] = sign * _order_total(instance)
+
+    if deltas:
+        CustomerStats.objects.add(instance.customer_id, **deltas)
+
+
+def _line_total(unit_price, quantity):
+    # Values assigned before save() keep their type, "2.50" included
+    return Decimal(unit_price) * int(quantity)
+
+
+def _add_line_spend(order_id, amount):
+    # Only complete orders count towards the spend
+    customer_id = Order.objects \
+        .filter(pk=order_id, payment_status=Order.COMPLETE_STATUS) \
+        .values_list("customer_id", flat=True) \
+        .first()
+    if customer_id is not None and amount:
+        CustomerStats.objects.add(customer_id, lifetime_spend=amount)
+
+
+@receiver(pre_save, sender=OrderItem)
+def remember_previous_line(sender, instance, **kwargs):
+    instance._previous_line = None
+    if instance.pk is not None:
+        instance._previous_line = OrderItem.objects \
+            .filter(pk=instance.pk) \
+            .values_list("order_id", "unit_price", "quantity") \
+            .first()
+
+
+@receiver(post_save, sender=OrderItem)
+def count_saved_order_item(sender, instance, **kwargs):
+    # An order saved as complete before its items (OrderAdmin's inlines),
+    # or edited once complete, gets its spend here
+    previous = getattr(instance, "_previous_line", None)
+    if previous is not None:
+        order_id, unit_price, quantity = previous
+        _add_line_spend(order_id, -_line_total(unit_price, quantity))
+    _add_line_spend(instance.order_id, _line_total(instance.unit_price, instance.quantity))
+
+
+@receiver(post_delete, sender=OrderItem)
+def count_deleted_order_item(sender, instance, **kwargs):
+    _add_line_spend(instance.order_id, -_line_total(instance.unit_price, instance.quantity))
+
+
+@receiver(post_save, sender=Order)
+def mark_order_sales_day(sender, instance, created, **kwargs):
+    # Checkout bulk-creates the items, so a new order marks its day here
+    if created or instance.payment_status != getattr(instance, "_previous_payment_status", None):
+        DailyProductSales.objects.mark_dirty(instance.placed_at)
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def mark_order_item_sales_day(sender, instance, **kwargs):
+    placed_at = Order.objects.filter(pk=instance.order_id).values_list("placed_at", flat=True).first()
+    if placed_at is not None:
+        DailyProductSales.objects.mark_dirty(placed_at)
+
+
+@receiver(post_delete, sender=Order)
+def count_deleted_order(sender, instance, **kwargs):
+    # Orders with items are protected, so there is no spend to take back
+    paid = instance.payment_status == Order.COMPLETE_STATUS
+    CustomerStats.objects.add(instance.customer_id, orders_count=-1,
+                              paid_orders_count=-1 if paid else 0)
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def invalidate_product_image(sender, instance, **kwargs):
+    # Images are part of the product payload, so they move its
+    # last_update (and with it the ETag / Last-Modified validators).
+    Product.objects \
+        .filter(pk=instance.product_id) \
+        .update(last_update=timezone.now())
+    collection_id = Product.objects \
+        .filter(pk=instance.product_id) \
+        .values_list("collection_id", flat=True) \
+        .first()
+    invalidate_products([instance.product_id], [collection_id])
+
+
+@receiver(post_save, sender=Collection)
+@receiver(post_delete, sender=Collection)
+def invalidate_collection(sender, instance, **kwargs):
+    invalidate_version("collections")
+
+
+@receiver(post_save, sender=CartItem)
+@receiver(post_delete, sender=CartItem)
+def invalidate_cart_item(sender, instance, origin=None, **kwargs):
+    # Deleting or checking out a cart cascades to its items, and
+    # invalidate_cart() already covers the cart itself
+    if isinstance(origin, Cart) or getattr(origin, "model", None) is Cart:
+        return
+    invalidate_version("cart", instance.cart_id)
+
+
+@receiver(post_delete, sender=Cart)
+def invalidate_cart(sender, instance, **kwargs):
+    invalidate_version("cart", instance.pk)
+
+
+def _invalidate_product_rows(products):
+    products = list(products.values_list("id", "collection_id"))
+    invalidate_products([product_id for product_id, _ in products],
+                        [collection_id for _, collection_id in products])
+
+
+@receiver(post_save, sender=Promotion)
+def invalidate_promotion(sender, instance, **kwargs):
+    _invalidate_product_rows(Product.objects.filter(promotions=instance))
+
+
+@receiver(pre_delete, sender=Promotion)
+def invalidate_deleted_promotion(sender, instance, **kwargs):
+    # The m2m rows are gone by post_delete, so collect the products first.
+    _invalidate_product_rows(Product.objects.filter(promotions=instance))
+
+
+@receiver(m2m_changed, sender=Product.promotions.through)
+def invalidate_product_promotions(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        invalidate_products([instance.pk], [instance.collection_id])
+    elif pk_set:
+        _invalidate_product_rows(Product.objects.filter(pk__in=pk_set))
+    else:
+        _invalidate_product_rows(Product.objects.filter(promotions=instance))
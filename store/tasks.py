@@ -0,0 +1,156 @@
+import logging
+import time
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django_redis import get_redis_connection
+from .cache import forget_versions
+from .models import Cart, CartItem, DailyProductSales, Order
+from .signals import order_created, order_created_batch
+
+
+logger = logging.getLogger(__name__)
+
+PENDING_BATCH_KEY = "store:order_created:pending"
+
+
+def _delivered_key(order_id):
+    return f"store:order_created:delivered:{order_id}"
+
+
+def _log_failures(responses, order_ids):
+    for receiver, response in responses:
+        if isinstance(response, Exception):
+            logger.error("order_created receiver %r failed for orders %s",
+                         receiver, order_ids, exc_info=response)
+
+
+def enqueue_order_created(order_id):
+    """Hand the order to the queue, called once the order is committed."""
+    try:
+        send_order_created.delay(order_id)
+    except Exception:
+        # The order is already saved, a broker outage must not turn it
+        # into a 500 for the customer.
+        logger.exception("Could not queue order_created for order %s", order_id)
+
+
+@shared_task(acks_late=True)
+def send_order_created(order_id):
+    # Celery delivers at least once (acks_late redelivers the task of a
+    # worker that died in it), so an order is only marked delivered once its
+    # receivers ran. Redeliveries racing the first one, or arriving while the
+    # cache is down (get() is then None), send again: receivers have to be
+    # idempotent.
+    if cache.get(_delivered_key(order_id)):
+        return
+    order = Order.objects.filter(pk=order_id).first()
+    if order is None:
+        return
+
+    _log_failures(order_created.send_robust(Order, order=order), [order_id])
+    if order_created_batch.has_listeners(Order):
+        queue_for_batch(order_id)
+    cache.set(_delivered_key(order_id), True,
+              timeout=settings.STORE_ORDER_EVENTS_DEDUP_TIMEOUT)
+
+
+def queue_for_batch(order_id):
+    try:
+        redis = get_redis_connection("default")
+    except NotImplementedError:
+        # Without redis there is nowhere to collect a batch
+        flush_order_created_batch.delay([order_id])
+        return
+
+    pending = redis.rpush(PENDING_BATCH_KEY, order_id)
+    if pending >= settings.STORE_ORDER_EVENTS_BATCH_SIZE:
+        flush_order_created_batch.delay()
+    elif pending == 1:
+        flush_order_created_batch.apply_async(
+            countdown=settings.STORE_ORDER_EVENTS_BATCH_INTERVAL)
+
+
+def _pop_pending_batch():
+    redis = get_redis_connection("default")
+    size = settings.STORE_ORDER_EVENTS_BATCH_SIZE
+    with redis.pipeline() as pipe:
+        pipe.lrange(PENDING_BATCH_KEY, 0, size - 1)
+        pipe.ltrim(PENDING_BATCH_KEY, size, -1)
+        pipe.llen(PENDING_BATCH_KEY)
+        order_ids, _, remaining = pipe.execute()
+    if remaining:
+        flush_order_created_batch.apply_async(
+            countdown=settings.STORE_ORDER_EVENTS_BATCH_INTERVAL)
+    return [int(order_id) for order_id in order_ids]
+
+
+@shared_task
+def flush_order_created_batch(order_ids=None):
+    if order_ids is None:
+        order_ids = _pop_pending_batch()
+    orders = list(Order.objects.filter(pk__in=order_ids).order_by("pk"))
+    if orders:
+        _log_failures(order_created_batch.send_robust(Order, orders=orders), order_ids)
+
+
+def _delete_rows(queryset):
+    """
+    DELETE the queryset's rows in one statement, without loading them for
+    signal handlers or cascades. QuerySet._raw_delete() is private API,
+    unchanged from Django 1.9 through 5.0 (the version Pipfile.lock pins);
+    check it when upgrading Django.
+    """
+    return queryset._raw_delete(queryset.db)
+
+
+def purge_expired_carts(chunk_size=None, pause=None, max_chunks=None, now=None):
+    """
+    Delete expired carts and their items chunk_size carts per transaction,
+    so no run holds locks on store_cart for long. Returns the number of
+    carts and items deleted.
+    """
+    chunk_size = chunk_size or settings.STORE_CART_PURGE_CHUNK_SIZE
+    pause = settings.STORE_CART_PURGE_PAUSE if pause is None else pause
+    max_chunks = settings.STORE_CART_PURGE_MAX_CHUNKS if max_chunks is None else max_chunks
+    expired = Cart.objects.expired(now)
+
+    purged = {"carts": 0, "items": 0}
+    chunks = 0
+    while not max_chunks or chunks < max_chunks:
+        selected = list(expired.values_list("id", flat=True)[:chunk_size])
+        if not selected:
+            break
+        with transaction.atomic():
+            # Lock the chunk and drop carts that got an item since the select
+            cart_ids = list(expired.select_for_update()
+                            .filter(id__in=selected)
+                            .values_list("id", flat=True))
+            # Raw deletes skip loading every row for the per-item signal
+            # handlers; all an expired cart leaves behind is its version key.
+            purged["items"] += _delete_rows(CartItem.objects.filter(cart_id__in=cart_ids))
+            purged["carts"] += _delete_rows(Cart.objects.filter(id__in=cart_ids))
+            transaction.on_commit(lambda cart_ids=cart_ids: forget_versions("cart", cart_ids))
+        chunks += 1
+        if len(selected) < chunk_size:
+            break
+        if pause:
+            time.sleep(pause)
+    return purged
+
+
+@shared_task
+def purge_expired_carts_task():
+    purged = purge_expired_carts()
+    logger.info("Purged %(carts)s expired carts and %(items)s cart items", purged)
+    return purged
+
+
+@shared_task
+def update_sales_rollups():
+    # The order signal handlers mark the days whose orders were placed or
+    # changed, however long ago they were placed
+    days = DailyProductSales.objects.rebuild_dirty()
+    logger.info("Rebuilt the sales rollups of %s days", len(days))
+    return len(days)
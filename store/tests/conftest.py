@@ -1,6 +1,30 @@
+import json
+import os
 import pytest
 from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
+from storefront.celery import celery
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def celery_eager():
+    # Run tasks in-process, there is no broker under test
+    celery.conf.task_always_eager = True
+    yield
+    celery.conf.task_always_eager = False
 
 
 @pytest.fixture
@@ -15,6 +39,36 @@ def authendicate_admin(api_client):
     return do_authendicate_admin
 
 
+query_counts_key = pytest.StashKey[dict]()
+
+
+@pytest.fixture(scope="session")
+def query_counts(request):
+    """
+    Query count per endpoint, filled by test_query_counts.py and written as
+    JSON to $STORE_QUERY_COUNTS if set, so counts can be diffed between commits.
+    """
+    return request.config.stash.setdefault(query_counts_key, {})
+
+
+@pytest.fixture
+def count_queries(api_client):
+    def do_count_queries(url):
+        with CaptureQueriesContext(connection) as queries:
+            response = api_client.get(url)
+        return response, len(queries)
+    return do_count_queries
+
+
+def pytest_sessionfinish(session):
+    path = os.environ.get("STORE_QUERY_COUNTS")
+    query_counts = session.config.stash.get(query_counts_key, {})
+    if path and query_counts:
+        with open(path, "w") as report:
+            json.dump(dict(sorted(query_counts.items())), report, indent=2)
+            report.write("\n")
+
+
 # @pytest.fixture(autouse=True)
 # def disable_warnings():
 #     import warnings
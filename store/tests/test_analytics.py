@@ -0,0 +1,114 @@
+from datetime import timedelta
+from decimal import Decimal
+from django.core.management import call_command
+from django.utils import timezone
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Collection, Customer, DailyProductSales, Order, OrderItem, Product
+from store.tasks import update_sales_rollups
+
+
+@pytest.fixture
+def place_order():
+    customer = Customer.objects.get(user=baker.make("core.User"))
+
+    def do_place_order(days_ago, product, quantity, unit_price, payment_status=Order.PENDING_STATUS):
+        order = baker.make(Order, customer=customer, payment_status=payment_status)
+        Order.objects.filter(pk=order.pk).update(
+            placed_at=timezone.now() - timedelta(days=days_ago))
+        baker.make(OrderItem, order=order, product=product,
+                   quantity=quantity, unit_price=unit_price)
+        return order
+    return do_place_order
+
+
+@pytest.mark.django_db
+class TestSalesRollups:
+    def test_if_orders_are_placed_rebuild_their_days(self, place_order):
+        product = baker.make(Product)
+        place_order(0, product, 2, "5.00")
+        place_order(0, product, 1, "5.00", payment_status=Order.FAILED_STATUS)
+        place_order(10, product, 3, "5.00")
+
+        days = update_sales_rollups()
+
+        today = timezone.localdate()
+        assert days == 2
+        assert list(DailyProductSales.objects.order_by("day").values_list("day", "units", "revenue")) == \
+            [(today - timedelta(days=10), 3, Decimal("15.00")), (today, 2, Decimal("10.00"))]
+
+    def test_if_old_order_payment_fails_update_its_day(self, place_order):
+        product = baker.make(Product)
+        order = place_order(10, product, 3, "5.00")
+        place_order(10, product, 1, "5.00")
+        update_sales_rollups()
+        order.refresh_from_db()
+
+        order.payment_status = Order.FAILED_STATUS
+        order.save()
+        update_sales_rollups()
+
+        assert list(DailyProductSales.objects.values_list("units", flat=True)) == [1]
+
+    def test_if_nothing_changed_rebuild_no_day(self, place_order):
+        place_order(10, baker.make(Product), 3, "5.00")
+        update_sales_rollups()
+
+        assert update_sales_rollups() == 0
+
+    def test_if_rollups_are_rebuilt_cover_every_day(self, place_order):
+        product = baker.make(Product)
+        place_order(0, product, 2, "5.00")
+        place_order(10, product, 3, "5.00")
+
+        call_command("rebuild_sales_rollups")
+
+        assert sorted(DailyProductSales.objects.values_list("units", flat=True)) == [2, 3]
+
+
+@pytest.mark.django_db
+class TestSalesAnalytics:
+    def test_if_user_is_not_admin_return_403(self, api_client, authendicate_admin):
+        authendicate_admin()
+
+        response = api_client.get("/store/analytics/sales/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_grouped_by_collection_return_totals(self, api_client, authendicate_admin, place_order):
+        authendicate_admin(True)
+        collection = baker.make(Collection, title="a")
+        first, second = baker.make(Product, collection=collection, _quantity=2)
+        place_order(1, first, 2, "5.00")
+        place_order(3, second, 1, "2.50")
+        place_order(40, second, 1, "2.50")
+        call_command("rebuild_sales_rollups")
+
+        response = api_client.get("/store/analytics/sales/", {"group_by": "collection"})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == [{
+            "collection_id": collection.id, "collection__title": "a",
+            "units": 3, "revenue": Decimal("12.50")}]
+
+    def test_if_grouped_by_day_return_range(self, api_client, authendicate_admin, place_order):
+        authendicate_admin(True)
+        product = baker.make(Product)
+        place_order(1, product, 2, "5.00")
+        place_order(3, product, 1, "5.00")
+        call_command("rebuild_sales_rollups")
+        today = timezone.localdate()
+
+        response = api_client.get("/store/analytics/sales/", {
+            "start": today - timedelta(days=2), "end": today, "product": product.id})
+
+        assert [(row["day"], row["units"]) for row in response.data["results"]] == \
+            [(today - timedelta(days=1), 2)]
+
+    def test_if_range_is_inverted_return_400(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+
+        response = api_client.get("/store/analytics/sales/", {"start": "2024-02-01", "end": "2024-01-01"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,102 @@
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from django.urls.resolvers import RegexPattern, URLResolver
+from rest_framework import status
+from rest_framework.throttling import AnonRateThrottle
+import pytest
+from model_bakery import baker
+from store import urls
+from store.async_views import with_async_reads
+from store.models import Cart, CartItem, Collection, Product, ProductImage
+from store.views import ProductViewSet
+
+
+resolver = URLResolver(RegexPattern(r"^/store/"), with_async_reads(urls.urlpatterns))
+
+
+def async_request(method, path, **extra):
+    path, _, query = path.partition("?")
+    request = getattr(RequestFactory(), method)(path, QUERY_STRING=query, **extra)
+    match = resolver.resolve(path)
+    request.resolver_match = match
+    return async_to_sync(match.func)(request, *match.args, **match.kwargs)
+
+
+@pytest.fixture
+def catalog():
+    collection = baker.make(Collection)
+    products = baker.make(Product, collection=collection, price="2.50", _quantity=12)
+    baker.make(Product, price="9.00")
+    baker.make(ProductImage, product=products[0], image="store/images/a.jpg")
+    cart = baker.make(Cart)
+    baker.make(CartItem, cart=cart, product=products[0], quantity=2)
+    return {"collection": collection.id, "product": products[0].id, "cart": cart.id}
+
+
+@pytest.mark.django_db
+class TestAsyncReads:
+    @pytest.mark.parametrize("path", [
+        "/store/products/",
+        "/store/products/?page=2",
+        "/store/products/?page=9",
+        "/store/products/?collection={collection}&ordering=-price",
+        "/store/products/?collection=abc",
+        "/store/products/{product}/",
+        "/store/products/0/",
+        "/store/products/abc/",
+        "/store/collections/",
+        "/store/collections/{collection}/",
+        "/store/collections/0/",
+        "/store/collections/abc/",
+        "/store/carts/{cart}/",
+        "/store/carts/00000000-0000-0000-0000-000000000000/",
+        "/store/carts/abc/",
+    ])
+    def test_if_read_is_async_return_same_response_as_sync(self, api_client, catalog, settings, path):
+        # Both render from the database rather than one reading the other's entry
+        settings.STORE_CACHE_ENABLED = False
+        path = path.format(**catalog)
+
+        expected = api_client.get(path)
+        response = async_request("get", path)
+
+        assert response.status_code == expected.status_code
+        assert response.content == expected.content
+        assert response.get("ETag") == expected.get("ETag")
+        assert response["Allow"] == expected["Allow"]
+
+    def test_if_etag_matches_return_304(self, catalog):
+        path = f"/store/products/{catalog['product']}/"
+        etag = async_request("get", path)["ETag"]
+
+        response = async_request("get", path, HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_product_list_is_cached_return_hit(self, catalog):
+        async_request("get", "/store/products/")
+
+        response = async_request("get", "/store/products/")
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_if_request_is_a_write_use_sync_view(self, catalog):
+        response = async_request("post", "/store/products/")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_token_is_invalid_use_sync_view(self, catalog):
+        response = async_request("get", "/store/products/", HTTP_AUTHORIZATION="JWT invalid")
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_if_viewset_is_throttled_return_429(self, catalog, monkeypatch):
+        class OnePerMinute(AnonRateThrottle):
+            rate = "1/min"
+        monkeypatch.setattr(ProductViewSet, "throttle_classes", [OnePerMinute])
+        async_request("get", "/store/products/")
+
+        response = async_request("get", f"/store/products/{catalog['product']}/")
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert "Retry-After" in response
@@ -0,0 +1,412 @@
+import os
+from datetime import timedelta
+from decimal import Decimal
+from threading import Thread
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django_redis import get_redis_connection
+from redis.exceptions import ConnectionError as RedisConnectionError
+from rest_framework import status
+from rest_framework.test import APIClient
+import pytest
+from model_bakery import baker
+from store.cache import get_version
+from store.models import MAX_CART_QUANTITY, Cart, CartItem, Product
+from store.tasks import purge_expired_carts
+
+
+@pytest.mark.django_db
+class TestRetrieveCart:
+    def test_if_carts_are_listed_return_405(self, api_client):
+        response = api_client.get("/store/carts/")
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_if_cart_is_empty_return_zero_total(self, api_client):
+        cart = baker.make(Cart)
+
+        response = api_client.get(f"/store/carts/{cart.id}/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"id": str(cart.id), "items": [], "total_price": 0}
+
+    def test_if_cart_has_items_return_totals(self, api_client):
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=baker.make(Product, price="2.50"), quantity=3)
+        baker.make(CartItem, cart=cart, product=baker.make(Product, price="1.25"), quantity=2)
+
+        response = api_client.get(f"/store/carts/{cart.id}/")
+
+        assert [item["total_price"] for item in response.data["items"]] == \
+            [Decimal("7.50"), Decimal("2.50")]
+        assert response.data["total_price"] == Decimal("10.00")
+
+    def test_if_cart_items_are_listed_return_line_totals(self, api_client):
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=baker.make(Product, price="2.50"), quantity=3)
+
+        response = api_client.get(f"/store/carts/{cart.id}/items/")
+
+        assert response.data[0]["total_price"] == Decimal("7.50")
+
+
+@pytest.mark.django_db
+class TestAddCartItem:
+    def test_if_product_is_new_return_201(self, api_client):
+        cart = baker.make(Cart)
+        product = baker.make(Product, price=10)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/",
+                                   {"product_id": product.id, "quantity": 2})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data == {"id": response.data["id"], "product_id": product.id, "quantity": 2}
+
+    def test_if_product_is_in_cart_add_quantity(self, api_client):
+        cart = baker.make(Cart)
+        item = baker.make(CartItem, cart=cart, product=baker.make(Product, price=10), quantity=2)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/",
+                                   {"product_id": item.product_id, "quantity": 3})
+
+        assert response.data["id"] == item.id
+        assert response.data["quantity"] == 5
+
+    def test_if_sum_is_above_max_quantity_cap_it(self, api_client):
+        cart = baker.make(Cart)
+        item = baker.make(CartItem, cart=cart, product=baker.make(Product, price=10),
+                          quantity=MAX_CART_QUANTITY - 1)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/",
+                                   {"product_id": item.product_id, "quantity": 5})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["quantity"] == MAX_CART_QUANTITY
+
+    def test_if_quantity_is_above_max_quantity_return_400(self, api_client):
+        cart = baker.make(Cart)
+        product = baker.make(Product, price=10)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/",
+                                   {"product_id": product.id, "quantity": MAX_CART_QUANTITY + 1})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["quantity"] is not None
+
+    def test_if_product_does_not_exist_return_400(self, api_client):
+        cart = baker.make(Cart)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/",
+                                   {"product_id": 1, "quantity": 1})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["product_id"] is not None
+
+    @pytest.mark.parametrize("cart_id", ["0b7c8f9e-0000-4000-8000-000000000000", "not-a-uuid"])
+    def test_if_cart_does_not_exist_return_404(self, api_client, cart_id):
+        product = baker.make(Product, price=10)
+
+        response = api_client.post(f"/store/carts/{cart_id}/items/",
+                                   {"product_id": product.id, "quantity": 1})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_item_is_added_invalidate_cart_etag(self, api_client, django_capture_on_commit_callbacks):
+        cart = baker.make(Cart)
+        product = baker.make(Product, price=10)
+        etag = api_client.get(f"/store/carts/{cart.id}/")["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            api_client.post(f"/store/carts/{cart.id}/items/", {"product_id": product.id, "quantity": 1})
+
+        assert api_client.get(f"/store/carts/{cart.id}/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentAddCartItem:
+    def test_if_many_threads_add_same_product_keep_every_update(self):
+        if connection.vendor == "sqlite":
+            pytest.skip("the in-memory sqlite test database locks whole tables")
+        cart = Cart.objects.create()
+        product = baker.make(Product, price=10)
+        threads, adds_per_thread = 8, 10
+        errors = []
+
+        def add_items():
+            client = APIClient()
+            try:
+                for _ in range(adds_per_thread):
+                    response = client.post(f"/store/carts/{cart.id}/items/",
+                                           {"product_id": product.id, "quantity": 1})
+                    if response.status_code != status.HTTP_201_CREATED:
+                        errors.append(response.status_code)
+            finally:
+                connection.close()
+
+        workers = [Thread(target=add_items) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert errors == []
+        assert CartItem.objects.get(cart=cart, product=product).quantity == threads * adds_per_thread
+
+
+@pytest.mark.django_db
+class TestBulkAddCartItems:
+    def test_if_lines_are_valid_return_cart(self, api_client):
+        cart = baker.make(Cart)
+        first = baker.make(Product, price=10)
+        second = baker.make(Product, price=5)
+        baker.make(CartItem, cart=cart, product=first, quantity=1)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/bulk/", [
+            {"product_id": first.id, "quantity": 2},
+            {"product_id": second.id, "quantity": 1},
+            {"product_id": second.id, "quantity": 3},
+        ], format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == str(cart.id)
+        assert {item["product"]["id"]: item["quantity"] for item in response.data["items"]} == \
+            {first.id: 3, second.id: 4}
+        assert response.data["total_price"] == Decimal("50.00")
+
+    def test_if_product_is_invalid_return_400_and_add_nothing(self, api_client):
+        cart = baker.make(Cart)
+        product = baker.make(Product)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/bulk/", [
+            {"product_id": product.id, "quantity": 1},
+            {"product_id": product.id + 1, "quantity": 1},
+        ], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["product_id"] == [f"Invalid product id found: {product.id + 1}"]
+        assert not CartItem.objects.filter(cart=cart).exists()
+
+    def test_if_summed_quantity_is_above_max_quantity_return_400(self, api_client):
+        cart = baker.make(Cart)
+        product = baker.make(Product)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/bulk/", [
+            {"product_id": product.id, "quantity": MAX_CART_QUANTITY},
+            {"product_id": product.id, "quantity": 1},
+        ], format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["quantity"] == [f"At most {MAX_CART_QUANTITY} of product {product.id} can be added."]
+        assert not CartItem.objects.filter(cart=cart).exists()
+
+    def test_if_data_is_not_a_list_return_400(self, api_client):
+        cart = baker.make(Cart)
+
+        response = api_client.post(f"/store/carts/{cart.id}/items/bulk/",
+                                   {"product_id": 1, "quantity": 1}, format="json")
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_if_cart_does_not_exist_return_404(self, api_client):
+        product = baker.make(Product)
+
+        response = api_client.post("/store/carts/6f1c1a5e-0000-4000-8000-000000000000/items/bulk/",
+                                   [{"product_id": product.id, "quantity": 1}], format="json")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestDeleteCart:
+    def test_if_cart_exists_return_204(self, api_client):
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, _quantity=2)
+
+        response = api_client.delete(f"/store/carts/{cart.id}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not CartItem.objects.filter(cart_id=cart.id).exists()
+
+    def test_if_cart_grows_query_count_stays_constant(self, api_client):
+        counts = []
+        for lines in (1, 10):
+            cart = baker.make(Cart)
+            baker.make(CartItem, cart=cart, _quantity=lines)
+
+            with CaptureQueriesContext(connection) as queries:
+                api_client.delete(f"/store/carts/{cart.id}/")
+
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+
+
+@pytest.mark.django_db
+class TestPurgeExpiredCarts:
+    def make_cart(self, created_days_ago, updated_days_ago, items=0):
+        cart = baker.make(Cart)
+        if items:
+            baker.make(CartItem, cart=cart, _quantity=items)
+        now = timezone.now()
+        Cart.objects.filter(pk=cart.pk).update(
+            created_at=now - timedelta(days=created_days_ago),
+            updated_at=now - timedelta(days=updated_days_ago))
+        return cart
+
+    def test_if_carts_expired_delete_them_in_chunks(self, settings):
+        settings.STORE_CART_TTL = timedelta(days=30)
+        settings.STORE_EMPTY_CART_TTL = timedelta(days=1)
+        idle = [self.make_cart(40, 31, items=2) for _ in range(3)]
+        empty = self.make_cart(2, 2)
+        active = self.make_cart(40, 1, items=1)
+        new = self.make_cart(0, 0)
+
+        purged = purge_expired_carts(chunk_size=2, pause=0)
+
+        assert purged == {"carts": 4, "items": 6}
+        assert set(Cart.objects.values_list("id", flat=True)) == {active.id, new.id}
+        assert not CartItem.objects.filter(cart__in=idle + [empty]).exists()
+
+    def test_if_cart_is_purged_drop_its_version(self, django_capture_on_commit_callbacks):
+        cart = self.make_cart(40, 31, items=1)
+        version = get_version("cart", cart.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            purge_expired_carts(pause=0)
+
+        assert get_version("cart", cart.id) != version
+
+    def test_if_max_chunks_is_reached_stop(self):
+        for _ in range(3):
+            self.make_cart(2, 2)
+
+        purged = purge_expired_carts(chunk_size=1, pause=0, max_chunks=2)
+
+        assert purged["carts"] == 2
+        assert Cart.objects.count() == 1
+
+    def test_if_item_is_added_update_cart_activity(self, api_client):
+        cart = self.make_cart(40, 31)
+        product = baker.make(Product)
+
+        api_client.post(f"/store/carts/{cart.id}/items/",
+                        {"product_id": product.id, "quantity": 1})
+
+        assert not Cart.objects.expired().filter(pk=cart.pk).exists()
+
+    def test_if_item_is_changed_update_cart_activity(self, api_client):
+        cart = self.make_cart(40, 31, items=1)
+        item = cart.items.get()
+
+        api_client.patch(f"/store/carts/{cart.id}/items/{item.id}/", {"quantity": 2})
+
+        assert not Cart.objects.expired().filter(pk=cart.pk).exists()
+
+    def test_if_item_is_removed_update_cart_activity(self, api_client):
+        cart = self.make_cart(40, 31, items=2)
+
+        api_client.delete(f"/store/carts/{cart.id}/items/{cart.items.first().id}/")
+
+        assert not Cart.objects.expired().filter(pk=cart.pk).exists()
+
+
+@pytest.fixture
+def redis_carts(settings):
+    settings.CACHES = {
+        "default": {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": os.environ.get("REDIS_TEST_URL", "redis://localhost:6379/3"),
+        }
+    }
+    settings.STORE_CART_BACKEND = "redis"
+    try:
+        get_redis_connection("default").ping()
+    except (NotImplementedError, RedisConnectionError):
+        pytest.skip("redis is not available")
+
+
+@pytest.mark.django_db
+@pytest.mark.usefixtures("redis_carts")
+class TestRedisCartBackend:
+    def test_if_cart_is_used_return_same_payloads_as_database(self, api_client, settings):
+        first = baker.make(Product, price="2.50")
+        second = baker.make(Product, price="1.25")
+
+        def run():
+            cart_id = api_client.post("/store/carts/").data["id"]
+            item = api_client.post(f"/store/carts/{cart_id}/items/",
+                                   {"product_id": first.id, "quantity": 2}).data
+            api_client.post(f"/store/carts/{cart_id}/items/bulk/", [
+                {"product_id": first.id, "quantity": 1},
+                {"product_id": second.id, "quantity": 4},
+            ], format="json")
+            patched = api_client.patch(f"/store/carts/{cart_id}/items/{item['id']}/",
+                                       {"quantity": 5}).data
+            cart = api_client.get(f"/store/carts/{cart_id}/").data
+            items = api_client.get(f"/store/carts/{cart_id}/items/").data
+            # Only the generated ids may differ
+            without_ids = lambda lines: [{**line, "id": None} for line in lines]
+            return patched, without_ids(cart["items"]), cart["total_price"], without_ids(items)
+
+        redis_payloads = run()
+        settings.STORE_CART_BACKEND = "database"
+
+        assert redis_payloads == run()
+
+    def test_if_sum_is_above_max_quantity_cap_it(self, api_client):
+        product = baker.make(Product)
+        cart_id = api_client.post("/store/carts/").data["id"]
+        api_client.post(f"/store/carts/{cart_id}/items/",
+                        {"product_id": product.id, "quantity": MAX_CART_QUANTITY})
+
+        response = api_client.post(f"/store/carts/{cart_id}/items/",
+                                   {"product_id": product.id, "quantity": 1})
+
+        assert response.data["quantity"] == MAX_CART_QUANTITY
+
+    def test_if_cart_is_being_checked_out_return_400(self, api_client):
+        product = baker.make(Product, inventory=5)
+        cart_id = api_client.post("/store/carts/").data["id"]
+        api_client.post(f"/store/carts/{cart_id}/items/", {"product_id": product.id, "quantity": 1})
+        # The rows another checkout of the cart has written
+        Cart.objects.create(id=cart_id)
+        api_client.force_authenticate(user=baker.make("core.User"))
+
+        response = api_client.post("/store/orders/", {"cart_id": cart_id})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["cart_id"] is not None
+
+    def test_if_item_is_removed_return_204(self, api_client):
+        product = baker.make(Product)
+        cart_id = api_client.post("/store/carts/").data["id"]
+        item = api_client.post(f"/store/carts/{cart_id}/items/",
+                               {"product_id": product.id, "quantity": 1}).data
+
+        response = api_client.delete(f"/store/carts/{cart_id}/items/{item['id']}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert api_client.get(f"/store/carts/{cart_id}/").data["items"] == []
+
+    def test_if_cart_does_not_exist_return_404(self, api_client):
+        product = baker.make(Product)
+
+        response = api_client.post("/store/carts/6f1c1a5e-0000-4000-8000-000000000000/items/",
+                                   {"product_id": product.id, "quantity": 1})
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_order_is_placed_materialize_cart(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, inventory=5)
+        cart_id = api_client.post("/store/carts/").data["id"]
+        api_client.post(f"/store/carts/{cart_id}/items/", {"product_id": product.id, "quantity": 2})
+        api_client.force_authenticate(user=baker.make("core.User"))
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = api_client.post("/store/orders/", {"cart_id": cart_id})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["items"][0]["quantity"] == 2
+        assert not Cart.objects.filter(pk=cart_id).exists()
+        assert api_client.get(f"/store/carts/{cart_id}/").status_code == status.HTTP_404_NOT_FOUND
@@ -2,7 +2,7 @@ from django.contrib.auth.models import User
 from rest_framework import status
 import pytest
 from model_bakery import baker
-from store.models import Collection
+from store.models import Collection, Product
 
 
 @pytest.fixture
@@ -91,3 +91,83 @@ class TestRetriveCollection:
 
 #         assert response.status_code == status.HTTP_201_CREATED
 #         assert response.data["id"] > 0
+
+
+@pytest.mark.django_db
+class TestCollectionProductsCount:
+    def test_if_products_are_created_and_deleted_update_count(self):
+        collection = baker.make(Collection)
+        products = baker.make(Product, collection=collection, _quantity=3)
+
+        products[0].delete()
+
+        collection.refresh_from_db()
+        assert collection.products_count == 2
+
+    def test_if_product_changes_collection_move_count(self):
+        old, new = baker.make(Collection, _quantity=2)
+        product = baker.make(Product, collection=old)
+
+        product.collection = new
+        product.save()
+
+        assert dict(Collection.objects.values_list("id", "products_count")) == {old.id: 0, new.id: 1}
+
+    def test_if_count_drifted_reconcile_it(self):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=2)
+        empty = baker.make(Collection)
+        Collection.objects.update(products_count=5)
+
+        drifted = Collection.objects.reconcile_products_count()
+
+        assert set(drifted) == {collection.id, empty.id}
+        assert dict(Collection.objects.values_list("id", "products_count")) == {collection.id: 2, empty.id: 0}
+
+    def test_if_collection_is_listed_return_stored_count(self, api_client):
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection, _quantity=2)
+
+        response = api_client.get(f"/store/collections/{collection.id}/")
+
+        assert response.data["products_count"] == 2
+
+
+@pytest.mark.django_db
+class TestDeleteCollection:
+    def test_if_collection_has_products_return_405(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        collection = baker.make(Collection)
+        baker.make(Product, collection=collection)
+
+        response = api_client.delete(f"/store/collections/{collection.id}/")
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+        assert Collection.objects.filter(pk=collection.id).exists()
+
+    def test_if_collection_is_empty_return_204(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        collection = baker.make(Collection)
+
+        response = api_client.delete(f"/store/collections/{collection.id}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_if_many_are_deleted_report_each_id(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        empty, used = baker.make(Collection, _quantity=2)
+        baker.make(Product, collection=used)
+
+        response = api_client.post("/store/collections/bulk-delete/",
+                                   {"ids": [empty.id, used.id, 0]}, format="json")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == {"deleted": [empty.id], "blocked": [used.id], "not_found": [0]}
+        assert list(Collection.objects.values_list("id", flat=True)) == [used.id]
+
+    def test_if_user_is_not_admin_bulk_delete_return_403(self, api_client, authendicate_admin):
+        authendicate_admin()
+
+        response = api_client.post("/store/collections/bulk-delete/", {"ids": [1]}, format="json")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
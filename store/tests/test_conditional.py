@@ -0,0 +1,113 @@
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Cart, CartItem, Collection, Product
+
+
+@pytest.mark.django_db
+class TestConditionalProducts:
+    def test_if_etag_matches_return_304(self, api_client):
+        baker.make(Product, price=10)
+        etag = api_client.get("/store/products/")["ETag"]
+
+        response = api_client.get("/store/products/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_if_product_is_updated_return_200(self, api_client):
+        product = baker.make(Product, price=10)
+        etag = api_client.get(f"/store/products/{product.id}/")["ETag"]
+
+        Product.objects.filter(pk=product.id).update(last_update="2100-01-01T00:00:00Z")
+        response = api_client.get(f"/store/products/{product.id}/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+
+    def test_if_product_is_deleted_list_etag_changes(self, api_client, django_capture_on_commit_callbacks):
+        products = baker.make(Product, price=10, _quantity=2)
+        etag = api_client.get("/store/products/")["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            Product.objects.filter(pk=products[0].id).delete()
+        response = api_client.get("/store/products/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+    def test_if_list_is_unchanged_return_304_without_queries(self, api_client, django_assert_num_queries):
+        baker.make(Product, price=10)
+        etag = api_client.get("/store/products/")["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get("/store/products/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_product_leaves_collection_list_etag_changes(self, api_client, django_capture_on_commit_callbacks):
+        collection = baker.make(Collection)
+        product = baker.make(Product, price=10, collection=collection)
+        path = f"/store/products/?collection={collection.id}"
+        first = api_client.get(path)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.collection = baker.make(Collection)
+            product.save()
+        response = api_client.get(path, HTTP_IF_NONE_MATCH=first["ETag"])
+
+        assert "Last-Modified" not in first
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"] == []
+
+    def test_if_not_modified_since_return_304(self, api_client):
+        product = baker.make(Product, price=10)
+        last_modified = api_client.get(f"/store/products/{product.id}/")["Last-Modified"]
+
+        response = api_client.get(f"/store/products/{product.id}/",
+                                  HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_product_does_not_exist_return_404(self, api_client):
+        response = api_client.get("/store/products/1/", HTTP_IF_NONE_MATCH="*")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.django_db
+class TestConditionalCollections:
+    def test_if_collection_is_renamed_return_200(self, api_client, django_capture_on_commit_callbacks):
+        collection = baker.make(Collection)
+        etag = api_client.get("/store/collections/")["ETag"]
+        assert api_client.get(
+            "/store/collections/", HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+
+        with django_capture_on_commit_callbacks(execute=True):
+            collection.title = "b"
+            collection.save()
+        response = api_client.get("/store/collections/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+
+
+@pytest.mark.django_db
+class TestConditionalCarts:
+    def test_if_cart_is_unchanged_return_304_without_queries(self, api_client, django_assert_num_queries):
+        cart = baker.make(Cart)
+        etag = api_client.get(f"/store/carts/{cart.id}/")["ETag"]
+
+        with django_assert_num_queries(0):
+            response = api_client.get(f"/store/carts/{cart.id}/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    def test_if_item_is_added_return_200(self, api_client, django_capture_on_commit_callbacks):
+        cart = baker.make(Cart)
+        etag = api_client.get(f"/store/carts/{cart.id}/")["ETag"]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            baker.make(CartItem, cart=cart, product=baker.make(Product, price=10), quantity=1)
+        response = api_client.get(f"/store/carts/{cart.id}/", HTTP_IF_NONE_MATCH=etag)
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data["items"]) == 1
@@ -0,0 +1,109 @@
+from decimal import Decimal
+from django.contrib.auth.models import Permission
+from django.core.management import call_command
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Customer, CustomerStats, Order, OrderItem
+
+
+@pytest.fixture
+def customer():
+    return Customer.objects.get(user=baker.make("core.User"))
+
+
+def place_order(customer, *lines):
+    order = baker.make(Order, customer=customer)
+    for unit_price, quantity in lines:
+        baker.make(OrderItem, order=order, unit_price=unit_price, quantity=quantity)
+    return order
+
+
+@pytest.mark.django_db
+class TestCustomerStats:
+    def test_if_orders_are_placed_and_paid_update_stats(self, customer):
+        first = place_order(customer, ("2.50", 2), ("1.00", 1))
+        place_order(customer, ("9.00", 1))
+
+        first.payment_status = Order.COMPLETE_STATUS
+        first.save()
+
+        stats = CustomerStats.objects.get(customer=customer)
+        assert (stats.orders_count, stats.paid_orders_count, stats.lifetime_spend) == (2, 1, Decimal("6.00"))
+        assert stats.last_order_at == Order.objects.latest("placed_at").placed_at
+
+    def test_if_paid_order_fails_take_spend_back(self, customer):
+        order = place_order(customer, ("5.00", 2))
+        Order.objects.filter(pk=order.pk).update(payment_status=Order.COMPLETE_STATUS)
+        CustomerStats.objects.rebuild([customer.id])
+
+        order.refresh_from_db()
+        order.payment_status = Order.FAILED_STATUS
+        order.save()
+
+        stats = CustomerStats.objects.get(customer=customer)
+        assert (stats.paid_orders_count, stats.lifetime_spend) == (0, Decimal("0.00"))
+
+    def test_if_complete_order_gets_items_later_count_them(self, customer):
+        order = baker.make(Order, customer=customer, payment_status=Order.COMPLETE_STATUS)
+        first = baker.make(OrderItem, order=order, unit_price="2.50", quantity=2)
+        baker.make(OrderItem, order=order, unit_price="1.00", quantity=1)
+
+        first.quantity = 4
+        first.save()
+
+        stats = CustomerStats.objects.get(customer=customer)
+        assert (stats.paid_orders_count, stats.lifetime_spend) == (1, Decimal("11.00"))
+
+    def test_if_item_of_complete_order_is_deleted_take_spend_back(self, customer):
+        order = place_order(customer, ("5.00", 2), ("1.00", 1))
+        order.payment_status = Order.COMPLETE_STATUS
+        order.save()
+
+        order.items.get(quantity=2).delete()
+
+        assert CustomerStats.objects.get(customer=customer).lifetime_spend == Decimal("1.00")
+
+    def test_if_stats_are_rebuilt_match_orders(self, customer):
+        order = place_order(customer, ("3.00", 3))
+        Order.objects.filter(pk=order.pk).update(payment_status=Order.COMPLETE_STATUS)
+        idle = Customer.objects.get(user=baker.make("core.User"))
+        CustomerStats.objects.all().delete()
+
+        call_command("rebuild_customer_stats", chunk_size=1)
+
+        assert dict(CustomerStats.objects.values_list("customer_id", "lifetime_spend")) == \
+            {customer.id: Decimal("9.00"), idle.id: Decimal("0.00")}
+
+
+@pytest.mark.django_db
+class TestCustomerHistory:
+    def test_if_user_has_permission_return_stats(self, api_client, customer):
+        place_order(customer, ("1.00", 1))
+        user = baker.make("core.User")
+        user.user_permissions.add(Permission.objects.get(codename="view_history"))
+        api_client.force_authenticate(user=user)
+
+        response = api_client.get(f"/store/customers/{customer.id}/history/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["customer_id"] == customer.id
+        assert response.data["orders_count"] == 1
+
+    def test_if_user_has_no_permission_return_403(self, api_client, customer):
+        api_client.force_authenticate(user=baker.make("core.User"))
+
+        response = api_client.get(f"/store/customers/{customer.id}/history/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+class TestCustomerMe:
+    def test_if_user_is_authenticated_return_own_customer(self, api_client, customer):
+        api_client.force_authenticate(user=customer.user)
+
+        response = api_client.get("/store/customers/me/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["id"] == customer.id
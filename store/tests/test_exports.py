@@ -0,0 +1,89 @@
+import csv
+import json
+from io import StringIO
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Collection, Customer, Order, OrderItem, Product
+
+
+def read_csv(response):
+    return list(csv.DictReader(StringIO(b"".join(response.streaming_content).decode())))
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in b"".join(response.streaming_content).splitlines()]
+
+
+@pytest.mark.django_db
+class TestProductExport:
+    def test_if_user_is_not_admin_return_403(self, api_client, authendicate_admin):
+        authendicate_admin()
+
+        response = api_client.get("/store/products/export/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_filtered_stream_matching_rows_in_chunks(self, api_client, authendicate_admin, settings):
+        settings.STORE_EXPORT_CHUNK_SIZE = 2
+        authendicate_admin(True)
+        collection = baker.make(Collection)
+        products = baker.make(Product, collection=collection, price="2.50", _quantity=5)
+        baker.make(Product)
+
+        response = api_client.get("/store/products/export/", {"collection": collection.id})
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "text/csv"
+        rows = read_csv(response)
+        assert [int(row["id"]) for row in rows] == [product.id for product in products]
+        assert rows[0]["price"] == "2.50"
+
+    def test_if_ndjson_is_asked_return_one_object_per_line(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        product = baker.make(Product, price="2.50")
+
+        response = api_client.get("/store/products/export/", {"as": "ndjson"})
+
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert read_ndjson(response) == [{
+            "id": product.id, "title": product.title, "slug": product.slug,
+            "description": product.description, "inventory": product.inventory, "price": "2.50",
+            "collection_id": product.collection_id, "last_update": product.last_update.isoformat()}]
+
+    def test_if_format_is_unknown_return_400(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+
+        response = api_client.get("/store/products/export/", {"as": "xml"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+
+@pytest.mark.django_db
+class TestOrderExport:
+    def test_if_user_is_not_admin_return_403(self, api_client):
+        api_client.force_authenticate(user=baker.make("core.User"))
+
+        response = api_client.get("/store/orders/export/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_filtered_by_status_return_its_items(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        customer = Customer.objects.get(user=baker.make("core.User"))
+        paid = baker.make(Order, customer=customer, payment_status=Order.COMPLETE_STATUS)
+        baker.make(OrderItem, order=paid, quantity=2, unit_price="1.50", _quantity=2)
+        baker.make(OrderItem, order=baker.make(Order, customer=customer))
+
+        response = api_client.get("/store/orders/export/", {"payment_status": "C", "as": "ndjson"})
+
+        rows = read_ndjson(response)
+        assert [row["order_id"] for row in rows] == [paid.id, paid.id]
+        assert rows[0]["unit_price"] == "1.50"
+
+    def test_if_status_is_invalid_return_400(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+
+        response = api_client.get("/store/orders/export/", {"payment_status": "X"})
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,39 @@
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+import pytest
+from store.models import Cart, Collection, Customer, CustomerStats, Order, Product
+
+
+def generate_data(**options):
+    call_command("generate_data", stdout=StringIO(), collections=2, products=20,
+                 customers=5, orders=10, carts=3, **options)
+
+
+@pytest.mark.django_db
+class TestGenerateData:
+    def test_if_counts_are_given_generate_them(self):
+        generate_data()
+
+        assert (Collection.objects.count(), Product.objects.count(), Customer.objects.count(),
+                Order.objects.count(), Cart.objects.count()) == (2, 20, 5, 10, 3)
+        assert sum(Collection.objects.values_list("products_count", flat=True)) == 20
+        assert CustomerStats.objects.count() == 5
+
+    def test_if_seed_is_the_same_generate_the_same_data(self):
+        def generate_catalog():
+            call_command("generate_data", stdout=StringIO(), seed=7, collections=2,
+                         products=20, customers=0, orders=0, carts=0)
+            return list(Product.objects.order_by("pk").values_list("title", "price", "inventory"))
+        first = generate_catalog()
+        Product.objects.all().delete()
+
+        second = generate_catalog()
+
+        assert first == second
+
+    def test_if_seed_was_used_raise_error(self):
+        generate_data()
+
+        with pytest.raises(CommandError):
+            generate_data()
@@ -0,0 +1,74 @@
+import json
+from decimal import Decimal
+from io import StringIO
+from django.core.management import call_command
+import pytest
+from model_bakery import baker
+from store.models import Collection, Product
+
+
+HEADER = "id,title,slug,description,inventory,price,collection_id\n"
+
+
+@pytest.fixture
+def import_catalog(tmp_path):
+    def do_import_catalog(content, name="products.csv", **options):
+        path = tmp_path / name
+        path.write_text(content)
+        stdout, stderr = StringIO(), StringIO()
+        call_command("import_catalog", str(path), stdout=stdout, stderr=stderr, **options)
+        return path, stdout.getvalue(), stderr.getvalue()
+    return do_import_catalog
+
+
+@pytest.mark.django_db
+class TestImportCatalog:
+    def test_if_rows_are_valid_upsert_them(self, import_catalog):
+        collection = baker.make(Collection)
+        baker.make(Product, id=1, title="old", collection=collection)
+
+        _, stdout, _ = import_catalog(
+            HEADER
+            + f"1,new,new,,5,2.50,{collection.id}\n"
+            + f"2,other,other,,1,3.00,{collection.id}\n",
+            batch_size=1)
+
+        assert dict(Product.objects.values_list("id", "title")) == {1: "new", 2: "other"}
+        assert Product.objects.get(id=1).price == Decimal("2.50")
+        collection.refresh_from_db()
+        assert collection.products_count == 2
+        assert "rows/s" in stdout
+
+    def test_if_rows_are_invalid_skip_and_report_them(self, import_catalog):
+        collection = baker.make(Collection)
+
+        _, _, stderr = import_catalog(
+            HEADER
+            + f"1,ok,ok,,5,2.50,{collection.id}\n"
+            + f"2,negative,negative,,-1,2.50,{collection.id}\n"
+            + "3,orphan,orphan,,1,2.50,999999\n"
+            + f"4,{'x' * 60},long,,1,2.50,{collection.id}\n")
+
+        assert list(Product.objects.values_list("id", flat=True)) == [1]
+        assert "Line 3" in stderr and "Line 4" in stderr and "Line 5" in stderr
+
+    def test_if_checkpoint_exists_resume_after_it(self, import_catalog, tmp_path):
+        collection = baker.make(Collection)
+        content = "".join(
+            json.dumps({"id": pk, "title": f"p{pk}", "slug": f"p{pk}", "inventory": 1, "price": "2.00",
+                        "collection_id": collection.id}) + "\n"
+            for pk in range(1, 5))
+        path = tmp_path / "products.ndjson"
+        path.write_text(content)
+        (tmp_path / "products.ndjson.checkpoint").write_text(json.dumps(
+            {"path": str(path), "size": path.stat().st_size, "rows": 2}))
+
+        import_catalog(content, name="products.ndjson")
+
+        assert list(Product.objects.values_list("id", flat=True)) == [3, 4]
+        assert not (tmp_path / "products.ndjson.checkpoint").exists()
+
+    def test_if_feed_has_collections_upsert_them(self, import_catalog):
+        import_catalog("id,title\n1,Flowers\n2,Grocery\n", name="collections.csv", model="collection")
+
+        assert dict(Collection.objects.values_list("id", "title")) == {1: "Flowers", 2: "Grocery"}
@@ -0,0 +1,94 @@
+import logging
+from asgiref.sync import ThreadSensitiveContext, async_to_sync, sync_to_async
+from django.db import connection
+from django.http import HttpResponse
+from django.test import RequestFactory
+from django.urls import resolve
+import pytest
+from model_bakery import baker
+from store.middleware import Histogram, RequestMetricsMiddleware, flush, registry
+from store.models import Product
+
+
+@pytest.fixture(autouse=True)
+def metrics(settings):
+    settings.STORE_METRICS_FLUSH_INTERVAL = 60
+    registry.take()
+    yield registry
+    registry.take()
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+    def test_if_api_is_requested_record_route(self, api_client, metrics):
+        baker.make(Product)
+
+        api_client.get("/store/products/")
+
+        histograms = metrics.routes["ProductViewSet.list"]
+        assert histograms["total_ms"].count == 1
+        assert histograms["queries"].total > 0
+        assert histograms["render_ms"].total > 0
+
+    def test_if_query_repeats_warn_about_n_plus_one(self, settings, metrics, caplog):
+        settings.STORE_METRICS_N_PLUS_ONE_THRESHOLD = 3
+        request = RequestFactory().get("/store/collections/")
+        request.resolver_match = resolve("/store/collections/")
+
+        def get_response(request):
+            with connection.cursor() as cursor:
+                for n in range(3):
+                    cursor.execute("SELECT %s", [n])
+            return HttpResponse()
+
+        with caplog.at_level(logging.WARNING, logger="store.middleware"):
+            RequestMetricsMiddleware(get_response)(request)
+
+        assert metrics.n_plus_one["CollectionViewSet.list"] == 1
+        assert "Possible N+1 in CollectionViewSet.list" in caplog.text
+
+    def test_if_request_is_async_record_queries(self, settings, metrics, caplog):
+        settings.STORE_METRICS_N_PLUS_ONE_THRESHOLD = 3
+        request = RequestFactory().get("/store/collections/")
+        request.resolver_match = resolve("/store/collections/")
+
+        def query(n):
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT %s", [n])
+
+        async def get_response(request):
+            for n in range(3):
+                await sync_to_async(query)(n)
+            return HttpResponse()
+
+        async def handle(request):
+            # Like django.core.handlers.asgi.ASGIHandler
+            async with ThreadSensitiveContext():
+                return await RequestMetricsMiddleware(get_response)(request)
+
+        with caplog.at_level(logging.WARNING, logger="store.middleware"):
+            async_to_sync(handle)(request)
+
+        histograms = metrics.routes["CollectionViewSet.list"]
+        assert histograms["queries"].total == 3
+        assert histograms["db_ms"].count == 1
+        assert "Possible N+1 in CollectionViewSet.list" in caplog.text
+
+    def test_if_interval_passed_flush_to_log(self, api_client, settings, caplog):
+        api_client.get("/store/collections/")
+
+        with caplog.at_level(logging.INFO, logger="store.middleware"):
+            flush()
+
+        assert "CollectionViewSet.list: 1 requests" in caplog.text
+
+
+class TestHistogram:
+    def test_if_values_are_added_return_bucket_percentiles(self):
+        histogram = Histogram((1, 10, 100))
+
+        for value in (0.5, 5, 5, 50, 500):
+            histogram.add(value)
+
+        assert (histogram.percentile(20), histogram.percentile(60), histogram.percentile(100)) == \
+            (1, 10, float("inf"))
@@ -0,0 +1,211 @@
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.cache import get_version
+from store.carts import DatabaseCartBackend
+from store.models import Cart, CartItem, Customer, Order, Product, ProductQuerySet
+from store.signals import order_created, order_created_batch
+from store.tasks import send_order_created
+
+
+@pytest.fixture
+def create_order(api_client):
+    def do_create_order(cart):
+        api_client.force_authenticate(user=baker.make("core.User"))
+        return api_client.post("/store/orders/", {"cart_id": str(cart.id)})
+    return do_create_order
+
+
+@pytest.mark.django_db
+class TestCreateOrder:
+    def test_if_inventory_is_enough_decrement_it(self, create_order, django_capture_on_commit_callbacks):
+        cart = baker.make(Cart)
+        first = baker.make(Product, inventory=5)
+        second = baker.make(Product, inventory=2)
+        baker.make(CartItem, cart=cart, product=first, quantity=3)
+        baker.make(CartItem, cart=cart, product=second, quantity=2)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            response = create_order(cart)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert dict(Product.objects.filter(pk__in=[first.id, second.id])
+                    .values_list("id", "inventory")) == {first.id: 2, second.id: 0}
+        assert not Cart.objects.filter(pk=cart.id).exists()
+
+    def test_if_cart_grows_query_count_stays_constant(self, create_order):
+        counts = []
+        for lines in (1, 10):
+            cart = baker.make(Cart)
+            for product in baker.make(Product, inventory=5, _quantity=lines):
+                baker.make(CartItem, cart=cart, product=product, quantity=1)
+
+            with CaptureQueriesContext(connection) as queries:
+                response = create_order(cart)
+
+            assert response.status_code == status.HTTP_201_CREATED
+            counts.append(len(queries))
+
+        assert counts[0] == counts[1]
+
+    def test_if_inventory_is_short_return_400_per_line(self, create_order):
+        cart = baker.make(Cart)
+        enough = baker.make(Product, inventory=5)
+        short = baker.make(Product, inventory=1)
+        baker.make(CartItem, cart=cart, product=enough, quantity=3)
+        baker.make(CartItem, cart=cart, product=short, quantity=2)
+
+        response = create_order(cart)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert list(response.data["items"]) == [str(short.id)]
+        assert dict(Product.objects.filter(pk__in=[enough.id, short.id])
+                    .values_list("id", "inventory")) == {enough.id: 5, short.id: 1}
+        assert not Order.objects.exists()
+        assert Cart.objects.filter(pk=cart.id).exists()
+
+    def test_if_cart_is_materialized_concurrently_return_400(self, create_order, monkeypatch):
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=baker.make(Product, inventory=5), quantity=1)
+
+        def materialize(self, cart_id):
+            raise IntegrityError("UNIQUE constraint failed: store_cart.id")
+        monkeypatch.setattr(DatabaseCartBackend, "materialize", materialize)
+
+        response = create_order(cart)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data["cart_id"] == ["The cart is already being checked out."]
+        assert not Order.objects.exists()
+
+    def test_if_order_is_created_bump_product_version(self, create_order, django_capture_on_commit_callbacks):
+        cart = baker.make(Cart)
+        product = baker.make(Product, inventory=5)
+        baker.make(CartItem, cart=cart, product=product, quantity=1)
+        version = get_version("product", product.id)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            create_order(cart)
+
+        assert get_version("product", product.id) != version
+
+
+@pytest.mark.django_db
+class TestReserveInventory:
+    def test_if_some_lines_are_short_return_only_them(self):
+        enough = baker.make(Product, inventory=5)
+        short = baker.make(Product, inventory=1)
+
+        shortages = Product.objects.reserve_inventory({enough.id: 3, short.id: 2})
+
+        assert shortages == {short.id: 1}
+
+    def test_if_stock_is_released_after_update_retry_once(self, monkeypatch):
+        product = baker.make(Product, inventory=5)
+        update = ProductQuerySet.update
+        calls = []
+
+        def update_after_release(queryset, **kwargs):
+            # The first UPDATE runs as if a concurrent checkout still held the stock
+            calls.append(kwargs)
+            return 0 if len(calls) == 1 else update(queryset, **kwargs)
+        monkeypatch.setattr(ProductQuerySet, "update", update_after_release)
+
+        shortages = Product.objects.reserve_inventory({product.id: 2})
+
+        assert shortages is None
+        assert len(calls) == 2
+        assert Product.objects.get(pk=product.id).inventory == 3
+
+    def test_if_stock_keeps_changing_return_no_lines(self, monkeypatch):
+        product = baker.make(Product, inventory=5)
+        monkeypatch.setattr(ProductQuerySet, "update", lambda queryset, **kwargs: 0)
+
+        shortages = Product.objects.reserve_inventory({product.id: 2})
+
+        assert shortages == {}
+
+
+@pytest.mark.django_db
+class TestOrderCreatedEvents:
+    def test_if_order_is_created_send_after_commit(self, create_order, django_capture_on_commit_callbacks):
+        received = []
+        receiver = lambda sender, order, **kwargs: received.append(order.id)
+        order_created.connect(receiver)
+        cart = baker.make(Cart)
+        baker.make(CartItem, cart=cart, product=baker.make(Product, inventory=5), quantity=1)
+
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                response = create_order(cart)
+                assert received == []
+        finally:
+            order_created.disconnect(receiver)
+
+        assert received == [response.data["id"]]
+
+    def test_if_order_is_delivered_twice_send_once(self):
+        received = []
+        receiver = lambda sender, order, **kwargs: received.append(order.id)
+        order_created.connect(receiver)
+        order = baker.make(Order, customer=Customer.objects.get(user=baker.make("core.User")))
+
+        try:
+            send_order_created(order.id)
+            send_order_created(order.id)
+        finally:
+            order_created.disconnect(receiver)
+
+        assert received == [order.id]
+
+    def test_if_first_delivery_fails_send_on_redelivery(self, monkeypatch):
+        received = []
+        receiver = lambda sender, order, **kwargs: received.append(order.id)
+        order_created.connect(receiver)
+        order = baker.make(Order, customer=Customer.objects.get(user=baker.make("core.User")))
+        send_robust = order_created.send_robust
+
+        def worker_dies(*args, **kwargs):
+            raise SystemExit()
+
+        try:
+            monkeypatch.setattr(order_created, "send_robust", worker_dies)
+            with pytest.raises(SystemExit):
+                send_order_created(order.id)
+            monkeypatch.setattr(order_created, "send_robust", send_robust)
+            send_order_created(order.id)
+        finally:
+            order_created.disconnect(receiver)
+
+        assert received == [order.id]
+
+    def test_if_cache_is_down_still_send(self, monkeypatch):
+        received = []
+        receiver = lambda sender, order, **kwargs: received.append(order.id)
+        order_created.connect(receiver)
+        order = baker.make(Order, customer=Customer.objects.get(user=baker.make("core.User")))
+        # What the redis cache returns with DJANGO_REDIS_IGNORE_EXCEPTIONS
+        monkeypatch.setattr("store.tasks.cache.get", lambda *args, **kwargs: None)
+        monkeypatch.setattr("store.tasks.cache.set", lambda *args, **kwargs: None)
+
+        try:
+            send_order_created(order.id)
+        finally:
+            order_created.disconnect(receiver)
+
+        assert received == [order.id]
+
+    def test_if_batch_receiver_is_connected_send_orders(self):
+        received = []
+        receiver = lambda sender, orders, **kwargs: received.append([order.id for order in orders])
+        order_created_batch.connect(receiver)
+        order = baker.make(Order, customer=Customer.objects.get(user=baker.make("core.User")))
+
+        try:
+            send_order_created(order.id)
+        finally:
+            order_created_batch.disconnect(receiver)
+
+        assert received == [[order.id]]
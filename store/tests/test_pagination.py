@@ -0,0 +1,107 @@
+import json
+from base64 import urlsafe_b64encode
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Product
+
+
+def walk(api_client, url):
+    pages = []
+    while url:
+        response = api_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        pages.append(response.data)
+        url = response.data["next"]
+    return pages
+
+
+@pytest.mark.django_db
+class TestKeysetPagination:
+    def test_if_cursor_is_not_sent_use_page_numbers(self, api_client):
+        baker.make(Product, price=10, _quantity=3)
+
+        response = api_client.get("/store/products/")
+
+        assert response.data["next"] is None
+        assert response.data["count"] == 3
+
+    def test_if_walking_forward_return_every_product_once(self, api_client):
+        products = baker.make(Product, price=10, _quantity=25)
+
+        pages = walk(api_client, "/store/products/?cursor=")
+
+        ids = [item["id"] for page in pages for item in page["results"]]
+        assert ids == sorted(product.id for product in products)
+        assert len(pages) == 3
+        assert pages[0]["previous"] is None
+        assert pages[0]["count"] == 25
+
+    def test_if_ordering_has_ties_use_id_as_tiebreaker(self, api_client):
+        for price in [5, 5, 5, 1, 9, 5, 5, 5, 5, 5, 5, 5, 3]:
+            baker.make(Product, price=price)
+
+        pages = walk(api_client, "/store/products/?cursor=&ordering=-price")
+
+        rows = [(item["price"], item["id"]) for page in pages for item in page["results"]]
+        assert rows == sorted(rows, key=lambda row: (-row[0], -row[1]))
+        assert len(rows) == 13
+
+    def test_if_walking_back_return_previous_page(self, api_client):
+        baker.make(Product, price=10, _quantity=25)
+        first = api_client.get("/store/products/?cursor=").data
+        second = api_client.get(first["next"]).data
+
+        response = api_client.get(second["previous"])
+
+        assert response.data["results"] == first["results"]
+        assert response.data["previous"] is None
+
+    def test_if_count_is_none_skip_count(self, api_client):
+        baker.make(Product, price=10, _quantity=3)
+
+        response = api_client.get("/store/products/?cursor=&count=none")
+
+        assert response.data["count"] is None
+        assert len(response.data["results"]) == 3
+
+    def test_if_cursor_is_invalid_return_404(self, api_client):
+        response = api_client.get("/store/products/?cursor=abc")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_if_ordering_changes_reject_cursor(self, api_client):
+        baker.make(Product, price=10, _quantity=15)
+        next_url = api_client.get("/store/products/?cursor=&ordering=price").data["next"]
+
+        response = api_client.get(next_url.replace("ordering=price", "ordering=last_update"))
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("cursor", [
+        {"o": "id", "v": "1", "id": "abc", "d": "n"},
+        {"o": "price", "v": None, "id": 1, "d": "n"},
+        {"o": "price", "v": "", "id": 1, "d": "n"},
+        {"o": "price", "v": "1", "id": 1.5, "d": "n"},
+        ["o", "v", "id", "d"],
+    ])
+    def test_if_cursor_is_crafted_return_404(self, api_client, cursor):
+        encoded = urlsafe_b64encode(json.dumps(cursor).encode()).decode()
+        ordering = "price" if isinstance(cursor, dict) and cursor["o"] == "price" else "id"
+
+        response = api_client.get(f"/store/products/?ordering={ordering}&cursor={encoded}")
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("first, second", [
+        ("/store/products/", "/store/products/?cursor="),
+        ("/store/products/?cursor=", "/store/products/"),
+    ])
+    def test_if_other_mode_is_cached_do_not_serve_it(self, api_client, first, second):
+        baker.make(Product, price=10, _quantity=15)
+        api_client.get(first)
+
+        response = api_client.get(second)
+
+        assert response["X-Cache"] == "MISS"
+        assert ("cursor=" in response.data["next"]) == ("cursor" in second)
@@ -0,0 +1,162 @@
+from decimal import Decimal
+from rest_framework import status
+import pytest
+from model_bakery import baker
+from store.models import Collection, Customer, OrderItem, Product, ProductImage, Promotion
+
+
+@pytest.mark.django_db
+class TestProductCache:
+    def test_if_list_is_repeated_return_cached_response(self, api_client):
+        baker.make(Product, price=10)
+
+        first = api_client.get("/store/products/")
+        second = api_client.get("/store/products/")
+
+        assert first["X-Cache"] == "MISS"
+        assert second["X-Cache"] == "HIT"
+        assert second.data == first.data
+
+    def test_if_query_params_are_reordered_share_cache_entry(self, api_client):
+        collection = baker.make(Collection)
+
+        api_client.get(f"/store/products/?collection={collection.id}&ordering=price")
+        response = api_client.get(
+            f"/store/products/?ordering=price&utm_source=x&collection={collection.id}")
+
+        assert response["X-Cache"] == "HIT"
+
+    def test_if_product_price_changes_return_fresh_detail(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, price=10)
+        api_client.get(f"/store/products/{product.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.price = 20
+            product.save()
+        response = api_client.get(f"/store/products/{product.id}/")
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["price"] == 20
+
+    def test_if_product_changes_invalidate_only_its_collection(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, price=10)
+        other = baker.make(Collection)
+        api_client.get(f"/store/products/?collection={product.collection_id}")
+        api_client.get(f"/store/products/?collection={other.id}")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.price = 20
+            product.save()
+
+        assert api_client.get(
+            f"/store/products/?collection={product.collection_id}")["X-Cache"] == "MISS"
+        assert api_client.get(
+            f"/store/products/?collection={other.id}")["X-Cache"] == "HIT"
+
+    def test_if_product_moves_collection_invalidate_old_collection(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, price=10)
+        old_collection_id = product.collection_id
+        api_client.get(f"/store/products/?collection={old_collection_id}")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            product.collection = baker.make(Collection)
+            product.save()
+        response = api_client.get(f"/store/products/?collection={old_collection_id}")
+
+        assert response["X-Cache"] == "MISS"
+        assert response.data["count"] == 0
+
+    def test_if_image_is_added_invalidate_product(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, price=10)
+        api_client.get(f"/store/products/{product.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            baker.make(ProductImage, product=product, image="store/images/a.jpg")
+        response = api_client.get(f"/store/products/{product.id}/")
+
+        assert response["X-Cache"] == "MISS"
+        assert len(response.data["images"]) == 1
+
+    def test_if_promotion_changes_invalidate_its_products(self, api_client, django_capture_on_commit_callbacks):
+        product = baker.make(Product, price=10)
+        promotion = baker.make(Promotion)
+        product.promotions.add(promotion)
+        api_client.get(f"/store/products/{product.id}/")
+
+        with django_capture_on_commit_callbacks(execute=True):
+            promotion.discount = 0.5
+            promotion.save()
+
+        assert api_client.get(f"/store/products/{product.id}/")["X-Cache"] == "MISS"
+
+    def test_if_user_is_not_admin_cache_stats_return_403(self, api_client, authendicate_admin):
+        authendicate_admin()
+
+        response = api_client.get("/store/products/cache_stats/")
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_if_user_is_admin_cache_stats_count_hits_and_misses(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        api_client.get("/store/products/")
+        api_client.get("/store/products/")
+
+        response = api_client.get("/store/products/cache_stats/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["product-list"] == {"hits": 1, "misses": 1}
+
+
+@pytest.mark.django_db
+class TestProductPriceWithTax:
+    def test_if_product_is_listed_return_price_with_tax_from_sql(self, api_client):
+        baker.make(Product, price="10.05")
+
+        response = api_client.get("/store/products/")
+
+        assert response.data["results"][0]["price_with_tax"] == Decimal("11.055")
+
+    def test_if_product_is_created_return_price_with_tax(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        collection = baker.make(Collection)
+
+        response = api_client.post("/store/products/", {
+            "title": "a", "description": "", "price": "10.05",
+            "collection": collection.id, "inventory": 1})
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data["price_with_tax"] == Decimal("11.055")
+
+
+@pytest.mark.django_db
+class TestDeleteProduct:
+    def test_if_product_is_ordered_return_405(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        product = baker.make(Product)
+        baker.make(OrderItem, product=product, order__customer=Customer.objects.get(user=baker.make("core.User")))
+
+        response = api_client.delete(f"/store/products/{product.id}/")
+
+        assert response.status_code == status.HTTP_405_METHOD_NOT_ALLOWED
+
+    def test_if_product_is_not_ordered_return_204(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        product = baker.make(Product)
+
+        response = api_client.delete(f"/store/products/{product.id}/")
+
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        assert not Product.objects.filter(pk=product.id).exists()
+
+    def test_if_many_are_deleted_report_each_id(self, api_client, authendicate_admin):
+        authendicate_admin(True)
+        collection = baker.make(Collection)
+        free, ordered = baker.make(Product, collection=collection, _quantity=2)
+        baker.make(OrderItem, product=ordered, order__customer=Customer.objects.get(user=baker.make("core.User")))
+
+        response = api_client.post("/store/products/bulk-delete/",
+                                   {"ids": [free.id, ordered.id, free.id]}, format="json")
+
+        assert response.data == {"deleted": [free.id], "blocked": [ordered.id], "not_found": []}
+        collection.refresh_from_db()
+        assert collection.products_count == 1
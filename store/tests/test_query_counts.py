@@ -0,0 +1,97 @@
+"""
+Guard every GET list and detail route of store.urls against N+1 queries:
+each one must run as many queries with LARGE rows behind it as with SMALL.
+The counts are committed in query_counts.json; refresh it with
+
+    STORE_QUERY_COUNTS=store/tests/query_counts.json pytest store/tests/test_query_counts.py
+
+and review the diff with the change that moved them.
+"""
+from django.urls import reverse
+from django.utils import timezone
+import pytest
+from model_bakery import baker
+from store import urls
+from store.models import (Cart, CartItem, Collection, Customer, DailyProductSales, Order,
+                          OrderItem, Product, ProductImage, Promotion, Review)
+
+
+# Every GET list and detail route of store.urls
+ENDPOINTS = [
+    pattern.name for pattern in urls.urlpatterns
+    if pattern.name and pattern.name.endswith(("-list", "-detail"))
+    and "get" in getattr(pattern.callback, "actions", {})
+    and "format" not in pattern.pattern.regex.groupindex
+]
+
+SMALL = 2
+LARGE = 6
+
+
+class StoreData:
+    """Rows behind every endpoint, grown n at a time under fixed parents."""
+
+    def __init__(self, user):
+        self.customer = Customer.objects.get(user=user)
+        self.collection = baker.make(Collection)
+        self.cart = baker.make(Cart)
+        self.promotion = baker.make(Promotion)
+        self.first = {}
+
+    def grow(self, n):
+        products = baker.make(Product, collection=self.collection, _quantity=n)
+        for product in products:
+            product.promotions.add(self.promotion)
+        images = [baker.make(ProductImage, product=product) for product in products]
+        reviews = [baker.make(Review, product=product) for product in products]
+        items = [baker.make(CartItem, cart=self.cart, product=product, quantity=1) for product in products]
+        orders = baker.make(Order, customer=self.customer, _quantity=n)
+        for order in orders:
+            baker.make(OrderItem, order=order, product=products[0], quantity=1, unit_price="1.00",
+                       _quantity=2)
+        customers = [Customer.objects.get(user=baker.make("core.User")) for _ in range(n)]
+        DailyProductSales.objects.rebuild(timezone.localdate(), timezone.localdate())
+        self.first = self.first or {
+            "products": products[0].pk,
+            "collections": self.collection.pk,
+            "carts": self.cart.pk,
+            "customers": customers[0].pk,
+            "orders": orders[0].pk,
+            "product-reviews": reviews[0].pk,
+            "product-images": images[0].pk,
+            "cart-items": items[0].pk,
+            "product_pk": products[0].pk,
+            "cart_pk": self.cart.pk,
+        }
+
+    def kwargs(self, name):
+        pattern = next(pattern for pattern in urls.urlpatterns if pattern.name == name)
+        basename = name.rsplit("-", 1)[0]
+        return {group: self.first[basename if group == "pk" else group]
+                for group in pattern.pattern.regex.groupindex}
+
+
+@pytest.fixture
+def store_data(api_client, settings):
+    # Count what the endpoints query, not what the cache saves them
+    settings.STORE_CACHE_ENABLED = False
+    user = baker.make("core.User", is_staff=True)
+    api_client.force_authenticate(user=user)
+    return StoreData(user)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("name", ENDPOINTS)
+def test_if_data_grows_query_count_stays_constant(name, store_data, count_queries, query_counts):
+    store_data.grow(SMALL)
+    url = reverse(name, kwargs=store_data.kwargs(name))
+    response, small = count_queries(url)
+    if response.status_code == 405:
+        pytest.skip(f"{name} does not answer GET")
+    assert response.status_code == 200, response.data
+
+    store_data.grow(LARGE - SMALL)
+    _, large = count_queries(url)
+
+    query_counts[name] = large
+    assert small == large, f"{name} ran {small} queries with {SMALL} rows and {large} with {LARGE}"
@@ -0,0 +1,38 @@
+import pytest
+from model_bakery import baker
+from store.filters import FullTextSearchFilter
+from store.models import Product
+
+
+class TestBooleanQuery:
+    def test_if_terms_are_long_enough_require_each_prefix(self):
+        query = FullTextSearchFilter().get_boolean_query(["bread", "whole"])
+
+        assert query == "+bread* +whole*"
+
+    def test_if_terms_contain_operators_strip_them(self):
+        query = FullTextSearchFilter().get_boolean_query(['"bread"', "-(wheat)*"])
+
+        assert query == "+bread* +wheat*"
+
+    def test_if_term_is_shorter_than_token_size_return_none(self):
+        assert FullTextSearchFilter().get_boolean_query(["br"]) is None
+
+
+@pytest.mark.django_db
+class TestProductSearch:
+    def test_if_fulltext_is_unavailable_fall_back_to_like(self, api_client):
+        baker.make(Product, title="Bread Ww Cluster", price=10)
+        baker.make(Product, title="Soup", price=10)
+
+        response = api_client.get("/store/products/?search=bread")
+
+        assert [item["title"] for item in response.data["results"]] == ["Bread Ww Cluster"]
+
+    def test_if_fallback_is_disabled_return_nothing(self, api_client, settings):
+        settings.STORE_SEARCH_FALLBACK = False
+        baker.make(Product, title="Bread Ww Cluster", price=10)
+
+        response = api_client.get("/store/products/?search=bread")
+
+        assert response.data["count"] == 0
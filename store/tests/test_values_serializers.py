@@ -0,0 +1,100 @@
+import pytest
+from model_bakery import baker
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from store.models import Cart, CartItem, Customer, Order, OrderItem, Product, ProductImage
+from store.serializers import CartSerializer, OrderSerializer, ProductSerializer
+from store.values_serializers import CartValuesSerializer, OrderValuesSerializer, ProductValuesSerializer
+from store.views import CartViewSet, OrderViewSet, ProductViewSet
+
+
+def render(data):
+    return JSONRenderer().render(data)
+
+
+@pytest.fixture
+def context():
+    return {"request": Request(APIRequestFactory().get("/store/products/"))}
+
+
+@pytest.fixture
+def products():
+    products = [
+        baker.make(Product, price="10.05", description="a é \"quoted\"", inventory=3),
+        baker.make(Product, price="1.00"),
+        baker.make(Product, price="9999.99"),
+    ]
+    baker.make(ProductImage, product=products[0], image="store/images/a.jpg")
+    baker.make(ProductImage, product=products[0], image="store/images/b c.jpg")
+    return products
+
+
+@pytest.mark.django_db
+class TestValuesSerializerParity:
+    def test_products_render_identical_json(self, products, context):
+        queryset = ProductViewSet.queryset.order_by("id")
+
+        expected = render(ProductSerializer(queryset, many=True, context=context).data)
+        serializer = ProductValuesSerializer(context)
+        actual = render(serializer.serialize(serializer.get_rows(queryset)))
+
+        assert actual == expected
+
+    def test_orders_render_identical_json(self, products):
+        customer = Customer.objects.get(user=baker.make("core.User"))
+        for status in [Order.PENDING_STATUS, Order.COMPLETE_STATUS]:
+            order = baker.make(Order, customer=customer, payment_status=status)
+            for product in products:
+                baker.make(OrderItem, order=order, product=product,
+                           unit_price=product.price, quantity=2)
+        baker.make(Order, customer=customer)
+        queryset = Order.objects.prefetch_related("items__product").order_by("id")
+
+        expected = render(OrderSerializer(queryset, many=True).data)
+        serializer = OrderValuesSerializer()
+        actual = render(serializer.serialize(serializer.get_rows(queryset)))
+
+        assert actual == expected
+
+    @pytest.mark.parametrize("lines", [0, 1, 3])
+    def test_carts_render_identical_json(self, products, lines):
+        cart = baker.make(Cart)
+        for product in products[:lines]:
+            baker.make(CartItem, cart=cart, product=product, quantity=4)
+        queryset = CartViewSet.queryset.filter(pk=cart.pk)
+
+        expected = render(CartSerializer(queryset.get()).data)
+        serializer = CartValuesSerializer()
+        actual = render(serializer.serialize(serializer.get_rows(queryset))[0])
+
+        assert actual == expected
+
+
+@pytest.mark.django_db
+class TestValuesSerializerViews:
+    def test_product_list_matches_model_serializer(self, api_client, products, monkeypatch, settings):
+        settings.STORE_CACHE_ENABLED = False
+
+        fast = api_client.get("/store/products/?ordering=price").content
+        monkeypatch.setattr(ProductViewSet, "values_serializer_class", None)
+        slow = api_client.get("/store/products/?ordering=price").content
+
+        assert fast == slow
+
+    def test_order_list_matches_model_serializer(self, api_client, products, monkeypatch):
+        user = baker.make("core.User", is_staff=True)
+        order = baker.make(Order, customer=Customer.objects.get(user=user))
+        baker.make(OrderItem, order=order, product=products[0], unit_price="10.05", quantity=2)
+        api_client.force_authenticate(user=user)
+
+        fast = api_client.get("/store/orders/").content
+        monkeypatch.setattr(OrderViewSet, "values_serializer_class", None)
+        slow = api_client.get("/store/orders/").content
+
+        assert fast == slow
+
+    def test_if_cart_does_not_exist_return_404(self, api_client):
+        response = api_client.get("/store/carts/not-a-uuid/")
+
+        assert response.status_code == 404
@@ -1,6 +1,8 @@
+from django.conf import settings
 from django.urls import path, include
 from rest_framework_nested.routers import DefaultRouter, NestedDefaultRouter
 from . import views
+from .async_views import with_async_reads
 
 
 # router = SimpleRouter()
@@ -10,6 +12,7 @@ router.register("collections", views.CollectionViewSet, basename="collections")
 router.register("carts", views.CartViewSet, basename="carts")
 router.register("customers", views.CustomerViewSet, basename="customers")
 router.register("orders", views.OrderViewSet, basename="orders")
+router.register("analytics/sales", views.SalesAnalyticsViewSet, basename="sales-analytics")
 
 products_router = NestedDefaultRouter(router, "products", lookup="product")
 products_router.register("reviews", views.ReviewViewSet,
@@ -23,6 +26,9 @@ carts_router.register("items", views.CartItemViewSet, basename="cart-items")
 
 urlpatterns = router.urls + products_router.urls + carts_router.urls
 
+if settings.STORE_ASYNC_READS:
+    urlpatterns = with_async_reads(urlpatterns)
+
 # router.urls
 
 # urlpatterns = [
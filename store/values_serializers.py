@@ -0,0 +1,215 @@
+from collections import defaultdict
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from rest_framework import fields as drf_fields
+from rest_framework.exceptions import MethodNotAllowed
+from rest_framework.relations import PrimaryKeyRelatedField
+from rest_framework.response import Response
+from store.models import CartItem
+from .serializers import CartItemSerializer, CartSerializer, OrderItemSerializer, OrderSerializer, ProductImageSerializer, ProductSerializer, SimpleProductSerializer
+
+
+class ValuesSerializer:
+    """
+    Render the same dicts as serializer_class straight from .values() rows.
+
+    The to_representation of every field is resolved once per serializer,
+    rows then only go through those bound methods instead of building a
+    model instance and a serializer per row. SerializerMethodFields must be
+    backed by an annotation of the same name (or a convert_<name> method).
+
+    related: field -> ValuesSerializer for to-one objects read off the same row
+    many:    field -> (ValuesSerializer, fk on the child model), loaded with
+             one extra query per page
+    """
+    serializer_class = None
+    related = {}
+    many = {}
+
+    def __init__(self, context=None, prefix=""):
+        self.context = context or {}
+        self.prefix = prefix
+        self.model = self.serializer_class.Meta.model
+        # (name, values() key, converter, whether None skips the converter)
+        self.accessors = []
+        self.related_children = {}
+        self.children = {}
+
+        fields = self.serializer_class(context=self.context).fields
+        for name, field in fields.items():
+            if field.write_only:
+                continue
+            if name in self.related:
+                self.related_children[name] = self.related[name](
+                    self.context, f"{prefix}{name}__")
+            elif name in self.many:
+                child_class, fk = self.many[name]
+                self.children[name] = (child_class(self.context), fk)
+            else:
+                self.accessors.append((name, prefix + name) + self.get_converter(name, field))
+        self.field_names = [name for name, field in fields.items() if not field.write_only]
+
+    def get_converter(self, name, field):
+        convert = getattr(self, f"convert_{name}", None)
+        if convert is not None:
+            return convert, False
+        if isinstance(field, (drf_fields.SerializerMethodField, PrimaryKeyRelatedField)):
+            return None, True
+        if isinstance(field, drf_fields.FileField):
+            model_field = self.model._meta.get_field(name)
+            return (lambda value: field.to_representation(
+                model_field.attr_class(None, model_field, value))), True
+        return field.to_representation, True
+
+    def get_value_names(self):
+        names = [source for _, source, _, _ in self.accessors]
+        for child in self.related_children.values():
+            names += child.get_value_names()
+        return names
+
+    def get_child_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_rows(self, queryset):
+        names = self.get_value_names()
+        if "id" not in names:
+            names.append("id")
+        return queryset.prefetch_related(None).values(*names)
+
+    def get_child_rows(self, rows):
+        """(name, child serializer, fk, .values() queryset) per many field."""
+        pks = [row["id"] for row in rows]
+        for name, (child, fk) in self.children.items():
+            fk_name = child.model._meta.get_field(fk).attname
+            queryset = child.get_child_queryset() \
+                .filter(**{f"{fk_name}__in": pks}) \
+                .order_by("pk")
+            yield name, child, fk_name, queryset.values(fk_name, *child.get_value_names())
+
+    def get_children(self, rows):
+        children = {}
+        for name, child, fk_name, child_rows in self.get_child_rows(rows):
+            grouped = defaultdict(list)
+            for row in child_rows:
+                grouped[row[fk_name]].append(child.to_representation(row))
+            children[name] = grouped
+        return children
+
+    def to_representation(self, row, children=None):
+        values = {}
+        for name, source, convert, skip_none in self.accessors:
+            value = row[source]
+            if convert is None or (value is None and skip_none):
+                values[name] = value
+            else:
+                values[name] = convert(value)
+        for name, child in self.related_children.items():
+            values[name] = child.to_representation(row)
+        for name in self.children:
+            values[name] = children[name].get(row["id"], [])
+
+        # Keep the declared field order, the JSON has to match byte for byte
+        return {name: values[name] for name in self.field_names}
+
+    def serialize(self, rows):
+        rows = list(rows)
+        children = self.get_children(rows) if self.children else None
+        return [self.to_representation(row, children) for row in rows]
+
+    async def aget_children(self, rows):
+        children = {}
+        for name, child, fk_name, child_rows in self.get_child_rows(rows):
+            grouped = defaultdict(list)
+            async for row in child_rows:
+                grouped[row[fk_name]].append(child.to_representation(row))
+            children[name] = grouped
+        return children
+
+    async def aserialize(self, rows):
+        """serialize() for async views, rows is a queryset from get_rows()."""
+        rows = [row async for row in rows]
+        children = await self.aget_children(rows) if self.children else None
+        return [self.to_representation(row, children) for row in rows]
+
+
+class ValuesSerializerMixin:
+    """
+    Serve list (and retrieve, where the viewset has no object-level
+    permissions) through values_serializer_class when it is set.
+    """
+    values_serializer_class = None
+    values_actions = ("list",)
+
+    def get_values_serializer(self):
+        return self.values_serializer_class(context=self.get_serializer_context())
+
+    def list(self, request, *args, **kwargs):
+        if self.values_serializer_class is None or "list" not in self.values_actions:
+            if not hasattr(super(), "list"):
+                # Defining list() here makes routers route GET to viewsets
+                # without ListModelMixin, such as CartViewSet
+                raise MethodNotAllowed(request.method)
+            return super().list(request, *args, **kwargs)
+
+        serializer = self.get_values_serializer()
+        queryset = serializer.get_rows(self.filter_queryset(self.get_queryset()))
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serializer.serialize(page))
+        return Response(serializer.serialize(queryset))
+
+    def retrieve(self, request, *args, **kwargs):
+        if self.values_serializer_class is None or "retrieve" not in self.values_actions:
+            return super().retrieve(request, *args, **kwargs)
+
+        serializer = self.get_values_serializer()
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            rows = serializer.serialize(serializer.get_rows(
+                queryset.filter(**{self.lookup_field: kwargs[lookup_url_kwarg]}))[:1])
+        except (TypeError, ValueError, ValidationError):
+            raise Http404
+        if not rows:
+            raise Http404
+        return Response(rows[0])
+
+
+class SimpleProductValuesSerializer(ValuesSerializer):
+    serializer_class = SimpleProductSerializer
+
+
+class ProductImageValuesSerializer(ValuesSerializer):
+    serializer_class = ProductImageSerializer
+
+
+class ProductValuesSerializer(ValuesSerializer):
+    serializer_class = ProductSerializer
+    many = {"images": (ProductImageValuesSerializer, "product")}
+
+
+class OrderItemValuesSerializer(ValuesSerializer):
+    serializer_class = OrderItemSerializer
+    related = {"product": SimpleProductValuesSerializer}
+
+
+class OrderValuesSerializer(ValuesSerializer):
+    serializer_class = OrderSerializer
+    many = {"items": (OrderItemValuesSerializer, "order")}
+
+
+class CartItemValuesSerializer(ValuesSerializer):
+    serializer_class = CartItemSerializer
+    related = {"product": SimpleProductValuesSerializer}
+
+    def get_child_queryset(self):
+        return CartItem.objects.with_total_price()
+
+
+class CartValuesSerializer(ValuesSerializer):
+    serializer_class = CartSerializer
+    many = {"items": (CartItemValuesSerializer, "cart")}
+
+    def convert_total_price(self, value):
+        # Same as CartSerializer.get_total_price for an empty cart
+        return value or 0
@@ -1,61 +1,119 @@
+from uuid import UUID
 from django.shortcuts import render, get_object_or_404
-from django.http import HttpResponse
-from django.db.models import Count
+from django.http import Http404, HttpResponse
+from django.db.models import Prefetch, Sum
+from django.utils import timezone
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.decorators import api_view, action
+from rest_framework.exceptions import ValidationError
 from rest_framework.views import APIView
 from rest_framework import mixins
 from rest_framework.generics import ListCreateAPIView, RetrieveUpdateDestroyAPIView
 from rest_framework.viewsets import ModelViewSet, GenericViewSet
-from rest_framework.filters import SearchFilter, OrderingFilter
+from rest_framework.filters import OrderingFilter
 from rest_framework.pagination import PageNumberPagination
 from rest_framework import status
 from rest_framework import permissions
 from django_filters.rest_framework import DjangoFilterBackend
-from .filters import ProductFilter
-from .models import Customer, Order, Product, Collection, OrderItem, ProductImage, Review, Cart, CartItem
-from .pagination import DefaultPagination
-from .serializers import AddCartItemSerializer, CartItemSerializer, CartSerializer, CreateOrderSerializer, CustomerSerializer, OrderSerializer, ProductImageSerializer, ProductSerializer, CollectionSerializer, ReviewSerializer, UpdateCartItemSerializer, UpdateOrderSerializer
+from .filters import FullTextSearchFilter, OrderFilter, ProductFilter
+from .models import Customer, CustomerStats, DailyProductSales, Order, Product, Collection, OrderItem, ProductImage, Review, Cart, CartItem
+from .pagination import DefaultPagination, KeysetPaginationMixin
+from .serializers import AddCartItemSerializer, CartItemSerializer, CartSerializer, CreateOrderSerializer, CustomerSerializer, CustomerStatsSerializer, OrderSerializer, ProductImageSerializer, ProductSerializer, CollectionSerializer, ReviewSerializer, SalesAnalyticsQuerySerializer, UpdateCartItemSerializer, UpdateOrderSerializer
 from .permissions import IsAdminOrReadOnly, FullDjangoModelPermission, ViewCustomerHistoryPermission
-
-
-class ProductViewSet(ModelViewSet):
-    queryset = Product.objects.prefetch_related("images").all()
+from .carts import get_cart_backend
+from .cache import cache_stats, cached_response, get_version, product_detail_key, product_list_key
+from .conditional import conditional_response, make_etag
+from .deletion import DeletionGuardMixin
+from .exports import export_response, get_export_format, iter_rows
+from .values_serializers import CartValuesSerializer, OrderValuesSerializer, ProductValuesSerializer, ValuesSerializerMixin
+
+
+class ProductViewSet(DeletionGuardMixin, ValuesSerializerMixin, KeysetPaginationMixin, ModelViewSet):
+    queryset = Product.objects.prefetch_related("images").with_price_with_tax()
+    delete_guards = ((OrderItem, "product"),)
+    delete_blocked_message = "This product object is cannot be deleted, becuase it is associated with some orderitems"
     # queryset = Product.objects.all()
     serializer_class = ProductSerializer
-    filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
+    values_serializer_class = ProductValuesSerializer
+    filter_backends = [DjangoFilterBackend, FullTextSearchFilter, OrderingFilter]
     # filterset_fields = ["collection_id", "price"]
     filterset_class = ProductFilter
     search_fields = ["title", "description"]
+    fulltext_fields = ["title", "description"]
     ordering_fields = ["price", "last_update"]
     # pagination_class = PageNumberPagination
     pagination_class = DefaultPagination
     permission_classes = (IsAdminOrReadOnly,)
 
-    def destroy(self, request, *args, **kwargs):
-        if OrderItem.objects.filter(product=kwargs["pk"]).count() > 0:
-            return Response(
-                {"error": "This product object is cannot be deleted, becuase it is associated with some orderitems"},
-                status=status.HTTP_405_METHOD_NOT_ALLOWED)
-        return super().destroy(request, *args, **kwargs)
-
-
-class CollectionViewSet(ModelViewSet):
-    queryset = Collection.objects.annotate(
-        products_count=Count("products")).all()
+    def list(self, request, *args, **kwargs):
+        # The cache key carries the version counters and the normalized
+        # query, so a 304 or a cache hit costs no query. No Last-Modified:
+        # the newest last_update does not move when a product is deleted
+        # or leaves a collection.
+        key = product_list_key(request)
+        etag = make_etag(key, request.accepted_renderer.format) if key else None
+        return conditional_response(
+            request, etag, None,
+            lambda: cached_response(
+                "product-list", key,
+                lambda: super(ProductViewSet, self).list(request, *args, **kwargs)))
+
+    def retrieve(self, request, *args, **kwargs):
+        try:
+            last_modified = Product.objects \
+                .filter(pk=kwargs["pk"]) \
+                .values_list("last_update", flat=True) \
+                .first()
+        except (TypeError, ValueError):
+            last_modified = None
+        etag = None
+        if last_modified is not None:
+            etag = make_etag(kwargs["pk"], request.accepted_renderer.format, last_modified)
+        return conditional_response(
+            request, etag, last_modified,
+            lambda: cached_response(
+                "product-detail", product_detail_key(request, kwargs["pk"]),
+                lambda: super(ProductViewSet, self).retrieve(request, *args, **kwargs)))
+
+    @action(detail=False, permission_classes=(permissions.IsAdminUser,))
+    def export(self, request: Request):
+        export_format = get_export_format(request)
+        products = ProductFilter(request.query_params, Product.objects.all(), request=request)
+        if not products.is_valid():
+            raise ValidationError(products.errors)
+        header = ["id", "title", "slug", "description", "inventory", "price",
+                  "collection_id", "last_update"]
+        return export_response(iter_rows(products.qs, header), header, export_format, "products")
+
+    @action(detail=False, permission_classes=(permissions.IsAdminUser,))
+    def cache_stats(self, request: Request):
+        return Response(cache_stats())
+
+
+class CollectionViewSet(DeletionGuardMixin, ModelViewSet):
+    queryset = Collection.objects.all()
+    delete_guards = ((Product, "collection"),)
+    delete_blocked_message = "Request collection object cannot be deleted, because it is associated with some of products"
     serializer_class = CollectionSerializer
     permission_classes = (IsAdminOrReadOnly,)
 
-    def destroy(self, request, *args, **kwargs):
-        if Product.objects.filter(collection=kwargs["pk"]).count > 0:
-            return Response(
-                {"error": "Request collection object cannot be deleted, because it is associated with some of products"},
-                status=status.HTTP_405_METHOD_NOT_ALLOWED)
-        return super().destroy(request, *args, **kwargs)
+    def get_etag(self, request: Request):
+        return make_etag(request.get_full_path(), request.accepted_renderer.format,
+                         get_version("collections"))
 
+    def list(self, request, *args, **kwargs):
+        return conditional_response(
+            request, self.get_etag(request), None,
+            lambda: super(CollectionViewSet, self).list(request, *args, **kwargs))
 
-class ReviewViewSet(ModelViewSet):
+    def retrieve(self, request, *args, **kwargs):
+        return conditional_response(
+            request, self.get_etag(request), None,
+            lambda: super(CollectionViewSet, self).retrieve(request, *args, **kwargs))
+
+
+class ReviewViewSet(KeysetPaginationMixin, ModelViewSet):
     serializer_class = ReviewSerializer
 
     def get_queryset(self):
@@ -66,13 +124,57 @@ class ReviewViewSet(ModelViewSet):
 
 
 class CartViewSet(
+        ValuesSerializerMixin,
         #   mixins.ListModelMixin,
         mixins.CreateModelMixin,
         mixins.RetrieveModelMixin,
         mixins.DestroyModelMixin,
         GenericViewSet):
-    queryset = Cart.objects.prefetch_related("items__product").all()
+    queryset = Cart.objects \
+        .prefetch_related(Prefetch(
+            "items",
+            queryset=CartItem.objects.select_related("product").with_total_price())) \
+        .with_total_price()
     serializer_class = CartSerializer
+    values_serializer_class = CartValuesSerializer
+    values_actions = ("retrieve",)
+
+    def retrieve(self, request, *args, **kwargs):
+        # Cart payloads embed product titles and prices, so any catalog
+        # change has to invalidate them as well.
+        try:
+            cart_id = UUID(kwargs["pk"])
+        except ValueError:
+            cart_id = None
+        etag = None
+        if cart_id is not None:
+            etag = make_etag(cart_id, request.accepted_renderer.format,
+                             get_version("cart", cart_id), get_version("product"))
+        return conditional_response(
+            request, etag, None, lambda: self.get_cart_response(request, *args, **kwargs))
+
+    def get_cart_response(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().retrieve(request, *args, **kwargs)
+        cart = carts.get(kwargs["pk"])
+        if cart is None:
+            raise Http404
+        return Response(CartSerializer(cart).data)
+
+    def create(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().create(request, *args, **kwargs)
+        return Response(CartSerializer(carts.create()).data, status=status.HTTP_201_CREATED)
+
+    def destroy(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().destroy(request, *args, **kwargs)
+        if not carts.delete(kwargs["pk"]):
+            raise Http404
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
 
 class CartItemViewSet(ModelViewSet):
@@ -88,11 +190,75 @@ class CartItemViewSet(ModelViewSet):
     def get_queryset(self):
         return CartItem.objects \
             .select_related("product") \
-            .filter(cart_id=self.kwargs["cart_pk"])
+            .filter(cart_id=self.kwargs["cart_pk"]) \
+            .with_total_price()
 
     def get_serializer_context(self):
         return {"cart_id": self.kwargs["cart_pk"]}
 
+    def touch_cart(self):
+        # Adds touch the cart in CartItem.objects.add_quantities()
+        Cart.objects.filter(pk=self.kwargs["cart_pk"]).update(updated_at=timezone.now())
+
+    def perform_update(self, serializer):
+        super().perform_update(serializer)
+        self.touch_cart()
+
+    def perform_destroy(self, instance):
+        super().perform_destroy(instance)
+        self.touch_cart()
+
+    # With a redis cart backend the lines are read and written there, the
+    # serializers (and so the responses) stay the same.
+
+    def list(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().list(request, *args, **kwargs)
+        cart = carts.get(kwargs["cart_pk"])
+        items = cart.items.all() if cart is not None else []
+        return Response(CartItemSerializer(items, many=True).data)
+
+    def retrieve(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().retrieve(request, *args, **kwargs)
+        item = carts.get_item(kwargs["cart_pk"], kwargs["pk"])
+        if item is None:
+            raise Http404
+        return Response(CartItemSerializer(item).data)
+
+    def partial_update(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().partial_update(request, *args, **kwargs)
+        serializer = UpdateCartItemSerializer(data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        if "quantity" in serializer.validated_data and not carts.update(
+                kwargs["cart_pk"], kwargs["pk"], serializer.validated_data["quantity"]):
+            raise Http404
+        item = carts.get_item(kwargs["cart_pk"], kwargs["pk"])
+        if item is None:
+            raise Http404
+        return Response(UpdateCartItemSerializer(item).data)
+
+    def destroy(self, request, *args, **kwargs):
+        carts = get_cart_backend()
+        if carts.uses_database:
+            return super().destroy(request, *args, **kwargs)
+        if not carts.remove(kwargs["cart_pk"], kwargs["pk"]):
+            raise Http404
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @action(detail=False, methods=["post"])
+    def bulk(self, request: Request, cart_pk):
+        serializer = AddCartItemSerializer(
+            data=request.data, many=True,
+            context=self.get_serializer_context())
+        serializer.is_valid(raise_exception=True)
+        cart_id = serializer.save()
+        return Response(CartSerializer(get_cart_backend().get(cart_id)).data)
+
 
 class CustomerViewSet(ModelViewSet):
     queryset = Customer.objects.all()
@@ -107,8 +273,7 @@ class CustomerViewSet(ModelViewSet):
 
     @action(detail=False, methods=["GET", "PUT"], permission_classes=(permissions.IsAuthenticated,))
     def me(self, request: Request):
-        customer = Customer.objects.get(
-            user_id=request.user.id, defaults={})
+        customer = Customer.objects.get(user_id=request.user.id)
         if request.method == "GET":
             serializer = CustomerSerializer(customer)
             return Response(serializer.data)
@@ -120,14 +285,18 @@ class CustomerViewSet(ModelViewSet):
 
     @action(detail=True, permission_classes=[ViewCustomerHistoryPermission])
     def history(self, request: Request, pk):
-        return Response("ok")
+        customer = self.get_object()
+        stats = CustomerStats.objects.filter(customer=customer).first() \
+            or CustomerStats(customer=customer)
+        return Response(CustomerStatsSerializer(stats).data)
 
 
-class OrderViewSet(ModelViewSet):
+class OrderViewSet(ValuesSerializerMixin, KeysetPaginationMixin, ModelViewSet):
     http_method_names = ("get", "post", "patch", "delete", "head", "options")
+    values_serializer_class = OrderValuesSerializer
 
     def get_permissions(self):
-        if self.request.method in ["PATCH", "DELETE"]:
+        if self.request.method in ["PATCH", "DELETE"] or self.action == "export":
             return (permissions.IsAdminUser(),)
         return (permissions.IsAuthenticated(),)
 
@@ -137,12 +306,28 @@ class OrderViewSet(ModelViewSet):
             context=self.get_serializer_context())
         serializer.is_valid(raise_exception=True)
         order = serializer.save()
+        # One query for all the lines' products, like get_queryset()
+        order = Order.objects.prefetch_related("items__product").get(pk=order.pk)
         serializer = OrderSerializer(order)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
     def get_serializer_context(self):
         return {"user_id": self.request.user.id}
 
+    @action(detail=False, permission_classes=(permissions.IsAdminUser,))
+    def export(self, request: Request):
+        """One row per order item, for ?payment_status= and placed_at range filters."""
+        export_format = get_export_format(request)
+        orders = OrderFilter(request.query_params, Order.objects.all(), request=request)
+        if not orders.is_valid():
+            raise ValidationError(orders.errors)
+        items = OrderItem.objects.filter(order__in=orders.qs.values("id"))
+        fields = ["order_id", "order__placed_at", "order__payment_status", "order__customer_id",
+                  "product_id", "quantity", "unit_price"]
+        header = ["order_id", "placed_at", "payment_status", "customer_id",
+                  "product_id", "quantity", "unit_price"]
+        return export_response(iter_rows(items, fields), header, export_format, "orders")
+
     def get_serializer_class(self):
         if self.request.method == "POST":
             return CreateOrderSerializer
@@ -159,6 +344,37 @@ class OrderViewSet(ModelViewSet):
         return Order.objects.prefetch_related("items__product").filter(customer_id=customer.id)
 
 
+class SalesAnalyticsViewSet(GenericViewSet):
+    """
+    Units and revenue per day, product or collection over ?start=..&end=
+    (the last 30 days by default), read from the daily rollups.
+    """
+    queryset = DailyProductSales.objects.all()
+    permission_classes = (permissions.IsAdminUser,)
+
+    def list(self, request: Request):
+        serializer = SalesAnalyticsQuerySerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        params = serializer.validated_data
+
+        sales = self.get_queryset().filter(day__gte=params["start"], day__lte=params["end"])
+        for field in ("product", "collection"):
+            if field in params:
+                sales = sales.filter(**{field: params[field]})
+        group_by = serializer.GROUPINGS[params["group_by"]]
+        sales = sales \
+            .values(*group_by) \
+            .annotate(units=Sum("units"), revenue=Sum("revenue")) \
+            .order_by(*(("day",) if params["group_by"] == "day" else ("-revenue", group_by[0])))
+
+        return Response({
+            "start": params["start"],
+            "end": params["end"],
+            "group_by": params["group_by"],
+            "results": list(sales),
+        })
+
+
 class ProductImageViewSet(ModelViewSet):
     serializer_class = ProductImageSerializer
 
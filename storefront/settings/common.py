@@ -38,6 +38,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
+    "store.middleware.RequestMetricsMiddleware",
     'django.middleware.security.SecurityMiddleware',
     "whitenoise.middleware.WhiteNoiseMiddleware",
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -113,6 +114,9 @@ STATIC_URL = '/static/'
 STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 
 STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
     "staticfiles": {
         "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
     },
@@ -138,6 +142,15 @@ CORS_ALLOWED_ORIGINS = [
 
 REST_FRAMEWORK = {
     "COERCE_DECIMAL_TO_STRING": False,
+    "DEFAULT_RENDERER_CLASSES": (
+        "core.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "core.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     'DEFAULT_AUTHENTICATION_CLASSES': (
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
@@ -148,6 +161,82 @@ REST_FRAMEWORK = {
     # "PAGE_SIZE": 5
 }
 
+STORE_CACHE_ENABLED = True
+
+STORE_CACHE_TIMEOUT = 5 * 60
+
+# Version counters (store.cache) expire this long after they are set, so
+# those of carts and products nobody asks about again do not pile up. An
+# expired counter is reseeded from the clock, which only costs a miss.
+STORE_VERSION_TIMEOUT = 7 * 24 * 60 * 60
+
+# "fulltext" uses the MySQL FULLTEXT index, "like" the plain SearchFilter
+STORE_SEARCH_BACKEND = "fulltext"
+
+# Use the LIKE search where the FULLTEXT index cannot answer the query
+STORE_SEARCH_FALLBACK = True
+
+# order_created_batch receivers get up to this many orders per call...
+STORE_ORDER_EVENTS_BATCH_SIZE = 100
+
+# ...at most this many seconds after the first one was queued
+STORE_ORDER_EVENTS_BATCH_INTERVAL = 1
+
+# How long a delivered order id is remembered to drop redelivered tasks
+STORE_ORDER_EVENTS_DEDUP_TIMEOUT = 24 * 60 * 60
+
+# "database" keeps carts as Cart/CartItem rows, "redis" as hashes in the
+# default cache's redis until checkout
+STORE_CART_BACKEND = "database"
+
+# Carts are purged (or expire in redis) after this long without activity...
+STORE_CART_TTL = timedelta(days=30)
+
+# ...or this long after being created if they never got an item
+STORE_EMPTY_CART_TTL = timedelta(days=1)
+
+# The purge deletes this many carts per transaction, sleeping
+# STORE_CART_PURGE_PAUSE seconds in between and stopping after
+# STORE_CART_PURGE_MAX_CHUNKS chunks (None for no limit)
+STORE_CART_PURGE_CHUNK_SIZE = 1000
+STORE_CART_PURGE_PAUSE = 0.1
+STORE_CART_PURGE_MAX_CHUNKS = 100
+
+# Rows read per query by the streaming CSV/NDJSON exports
+STORE_EXPORT_CHUNK_SIZE = 2000
+
+# Serve product, collection and cart reads from store.async_views under
+# ASGI. Off by default: they lost to the sync views in the load run of
+# locustfiles/browse_catalog.py, so only turn this on once it has been
+# measured on the production stack. The requests they answer are anonymous,
+# and throttled as such.
+STORE_ASYNC_READS = os.getenv("STORE_ASYNC_READS", "0") == "1"
+
+# Query count and timing histograms per API route (see store.middleware),
+# recorded for this fraction of requests and written every
+# STORE_METRICS_FLUSH_INTERVAL seconds to "log" or "redis" (the default
+# cache's redis)
+STORE_METRICS_ENABLED = True
+STORE_METRICS_SAMPLE_RATE = 1.0
+STORE_METRICS_FLUSH_INTERVAL = 60
+STORE_METRICS_BACKEND = "log"
+
+# Warn about requests running the same statement at least this many times
+STORE_METRICS_N_PLUS_ONE_THRESHOLD = 5
+
+# Outbound HTTP (core.http): (connect, read) timeouts in seconds, retries of
+# failed connects and connections kept open per host
+HTTP_CLIENT_TIMEOUT = (3.05, 5)
+HTTP_CLIENT_RETRIES = 2
+HTTP_CLIENT_POOL_SIZE = 10
+
+# What playground's Index view fetches, fresh for PLAYGROUND_UPSTREAM_FRESH
+# seconds and then served stale for up to PLAYGROUND_UPSTREAM_STALE more
+# while it is fetched again in the background
+PLAYGROUND_UPSTREAM_URL = os.getenv("PLAYGROUND_UPSTREAM_URL", "https://httpbin.org/delay/2")
+PLAYGROUND_UPSTREAM_FRESH = 10 * 60
+PLAYGROUND_UPSTREAM_STALE = 60 * 60
+
 AUTH_USER_MODEL = "core.User"
 
 SIMPLE_JWT = {
@@ -172,6 +261,18 @@ CELERY_BEAT_SCHEDULE = {
         "args": [],
         "kwargs": {}
 
+    },
+    "purge_expired_carts": {
+        "task": "store.tasks.purge_expired_carts_task",
+        "schedule": 60 * 60,
+        "args": [],
+        "kwargs": {}
+    },
+    "update_sales_rollups": {
+        "task": "store.tasks.update_sales_rollups",
+        "schedule": 5 * 60,
+        "args": [],
+        "kwargs": {}
     }
 }
 
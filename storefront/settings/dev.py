@@ -24,3 +24,7 @@ CACHES = {
         }
     }
 }
+
+# A redis outage should degrade to cache misses, not failed requests
+DJANGO_REDIS_IGNORE_EXCEPTIONS = True
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
@@ -10,10 +10,30 @@ SECRET_KEY = os.getenv("SECRET_KEY")
 ALLOWED_HOSTS = [os.getenv("ALLOWED_HOST")]
 
 
+# Keep connections open for DB_CONN_MAX_AGE seconds instead of connecting
+# on every request, checking they still work before reusing them
 DATABASES = {
-    'default': dj_database_url.config()
+    'default': dj_database_url.config(
+        conn_max_age=int(os.getenv("DB_CONN_MAX_AGE", "60")),
+        conn_health_checks=os.getenv("DB_CONN_HEALTH_CHECKS", "1") == "1",
+    )
 }
 
+# DB_POOL=1 shares a pool of connections between the threads of a process
+# (see core.db.pool) instead of every thread keeping its own
+if os.getenv("DB_POOL") == "1":
+    DATABASES["default"].update({
+        "ENGINE": DATABASES["default"]["ENGINE"].replace("django.db.backends.", "core.db.backends.", 1),
+        # Hand the connection back to the pool at the end of every request
+        "CONN_MAX_AGE": 0,
+        "POOL": {
+            "SIZE": int(os.getenv("DB_POOL_SIZE", "10")),
+            "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", "5")),
+            "HEALTH_CHECK_INTERVAL": float(os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "30")),
+            "MAX_LIFETIME": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+        },
+    })
+
 
 REDIS_URL = os.getenv("REDIS_URL")
 
@@ -28,3 +48,9 @@ CACHES = {
         }
     }
 }
+
+# A redis outage should degrade to cache misses, not failed requests
+DJANGO_REDIS_IGNORE_EXCEPTIONS = True
+DJANGO_REDIS_LOG_IGNORED_EXCEPTIONS = True
+
+STORE_METRICS_BACKEND = "redis"